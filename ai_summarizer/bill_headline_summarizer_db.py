@@ -5,13 +5,16 @@ bill_headline_summarizer_db.py (Gemini 버전 - DB 연동)
 DB에 저장된 의안들을 50개씩 배치로 처리하여 AI 요약 생성
 - 가장 오래된 것부터 처리 (2025-01-01부터)
 - 이미 처리된 의안은 건너뜀 (summary IS NOT NULL)
-- 무료 API 제한을 고려하여 2.5초 sleep 유지
+- 등록된 API 키 전부를 동시에 사용 (키별 RPM/TPM/RPD 예산, 429 시 해당 키만 백오프, worker_pool.py)
+- 의안은 summary_claims로 점유한 뒤 처리하므로 여러 호스트에서 동시에 실행해도 중복 호출 없음
 """
 
 import argparse
+import glob
 import json
 import os
 import re
+import socket
 import sys
 
 # Windows 환경에서 한글 출력을 위한 인코딩 설정
@@ -19,17 +22,31 @@ if sys.platform == 'win32':
     import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+import threading
 import time
-import random
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
+
+try:
+    import fcntl  # 저널 파일 잠금 (POSIX)
+except ImportError:
+    fcntl = None
+    import msvcrt  # Windows
+
+# 프로젝트 루트의 공용 모듈 (cache_backend)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cache_backend import publish_invalidation
+from summary_cache import DEFAULT_MAX_ROWS, DEFAULT_TTL_DAYS, SummaryCache, prompt_version
+from worker_pool import GeminiWorkerPool, KeyBudget, is_rate_limit_error
 
 # Google Generative AI는 선택적 import (필요할 때만)
 try:
     import google.generativeai as genai
+    from google.ai import generativelanguage as glm
+    from google.api_core.client_options import ClientOptions
     HAS_GENAI = True
 except ImportError:
     HAS_GENAI = False
@@ -154,6 +171,33 @@ SYSTEM_GUIDE = """
 - 형식 오류, 여분 텍스트, 주석, 설명을 절대 출력하지 않는다.
 """
 
+# 묶음 요청(--prompt-batch)용 추가 지시: 여러 의안을 한 요청으로 보내고 JSON 배열로 받음
+BATCH_GUIDE = """
+[묶음 입력 처리]
+- 이 항목은 위 [출력 형식]과 [최종 지시]의 'JSON 객체 하나' 규칙보다 우선한다.
+- 입력에는 여러 의안이 id와 함께 주어진다. 각 의안을 서로 독립적으로, 위 모든 규칙에 따라 처리한다.
+- 출력은 JSON 배열 하나이며, 입력 순서대로 의안마다 객체를 하나씩 넣는다.
+- 각 객체 구조:
+  {"id":"입력의 id 그대로","headline":"...","summary":"...","categories":["..."],"vote":{"for":{"...":1}, "against":{"...":1}}}
+- 의안을 빠뜨리거나 합치지 않는다. 배열 밖 텍스트 금지.
+"""
+
+_VOTE_SCHEMA = {"type": "OBJECT", "properties": {axis: {"type": "INTEGER"} for axis in "PMUTNSOR"}}
+BATCH_RESPONSE_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "id": {"type": "STRING"},
+            "headline": {"type": "STRING"},
+            "summary": {"type": "STRING"},
+            "categories": {"type": "ARRAY", "items": {"type": "STRING"}},
+            "vote": {"type": "OBJECT", "properties": {"for": _VOTE_SCHEMA, "against": _VOTE_SCHEMA}},
+        },
+        "required": ["id", "headline", "summary", "categories", "vote"],
+    },
+}
+
 @dataclass
 class RowResult:
     bill_id: str
@@ -166,6 +210,22 @@ class RowResult:
     vote_against: Dict[str, int]
     success: bool = False
     error: Optional[str] = None
+    retry_single: bool = False  # 묶음 응답은 받았지만 이 항목만 빠졌거나 잘못됨 (단건 요청으로 다시 시도)
+
+def result_from_cache(bill: Dict, entry: Dict) -> RowResult:
+    """캐시 항목 → 해당 의안의 RowResult"""
+    return RowResult(
+        bill_id=bill['bill_id'],
+        title=bill['title'] or "",
+        body=bill['body'] or "",
+        headline=entry['headline'],
+        summary=entry['summary'],
+        categories=entry['categories'],
+        vote_for=entry['vote_for'],
+        vote_against=entry['vote_against'],
+        success=True,
+        error=None
+    )
 
 # ---------- DB 연결 ----------
 
@@ -204,13 +264,22 @@ def get_db_config():
             'port': int(os.environ.get('DB_PORT', '5432'))
         }
 
+# 저장 전 결과 저널 (SummaryWriter, 중단 후 재실행 시 복구)
+# 실제 파일은 프로세스(점유 소유자)마다 따로: .summary_journal.<호스트>-<pid>.jsonl
+DEFAULT_JOURNAL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.summary_journal.jsonl')
+
 def get_db_connection():
     config = get_db_config()
     return psycopg2.connect(**config)
 
-def fetch_unprocessed_bills(limit: int = 50, start_date: str = '2025-01-01') -> List[Dict]:
-    """처리되지 않은 의안들을 가져옴 (의안번호 순서대로, 가장 오래된 것부터)"""
-    conn = get_db_connection()
+def fetch_unprocessed_bills(limit: int = 50, start_date: str = '2025-01-01', conn=None) -> List[Dict]:
+    """처리되지 않은 의안들을 가져옴 (의안번호 순서대로, 가장 오래된 것부터)
+    
+    conn을 넘기면 그 연결을 사용 (SummaryWriter의 연결 재사용), 없으면 새로 연결
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
     cur = conn.cursor(cursor_factory=RealDictCursor)
     
     try:
@@ -221,85 +290,326 @@ def fetch_unprocessed_bills(limit: int = 50, start_date: str = '2025-01-01') ->
               AND proposal_date >= %s
               AND (summary_raw IS NOT NULL AND summary_raw != '')
               AND bill_no IS NOT NULL
-            ORDER BY 
-                CASE 
-                    WHEN bill_no ~ '^ZZ[0-9]+$' THEN CAST(SUBSTRING(bill_no FROM '([0-9]+)') AS INTEGER) - 1000000000
-                    WHEN bill_no ~ '^[0-9]+$' THEN CAST(bill_no AS INTEGER)
-                    WHEN bill_no ~ '^제[0-9]+호$' THEN CAST(SUBSTRING(bill_no FROM '([0-9]+)') AS INTEGER)
-                    ELSE 999999999
-                END ASC,
-                proposal_date ASC,
-                bill_id ASC
+            ORDER BY bill_no_sort ASC, proposal_date ASC, bill_id ASC
             LIMIT %s
         """
         cur.execute(query, (start_date, limit))
         rows = cur.fetchall()
+        if not own_conn:
+            conn.commit()  # 읽기 트랜잭션 종료 (장시간 열린 트랜잭션 방지)
         return [dict(row) for row in rows]
     finally:
         cur.close()
-        conn.close()
+        if own_conn:
+            conn.close()
+
+# 요약 작업 점유 (summary_claims): 여러 프로세스/호스트가 같은 의안을 중복 호출하지 않도록
+CLAIM_OWNER = f"{socket.gethostname()}:{os.getpid()}"
+DEFAULT_LEASE_MINUTES = 30
 
-def update_bill_summary(bill_id: str, headline: str, summary: str, 
-                       categories: List[str], vote_for: Dict[str, int], 
-                       vote_against: Dict[str, int]):
-    """의안의 AI 요약 결과를 DB에 업데이트"""
-    conn = get_db_connection()
-    cur = conn.cursor()
+def claim_unprocessed_bills(conn, limit: int = 50, start_date: str = '2025-01-01',
+                            lease_seconds: int = DEFAULT_LEASE_MINUTES * 60,
+                            owner: str = CLAIM_OWNER) -> List[Dict]:
+    """처리되지 않은 의안을 점유하고 가져옴 (fetch_unprocessed_bills와 같은 순서)
     
-    try:
-        # headline 컬럼이 있는지 확인
+    - 다른 프로세스가 점유 중(lease_until 이전)인 의안은 건너뜀
+    - 후보 행은 FOR UPDATE SKIP LOCKED로 잠가서 동시에 점유하는 프로세스끼리 기다리지 않고 서로 다른 의안을 가져감
+    - 점유 INSERT는 만료된 점유만 덮어쓰므로 경합 중에도 한 의안은 한 프로세스만 가져감
+    """
+    with conn.cursor(cursor_factory=RealDictCursor) as cur:
         cur.execute("""
-            SELECT column_name 
-            FROM information_schema.columns 
-            WHERE table_name = 'bills' AND column_name = 'headline'
-        """)
-        has_headline = cur.fetchone() is not None
-        
-        if has_headline:
-            # headline 컬럼이 있으면 별도 저장
-            query = """
-                UPDATE bills
-                SET headline = %s,
-                    summary = %s,
-                    categories = %s::jsonb,
-                    vote_for = %s::jsonb,
-                    vote_against = %s::jsonb,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE bill_id = %s
-            """
-            categories_json = json.dumps(categories, ensure_ascii=False)
-            vote_for_json = json.dumps(vote_for, ensure_ascii=False)
-            vote_against_json = json.dumps(vote_against, ensure_ascii=False)
-            
-            cur.execute(query, (headline, summary, categories_json, vote_for_json, vote_against_json, bill_id))
+            WITH candidates AS (
+                SELECT b.bill_id
+                FROM bills b
+                LEFT JOIN summary_claims c ON c.bill_id = b.bill_id
+                WHERE (b.summary IS NULL OR b.summary = '')
+                  AND b.proposal_date >= %(start_date)s
+                  AND (b.summary_raw IS NOT NULL AND b.summary_raw != '')
+                  AND b.bill_no IS NOT NULL
+                  AND (c.lease_until IS NULL OR c.lease_until < CURRENT_TIMESTAMP)
+                ORDER BY b.bill_no_sort ASC, b.proposal_date ASC, b.bill_id ASC
+                LIMIT %(limit)s
+                FOR UPDATE OF b SKIP LOCKED
+            ), claimed AS (
+                INSERT INTO summary_claims (bill_id, owner, lease_until, claimed_at)
+                SELECT bill_id, %(owner)s, CURRENT_TIMESTAMP + make_interval(secs => %(lease)s), CURRENT_TIMESTAMP
+                FROM candidates
+                ON CONFLICT (bill_id) DO UPDATE SET
+                    owner = EXCLUDED.owner,
+                    lease_until = EXCLUDED.lease_until,
+                    claimed_at = EXCLUDED.claimed_at
+                WHERE summary_claims.lease_until < CURRENT_TIMESTAMP
+                RETURNING bill_id
+            )
+            SELECT b.bill_id, b.title, b.summary_raw AS body
+            FROM bills b
+            JOIN claimed USING (bill_id)
+            ORDER BY b.bill_no_sort ASC, b.proposal_date ASC, b.bill_id ASC
+        """, {'start_date': start_date, 'limit': limit, 'owner': owner, 'lease': lease_seconds})
+        rows = cur.fetchall()
+    conn.commit()  # 점유는 바로 커밋 (API 호출 동안 트랜잭션/행 잠금을 유지하지 않음)
+    return [dict(row) for row in rows]
+
+def release_claims(conn, bill_ids: List[str], owner: str = CLAIM_OWNER) -> int:
+    """호출하지 못한 의안의 점유 해제 (다른 프로세스가 바로 가져갈 수 있도록)"""
+    if not bill_ids:
+        return 0
+    with conn.cursor() as cur:
+        cur.execute("DELETE FROM summary_claims WHERE owner = %s AND bill_id = ANY(%s)", (owner, list(bill_ids)))
+        released = cur.rowcount
+    conn.commit()
+    return released
+
+def journal_path_for(base_path: str, owner: str = CLAIM_OWNER) -> str:
+    """점유 소유자별 저널 파일 경로 (base_path가 'x.jsonl'이면 'x.<호스트>-<pid>.jsonl')"""
+    root, ext = os.path.splitext(base_path)
+    return f"{root}.{re.sub(r'[^A-Za-z0-9_.-]', '-', owner)}{ext or '.jsonl'}"
+
+def try_lock_journal(f) -> bool:
+    """저널 파일 배타 잠금 (다른 프로세스가 잡고 있으면 False). 프로세스가 죽으면 OS가 잠금을 풀어 줌"""
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
         else:
-            # headline 컬럼이 없으면 summary에 포함 (headline + "\n\n" + summary)
-            full_summary = f"{headline}\n\n{summary}" if headline else summary
-            query = """
-                UPDATE bills
-                SET summary = %s,
-                    categories = %s::jsonb,
-                    vote_for = %s::jsonb,
-                    vote_against = %s::jsonb,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE bill_id = %s
-            """
-            categories_json = json.dumps(categories, ensure_ascii=False)
-            vote_for_json = json.dumps(vote_for, ensure_ascii=False)
-            vote_against_json = json.dumps(vote_against, ensure_ascii=False)
-            
-            cur.execute(query, (full_summary, categories_json, vote_for_json, vote_against_json, bill_id))
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+# 비어 있는 남의 저널은 이 시간이 지나야 지움 (막 만들어 아직 잠그기 전인 파일을 지우지 않도록)
+STALE_EMPTY_JOURNAL_SECONDS = 60
+
+class SummaryWriter:
+    """AI 요약 결과 저장 전담 (메인 스레드의 단일 writer)
+    
+    - 연결 하나를 실행 내내 재사용하고, headline 컬럼 유무는 시작할 때 한 번만 확인
+    - 결과를 모아 batch_size건마다 (또는 flush_interval초마다) UPDATE ... FROM (VALUES ...) 한 번으로 저장
+      (같은 트랜잭션에서 해당 의안의 점유(summary_claims)도 삭제)
+    - 저장 전 결과는 저널 파일(JSON Lines)에 먼저 기록: 중간에 프로세스가 죽어도
+      다음 실행 시작 시 저널을 다시 적용하므로 이미 받은 API 응답을 잃지 않음
+    - 저널은 소유자(owner)마다 따로 두고 실행 내내 배타 잠금을 잡음. 시작할 때는 잠글 수 있는 저널
+      (소유 프로세스가 끝난 것)만 다시 적용하므로 여러 프로세스를 동시에 실행해도 서로의 저널을 건드리지 않음
+    """
+    
+    def __init__(self, batch_size: int = 10, flush_interval: float = 5.0, journal_path: Optional[str] = None,
+                 owner: str = CLAIM_OWNER):
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.journal_base = journal_path
+        self.journal_path = journal_path_for(journal_path, owner) if journal_path else None
+        self.conn = get_db_connection()
+        self.has_headline = self._detect_headline_column()
+        self.pending: List[tuple] = []
+        self.last_flush = time.time()
+        self.total_written = 0
+        self.flushes = 0
+        self.write_time = 0.0
+        self._journal = None
+        if journal_path:
+            recovered = self._replay_journals()
+            if recovered:
+                print(f"[복구] 이전 실행에서 저장하지 못한 결과 {recovered}건을 저널에서 복구했습니다.")
+            self._journal = open(self.journal_path, 'a', encoding='utf-8')
+            if not try_lock_journal(self._journal):
+                self._journal.close()
+                self._journal = None
+                raise RuntimeError(f"저널 파일을 다른 프로세스가 사용 중입니다: {self.journal_path}")
+    
+    def _detect_headline_column(self) -> bool:
+        with self.conn.cursor() as cur:
+            cur.execute("""
+                SELECT 1
+                FROM information_schema.columns 
+                WHERE table_name = 'bills' AND column_name = 'headline'
+            """)
+            has_headline = cur.fetchone() is not None
+        self.conn.commit()
+        return has_headline
+    
+    @staticmethod
+    def _row(result: RowResult) -> tuple:
+        return (
+            result.bill_id,
+            result.headline,
+            result.summary,
+            json.dumps(result.categories, ensure_ascii=False),
+            json.dumps(result.vote_for, ensure_ascii=False),
+            json.dumps(result.vote_against, ensure_ascii=False),
+        )
+    
+    def _replay_journals(self) -> int:
+        """끝난 프로세스들의 저널에 남은 결과(커밋되지 않았을 수 있는 것)를 다시 저장
         
-        conn.commit()
-    except Exception as e:
-        conn.rollback()
-        raise e
-    finally:
-        cur.close()
-        conn.close()
+        같은 결과를 두 번 적용해도 UPDATE 값이 같으므로 안전하다.
+        """
+        root, ext = os.path.splitext(self.journal_base)
+        paths = sorted(set(glob.glob(glob.escape(root) + '.*' + (ext or '.jsonl'))) | {self.journal_base})
+        recovered = 0
+        for path in paths:
+            try:
+                f = open(path, 'r+', encoding='utf-8')
+            except FileNotFoundError:
+                continue
+            with f:
+                if not try_lock_journal(f):
+                    continue  # 실행 중인 다른 프로세스의 저널
+                f.seek(0)
+                rows = []
+                for line in f:
+                    try:
+                        rows.append(tuple(json.loads(line)))
+                    except ValueError:
+                        continue  # 기록 중 끊긴 마지막 줄
+                if rows:
+                    self._write(rows)
+                    recovered += len(rows)
+                elif path != self.journal_path and time.time() - os.path.getmtime(path) < STALE_EMPTY_JOURNAL_SECONDS:
+                    continue  # 막 시작한 프로세스가 아직 잠그지 않은 새 저널일 수 있음
+                if fcntl is not None:
+                    os.remove(path)  # 잠금을 잡은 채로 삭제
+            if fcntl is None and os.path.exists(path):
+                os.remove(path)  # Windows는 열린 파일을 지울 수 없음
+        return recovered
+    
+    def _write(self, rows: List[tuple]):
+        # 같은 의안이 여러 번 있으면 마지막 결과만 (UPDATE ... FROM은 한 행을 두 번 갱신하지 않음)
+        rows = list({row[0]: row for row in rows}.values())
+        started = time.time()
+        with self.conn.cursor() as cur:
+            if self.has_headline:
+                execute_values(cur, """
+                    UPDATE bills AS b
+                    SET headline = v.headline,
+                        summary = v.summary,
+                        categories = v.categories::jsonb,
+                        vote_for = v.vote_for::jsonb,
+                        vote_against = v.vote_against::jsonb,
+                        updated_at = CURRENT_TIMESTAMP
+                    FROM (VALUES %s) AS v(bill_id, headline, summary, categories, vote_for, vote_against)
+                    WHERE b.bill_id = v.bill_id
+                """, rows)
+            else:
+                # headline 컬럼이 없으면 summary에 포함 (headline + "\n\n" + summary)
+                rows = [
+                    (bill_id, f"{headline}\n\n{summary}" if headline else summary, categories, vote_for, vote_against)
+                    for bill_id, headline, summary, categories, vote_for, vote_against in rows
+                ]
+                execute_values(cur, """
+                    UPDATE bills AS b
+                    SET summary = v.summary,
+                        categories = v.categories::jsonb,
+                        vote_for = v.vote_for::jsonb,
+                        vote_against = v.vote_against::jsonb,
+                        updated_at = CURRENT_TIMESTAMP
+                    FROM (VALUES %s) AS v(bill_id, summary, categories, vote_for, vote_against)
+                    WHERE b.bill_id = v.bill_id
+                """, rows)
+            cur.execute("DELETE FROM summary_claims WHERE bill_id = ANY(%s)", ([row[0] for row in rows],))
+        self.conn.commit()
+        self.write_time += time.time() - started
+    
+    def add(self, result: RowResult):
+        """결과 추가 (저널에 먼저 기록, 모이면 저장)"""
+        row = self._row(result)
+        if self._journal is not None:
+            self._journal.write(json.dumps(row, ensure_ascii=False) + "\n")
+            self._journal.flush()
+        self.pending.append(row)
+        if len(self.pending) >= self.batch_size or time.time() - self.last_flush >= self.flush_interval:
+            self.flush()
+    
+    def flush(self) -> int:
+        """모인 결과 저장. 저장한 건수 반환 (실패 시 예외, 결과와 저널은 유지되어 다음 flush에서 재시도)"""
+        self.last_flush = time.time()
+        if not self.pending:
+            return 0
+        try:
+            self._write(self.pending)
+        except psycopg2.Error:
+            self.conn.rollback()
+            raise
+        written = len(self.pending)
+        self.pending = []
+        self.total_written += written
+        self.flushes += 1
+        if self._journal is not None:
+            self._journal.truncate(0)  # 저널 내용은 모두 커밋됨
+            self._journal.seek(0)
+        return written
+    
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            if self._journal is not None:
+                if not self.pending and fcntl is not None:
+                    os.remove(self.journal_path)  # 잠금을 잡은 채로 삭제
+                self._journal.close()
+                if not self.pending and fcntl is None:
+                    os.remove(self.journal_path)
+            self.conn.close()
 
 # ---------- Gemini 호출부 ----------
 
+# 키별 기본 속도 예산 (무료 등급 gemini-2.5-flash 기준, 환경 변수 또는 --rpm/--tpm/--rpd로 조정)
+DEFAULT_RPM = int(os.environ.get("GEMINI_RPM", 10))
+DEFAULT_TPM = int(os.environ.get("GEMINI_TPM", 250000))
+DEFAULT_RPD = int(os.environ.get("GEMINI_RPD", 250))
+# 응답(JSON) 토큰 예상치
+EXPECTED_OUTPUT_TOKENS = 400
+
+_models: Dict[tuple, Any] = {}
+_models_lock = threading.Lock()
+
+def bind_api_key_client(model, api_key: str):
+    """model이 api_key 전용 클라이언트로 호출하도록 설정 (여러 키 동시 사용)
+    
+    google-generativeai는 키를 전역 설정(genai.configure)으로만 받고 GenerativeModel에 클라이언트를 넘기는
+    공개 옵션이 없다. 클라이언트는 공개 API(GenerativeServiceClient + ClientOptions(api_key))로 직접 만들고,
+    라이브러리 내부 속성(_client)에 넣는 부분은 이 함수 한 곳에만 둔다.
+    라이브러리 구조가 바뀌어 _client가 없으면 전역 키로 조용히 호출하지 않도록 바로 오류
+    (tests/test_gemini_client.py가 설치된 라이브러리에서 이 가정을 확인).
+    """
+    if not hasattr(model, "_client"):
+        raise RuntimeError("google-generativeai의 GenerativeModel에 _client가 없습니다. "
+                           "키별 클라이언트 설정(bind_api_key_client)을 라이브러리 버전에 맞게 수정해야 합니다.")
+    model._client = glm.GenerativeServiceClient(client_options=ClientOptions(api_key=api_key))
+    return model
+
+def get_gemini_model(model_name: str, api_key: str, batch: bool = False):
+    """API 키별 GenerativeModel (키마다 한 번만 생성)
+    
+    전역 genai.configure 대신 모델마다 해당 키의 클라이언트를 붙여 두므로 여러 키를 동시에 쓸 수 있다.
+    batch=True면 묶음 요청용 (BATCH_GUIDE 추가, JSON 배열 응답 스키마)
+    """
+    key = (model_name, api_key, batch)
+    with _models_lock:
+        model = _models.get(key)
+        if model is None:
+            generation_config = {
+                "temperature": 0.3,
+                "response_mime_type": "application/json",
+            }
+            if batch:
+                generation_config["response_schema"] = BATCH_RESPONSE_SCHEMA
+            model = genai.GenerativeModel(
+                model_name=model_name,
+                generation_config=generation_config,
+                system_instruction=SYSTEM_GUIDE + BATCH_GUIDE if batch else SYSTEM_GUIDE
+            )
+            _models[key] = bind_api_key_client(model, api_key)
+        return model
+
+def estimate_tokens(title: str, body: str) -> int:
+    """요청 1건의 토큰 예상치 (한국어는 대략 2자당 1토큰, TPM 예산 차감용)"""
+    return (len(SYSTEM_GUIDE) + len(title) + len(body)) // 2 + EXPECTED_OUTPUT_TOKENS
+
+def estimate_batch_tokens(bills: List[Dict]) -> int:
+    """묶음 요청 1건의 토큰 예상치 (시스템 프롬프트는 한 번만)"""
+    text_length = sum(len(bill['title'] or "") + len(bill['body'] or "") for bill in bills)
+    return (len(SYSTEM_GUIDE) + len(BATCH_GUIDE) + text_length) // 2 + EXPECTED_OUTPUT_TOKENS * len(bills)
+
 def build_user_prompt(title: str, body: str) -> str:
     return (
         "[입력]\n"
@@ -308,6 +618,16 @@ def build_user_prompt(title: str, body: str) -> str:
         "\n오직 하나의 JSON 객체만 출력."
     )
 
+def build_batch_prompt(bills: List[Dict]) -> str:
+    """묶음 요청 입력 (id는 1부터, 응답 항목을 의안에 다시 맞추는 데 사용)"""
+    lines = ["[입력]"]
+    for i, bill in enumerate(bills, 1):
+        lines.append(f"- id: {i}")
+        lines.append(f"  제목: {bill['title'] or ''}")
+        lines.append(f"  본문: {bill['body'] or ''}")
+    lines.append(f"\n의안 {len(bills)}개의 JSON 객체를 id 순서대로 담은 JSON 배열 하나만 출력.")
+    return "\n".join(lines)
+
 def safe_json_parse(text: str) -> Dict[str, Any]:
     text = (text or "").strip()
     m = re.search(r"\{.*\}\s*$", text, flags=re.DOTALL)
@@ -318,6 +638,18 @@ def safe_json_parse(text: str) -> Dict[str, Any]:
     except Exception:
         return {"headline": "", "summary": "", "categories": []}
 
+def safe_json_parse_array(text: str) -> List[Any]:
+    """묶음 응답 파싱 (배열이 아니거나 깨졌으면 빈 목록, 각 항목 검증은 호출한 쪽에서)"""
+    text = (text or "").strip()
+    m = re.search(r"\[.*\]", text, flags=re.DOTALL)  # 코드블록(```json) 등으로 감싼 경우
+    if m:
+        text = m.group(0)
+    try:
+        data = json.loads(text)
+    except Exception:
+        return []
+    return data if isinstance(data, list) else []
+
 def _ensure_dict_i(d: Any) -> Dict[str, int]:
     out: Dict[str, int] = {}
     if isinstance(d, dict):
@@ -330,20 +662,67 @@ def _ensure_dict_i(d: Any) -> Dict[str, int]:
                 out[k] = iv
     return out
 
+def failed_result(title: str, body: str, error: str, headline: str = "", summary: str = "") -> RowResult:
+    return RowResult(
+        bill_id="",
+        title=title,
+        body=body,
+        headline=headline,
+        summary=summary,
+        categories=[],
+        vote_for={},
+        vote_against={},
+        success=False,
+        error=error
+    )
+
+def result_from_data(title: str, body: str, data: Dict[str, Any]) -> RowResult:
+    """모델 응답 객체 하나 → RowResult (headline/summary 필수, categories/vote 정리)"""
+    headline = (data.get("headline") or "").strip()
+    summary = (data.get("summary") or "").strip()
+
+    if not headline or not summary:
+        return failed_result(title, body, "headline 또는 summary가 비어있음", headline=headline, summary=summary)
+
+    cats = data.get("categories") or []
+    if isinstance(cats, str):
+        try:
+            obj = json.loads(cats)
+            cats = obj if isinstance(obj, list) else [str(obj)]
+        except Exception:
+            cats = [cats]
+
+    vote = data.get("vote") or {}
+    if not isinstance(vote, dict):
+        vote = {}
+    v_for = _ensure_dict_i(vote.get("for", {}))
+    v_again = _ensure_dict_i(vote.get("against", {}))
+
+    return RowResult(
+        bill_id="",
+        title=title,
+        body=body,
+        headline=headline,
+        summary=summary,
+        categories=cats,
+        vote_for=v_for,
+        vote_against=v_again,
+        success=True,
+        error=None
+    )
+
+def response_text(resp) -> str:
+    try:
+        return resp.text or ""
+    except Exception:
+        try:
+            return resp.candidates[0].content.parts[0].text
+        except Exception:
+            return ""
+
 def call_model_gemini(model_name: str, title: str, body: str, timeout: int = 60, api_key: str = None) -> RowResult:
     if not HAS_GENAI:
-        return RowResult(
-            bill_id="",
-            title=title,
-            body=body,
-            headline="",
-            summary="",
-            categories=[],
-            vote_for={},
-            vote_against={},
-            success=False,
-            error="google.generativeai 모듈이 설치되지 않았습니다. 'pip install google-generativeai' 실행 필요"
-        )
+        return failed_result(title, body, "google.generativeai 모듈이 설치되지 않았습니다. 'pip install google-generativeai' 실행 필요")
 
     if not api_key:
         api_key = os.environ.get("GEMINI_API_KEY")
@@ -352,148 +731,119 @@ def call_model_gemini(model_name: str, title: str, body: str, timeout: int = 60,
         raise ValueError("환경변수 GEMINI_API_KEY가 필요합니다.")
 
     try:
-        genai.configure(api_key=api_key)
-
-        generation_config = {
-            "temperature": 0.3,
-            "response_mime_type": "application/json",
-        }
-
-        model = genai.GenerativeModel(
-            model_name=model_name,
-            generation_config=generation_config,
-            system_instruction=SYSTEM_GUIDE
-        )
+        model = get_gemini_model(model_name, api_key)
 
         user_prompt = build_user_prompt(title, body)
         resp = model.generate_content(user_prompt, request_options={"timeout": timeout})
 
-        content_text = ""
-        try:
-            content_text = resp.text or ""
-        except Exception:
-            try:
-                content_text = resp.candidates[0].content.parts[0].text
-            except Exception:
-                content_text = ""
-
+        content_text = response_text(resp)
         if not content_text:
-            return RowResult(
-                bill_id="",
-                title=title,
-                body=body,
-                headline="",
-                summary="",
-                categories=[],
-                vote_for={},
-                vote_against={},
-                success=False,
-                error="응답이 비어있음"
-            )
-
-        data = safe_json_parse(content_text)
-
-        headline = (data.get("headline") or "").strip()
-        summary = (data.get("summary") or "").strip()
-
-        if not headline or not summary:
-            return RowResult(
-                bill_id="",
-                title=title,
-                body=body,
-                headline=headline,
-                summary=summary,
-                categories=[],
-                vote_for={},
-                vote_against={},
-                success=False,
-                error="headline 또는 summary가 비어있음"
-            )
+            return failed_result(title, body, "응답이 비어있음")
 
-        cats = data.get("categories") or []
-        if isinstance(cats, str):
-            try:
-                obj = json.loads(cats)
-                cats = obj if isinstance(obj, list) else [str(obj)]
-            except Exception:
-                cats = [cats]
-
-        vote = data.get("vote") or {}
-        v_for = _ensure_dict_i(vote.get("for", {}))
-        v_again = _ensure_dict_i(vote.get("against", {}))
-
-        return RowResult(
-            bill_id="",
-            title=title,
-            body=body,
-            headline=headline,
-            summary=summary,
-            categories=cats,
-            vote_for=v_for,
-            vote_against=v_again,
-            success=True,
-            error=None
-        )
+        return result_from_data(title, body, safe_json_parse(content_text))
     except Exception as e:
-        return RowResult(
-            bill_id="",
-            title=title,
-            body=body,
-            headline="",
-            summary="",
-            categories=[],
-            vote_for={},
-            vote_against={},
-            success=False,
-            error=str(e)
-        )
+        return failed_result(title, body, str(e))
+
+def call_model_gemini_batch(model_name: str, bills: List[Dict], timeout: int = 60, api_key: str = None) -> List[RowResult]:
+    """여러 의안을 한 요청으로 요약. bills 순서대로 RowResult 목록 반환 (bill_id 채움)
+    
+    응답 배열의 항목마다 call_model_gemini와 같은 검증을 하고, 빠졌거나 잘못된 항목은 retry_single=True인 실패로
+    돌려준다 (호출한 쪽에서 단건 요청으로 다시 시도). 요청 자체가 실패하면 모든 항목이 같은 error를 가진다.
+    """
+    titles = [(bill['title'] or "", bill['body'] or "") for bill in bills]
+    if not HAS_GENAI:
+        results = [failed_result(title, body, "google.generativeai 모듈이 설치되지 않았습니다.") for title, body in titles]
+    else:
+        try:
+            model = get_gemini_model(model_name, api_key or os.environ.get("GEMINI_API_KEY"), batch=True)
+            resp = model.generate_content(build_batch_prompt(bills), request_options={"timeout": timeout})
+            items = safe_json_parse_array(response_text(resp))
+            by_id: Dict[str, Dict[str, Any]] = {}
+            for item in items:
+                if isinstance(item, str):
+                    item = safe_json_parse(item)
+                if isinstance(item, dict):
+                    by_id.setdefault(str(item.get("id", "")).strip(), item)
+            results = [
+                result_from_data(title, body, by_id[str(i)]) if str(i) in by_id
+                else failed_result(title, body, "묶음 응답에 해당 의안 항목이 없음")
+                for i, (title, body) in enumerate(titles, 1)
+            ]
+            for result in results:
+                result.retry_single = not result.success
+        except Exception as e:
+            results = [failed_result(title, body, str(e)) for title, body in titles]
+    for bill, result in zip(bills, results):
+        result.bill_id = bill['bill_id']
+    return results
 
 # ---------- API 키 관리 ----------
 
-class APIKeyManager:
-    """여러 API 키를 순환 관리하는 클래스"""
-    def __init__(self, api_keys: List[str]):
-        self.api_keys = api_keys
-        self.current_index = 0
-        self.used_keys = set()  # 할당량 초과된 키 추적
-    
-    def get_current_key(self) -> str:
-        """현재 사용할 API 키 반환"""
-        if self.current_index >= len(self.api_keys):
-            return None
-        return self.api_keys[self.current_index]
-    
-    def switch_to_next_key(self) -> bool:
-        """다음 API 키로 전환. 더 이상 키가 없으면 False 반환"""
-        if self.current_index < len(self.api_keys):
-            self.used_keys.add(self.current_index)
-        
-        self.current_index += 1
-        
-        # 사용 가능한 키 찾기
-        while self.current_index < len(self.api_keys):
-            if self.current_index not in self.used_keys:
-                return True
-            self.current_index += 1
-        
-        return False
+def load_api_keys(arg_value: Optional[str] = None) -> List[str]:
+    """--api-keys 인자 또는 환경변수(GEMINI_API_KEY, GEMINI_API_KEY_1, _2, ...)에서 API 키 목록"""
+    if arg_value:
+        # 명령줄 인자에서 가져오기
+        return [key.strip() for key in arg_value.split(",") if key.strip()]
     
-    def has_more_keys(self) -> bool:
-        """사용 가능한 키가 더 있는지 확인"""
-        return self.current_index < len(self.api_keys)
+    # 환경변수에서 가져오기 (여러 개 가능: GEMINI_API_KEY_1, GEMINI_API_KEY_2, ...)
+    api_keys = []
+    i = 1
+    while True:
+        key = os.environ.get(f"GEMINI_API_KEY_{i}")
+        if not key:
+            break
+        api_keys.append(key)
+        i += 1
+    
+    # 기본 GEMINI_API_KEY도 추가
+    default_key = os.environ.get("GEMINI_API_KEY")
+    if default_key and default_key not in api_keys:
+        api_keys.insert(0, default_key)
+    return api_keys
+
+def build_worker_pool(model_name: str, api_keys: List[str], timeout: int = 60,
+                      rpm: int = DEFAULT_RPM, tpm: int = DEFAULT_TPM, rpd: int = DEFAULT_RPD,
+                      workers_per_key: int = 2) -> GeminiWorkerPool:
+    """API 키별 예산을 가진 동시 호출 풀 (배치가 바뀌어도 같은 풀을 사용해 예산 유지)"""
+    budgets = [KeyBudget(key, i, rpm=rpm, tpm=tpm, rpd=rpd) for i, key in enumerate(api_keys)]
+    
+    def call(bill: Dict, api_key: str) -> RowResult:
+        result = call_model_gemini(model_name, bill['title'] or "", bill['body'] or "",
+                                   timeout=timeout, api_key=api_key)
+        result.bill_id = bill['bill_id']
+        return result
     
-    def get_key_info(self) -> str:
-        """현재 키 정보 반환 (디버깅용)"""
-        if self.current_index < len(self.api_keys):
-            key_preview = self.api_keys[self.current_index][:20] + "..."
-            return f"API 키 {self.current_index + 1}/{len(self.api_keys)} ({key_preview})"
-        return "사용 가능한 API 키 없음"
+    return GeminiWorkerPool(
+        budgets, call,
+        estimate_tokens=lambda bill: estimate_tokens(bill['title'] or "", bill['body'] or ""),
+        workers_per_key=workers_per_key,
+    )
+
+def build_batch_pool(model_name: str, worker_pool: GeminiWorkerPool, timeout: int = 60) -> GeminiWorkerPool:
+    """묶음 요청용 풀 (worker_pool과 같은 키별 예산을 공유, 작업 단위는 의안 목록)"""
+    def call(bills: List[Dict], api_key: str) -> List[RowResult]:
+        return call_model_gemini_batch(model_name, bills, timeout=timeout, api_key=api_key)
+    
+    return GeminiWorkerPool(
+        worker_pool.budgets, call,
+        estimate_tokens=estimate_batch_tokens,
+        workers_per_key=worker_pool.workers_per_key,
+        result_error=lambda results: results[0].error if results and all(not r.success for r in results) else None,
+    )
 
 # ---------- 메인 처리 ----------
 
 def process_batch(model_name: str, batch_size: int = 50, start_date: str = '2025-01-01', 
-                 timeout: int = 60, base_sleep: float = 2.5, api_key_manager: APIKeyManager = None):
-    """의안 배치 처리
+                 worker_pool: GeminiWorkerPool = None, writer: SummaryWriter = None,
+                 cache: SummaryCache = None, lease_seconds: int = DEFAULT_LEASE_MINUTES * 60,
+                 batch_pool: GeminiWorkerPool = None, prompt_batch: int = 1):
+    """의안 배치 처리 (API 호출은 worker_pool의 작업 스레드, DB 저장은 writer가 이 스레드에서만)
+    
+    cache가 있으면 캐시에 있는 의안은 API 없이 채우고, 배치 안에서 내용이 같은 의안은 한 번만 호출
+    의안은 summary_claims로 점유하고 가져오므로 여러 프로세스를 동시에 실행해도 같은 의안을 중복 호출하지 않음
+    (실패한 의안은 점유 만료 후 다시 시도)
+    batch_pool이 있으면 prompt_batch개씩 묶어 한 요청으로 보내고, 성공한 응답에서 빠졌거나 잘못된 항목만 단건 요청으로 다시 시도
+    (요청 자체가 실패한 묶음은 실패로 세고, 429로 끝났거나 키 소진으로 보내지 못한 묶음은 점유를 풀어 다음 배치로 넘김)
     
     Returns:
         tuple: (success_count, error_count, quota_exceeded)
@@ -507,27 +857,33 @@ def process_batch(model_name: str, batch_size: int = 50, start_date: str = '2025
         print("해결: pip install google-generativeai", file=sys.stderr)
         sys.exit(2)
     
-    # API 키 관리자 초기화
-    if api_key_manager is None:
-        # 환경변수에서 API 키 가져오기
-        api_key = os.environ.get("GEMINI_API_KEY")
-        if not api_key:
+    if worker_pool is None:
+        api_keys = load_api_keys()
+        if not api_keys:
             print("환경변수 GEMINI_API_KEY가 필요합니다.", file=sys.stderr)
             sys.exit(2)
-        api_key_manager = APIKeyManager([api_key])
+        worker_pool = build_worker_pool(model_name, api_keys)
+    
+    own_writer = writer is None
+    if own_writer:
+        writer = SummaryWriter(journal_path=DEFAULT_JOURNAL_PATH)
     
     start_time = time.time()
+    active_keys = sum(1 for budget in worker_pool.budgets if not budget.exhausted)
     print(f"[시작] 배치 크기: {batch_size}, 시작 날짜: {start_date}")
-    print(f"[설정] 모델: {model_name}, Sleep: {base_sleep}초")
-    print(f"[API 키] {api_key_manager.get_key_info()}")
+    print(f"[설정] 모델: {model_name}, 키당 작업 스레드: {worker_pool.workers_per_key}")
+    print(f"[API 키] 사용 가능 {active_keys}/{len(worker_pool.budgets)}개")
     print("-" * 60)
     
-    # 처리되지 않은 의안 가져오기
+    # 처리되지 않은 의안 점유 후 가져오기
     print("처리되지 않은 의안 조회 중...", flush=True)
-    bills = fetch_unprocessed_bills(limit=batch_size, start_date=start_date)
+    bills = claim_unprocessed_bills(writer.conn, limit=batch_size, start_date=start_date,
+                                    lease_seconds=lease_seconds)
     
     if not bills:
         print("처리할 의안이 없습니다.")
+        if own_writer:
+            writer.close()
         return (0, 0, False)
     
     print(f"[발견] 처리할 의안: {len(bills)}개")
@@ -535,102 +891,126 @@ def process_batch(model_name: str, batch_size: int = 50, start_date: str = '2025
     
     success_count = 0
     error_count = 0
-    quota_exceeded = False
     
-    for idx, bill in enumerate(bills, 1):
-        bill_id = bill['bill_id']
-        title = bill['title'] or ""
-        body = bill['body'] or ""
-        
-        if not title and not body:
-            print(f"[{idx}/{len(bills)}] 건너뜀: {bill_id} (제목/본문 없음)")
-            continue
-        
-        print(f"\n[{idx}/{len(bills)}] 처리 중: {bill_id}")
-        print(f"  제목: {title[:50]}...")
-        print(f"  API 호출 중...", end='', flush=True)
-        
-        # 현재 API 키 가져오기
-        current_api_key = api_key_manager.get_current_key()
-        if not current_api_key:
-            quota_exceeded = True
-            print(f"  ⚠️ 사용 가능한 API 키가 없습니다.")
-            print(f"  [중단] 모든 API 키의 할당량이 소진되었습니다.")
-            break
-        
+    def save(prefix: str, result: RowResult):
+        # DB 저장은 writer가 모아서 한 번에 (저장 실패 시 결과는 writer와 저널에 남아 다음 flush에서 재시도)
         try:
-            result = call_model_gemini(model_name, title, body, timeout=timeout, api_key=current_api_key)
-            result.bill_id = bill_id
-            print(" 완료", flush=True)
-            
-            # API 할당량 초과 확인
-            if result.error and ("429" in result.error or "quota" in result.error.lower() or "exceeded" in result.error.lower()):
-                print(f"  ⚠️ API 할당량 초과: {result.error[:100]}...")
-                print(f"  [전환] 다음 API 키로 전환합니다...")
-                
-                # 다음 API 키로 전환
-                if api_key_manager.switch_to_next_key():
-                    new_key = api_key_manager.get_current_key()
-                    print(f"  ✓ 새 API 키로 전환: {api_key_manager.get_key_info()}")
-                    # 환경변수도 업데이트
-                    os.environ["GEMINI_API_KEY"] = new_key
-                    # 재시도하지 않고 다음 의안으로
-                    error_count += 1
-                    continue
-                else:
-                    quota_exceeded = True
-                    print(f"  [중단] 모든 API 키의 할당량이 소진되었습니다.")
-                    break
-            
-            if result.success and result.headline and result.summary:
-                # DB 업데이트
-                update_bill_summary(
-                    bill_id=result.bill_id,
-                    headline=result.headline,
-                    summary=result.summary,
-                    categories=result.categories,
-                    vote_for=result.vote_for,
-                    vote_against=result.vote_against
-                )
-                print(f"  ✓ 성공: {result.headline[:40]}...")
-                success_count += 1
+            writer.add(result)
+        except psycopg2.Error as e:
+            print(f"{prefix} ⚠️ DB 저장 지연: {e}")
+    
+    targets = []
+    for bill in bills:
+        if not bill['title'] and not bill['body']:
+            print(f"건너뜀: {bill['bill_id']} (제목/본문 없음)")
+            continue
+        targets.append(bill)
+    
+    # 캐시 조회: 캐시에 있으면 바로 저장, 같은 키의 의안은 대표 1건만 API 호출
+    bill_keys: Dict[str, str] = {}
+    duplicates: Dict[str, List[Dict]] = {}
+    cache_hits = 0
+    if cache is not None:
+        bill_keys = {bill['bill_id']: cache.key(bill['title'] or "", bill['body'] or "") for bill in targets}
+        found = cache.lookup(bill_keys.values())
+        to_call = []
+        for bill in targets:
+            key = bill_keys[bill['bill_id']]
+            if key in found:
+                save(f"[캐시] {bill['bill_id']}", result_from_cache(bill, found[key]))
+                cache_hits += 1
+            elif key in duplicates:
+                duplicates[key].append(bill)
             else:
-                error_msg = result.error or "결과가 비어있음"
-                print(f"  ✗ 실패: {error_msg}")
-                error_count += 1
-                
-        except Exception as e:
-            error_str = str(e)
-            # API 할당량 초과 확인
-            if "429" in error_str or "quota" in error_str.lower() or "exceeded" in error_str.lower():
-                print(f"  ⚠️ API 할당량 초과: {error_str[:100]}...")
-                print(f"  [전환] 다음 API 키로 전환합니다...")
-                
-                # 다음 API 키로 전환
-                if api_key_manager.switch_to_next_key():
-                    new_key = api_key_manager.get_current_key()
-                    print(f"  ✓ 새 API 키로 전환: {api_key_manager.get_key_info()}")
-                    # 환경변수도 업데이트
-                    os.environ["GEMINI_API_KEY"] = new_key
-                    # 재시도하지 않고 다음 의안으로
-                    error_count += 1
-                    continue
+                duplicates[key] = []
+                to_call.append(bill)
+        if cache_hits:
+            print(f"[캐시] {cache_hits}개 의안을 API 호출 없이 채움")
+        success_count += cache_hits
+        targets = to_call
+    
+    batch_requests = 0
+    fallback_count = 0
+    deferred: List[Dict] = []  # 묶음 요청이 429로 끝났거나 보내지 못한 의안 (점유 해제)
+    
+    def iter_results():
+        nonlocal batch_requests, fallback_count
+        if batch_pool is None or prompt_batch <= 1:
+            yield from worker_pool.run(targets)
+            return
+        groups = [targets[i:i + prompt_batch] for i in range(0, len(targets), prompt_batch)]
+        fallback = []
+        for group, results in batch_pool.run(groups):
+            batch_requests += 1
+            if results and all(not r.success for r in results) and is_rate_limit_error(results[0].error):
+                deferred.extend(group)  # 단건으로 나눠 보내면 같은 한도에 더 많은 요청이 몰림
+                continue
+            for bill, result in zip(group, results):
+                if result.success or not result.retry_single:
+                    yield bill, result
                 else:
-                    quota_exceeded = True
-                    print(f"  [중단] 모든 API 키의 할당량이 소진되었습니다.")
-                    break
-            else:
-                print(f"  ✗ 에러: {error_str}")
-                import traceback
-                traceback.print_exc()
-                error_count += 1
-        
-        # Sleep (마지막 항목 제외, 할당량 초과가 아닐 때만)
-        if idx < len(bills) and not quota_exceeded:
-            jitter = random.uniform(-0.7, 0.7)
-            sleep_time = max(0.5, base_sleep + jitter)
-            print(f"  대기 중... ({sleep_time:.1f}초)", flush=True)
-            time.sleep(sleep_time)
+                    fallback.append(bill)
+        for group in batch_pool.unprocessed:
+            deferred.extend(group)
+        if deferred:
+            print(f"  ⚠️ 묶음 요청 속도 제한/할당량 소진으로 {len(deferred)}개 의안 미처리")
+        fallback_count = len(fallback)
+        if fallback:
+            print(f"  ↻ 묶음 요청에서 실패한 {len(fallback)}개 의안은 단건 요청으로 다시 시도")
+        yield from worker_pool.run(fallback)  # 빈 목록이어도 실행 (unprocessed 갱신)
+    
+    cache_entries = []
+    for idx, (bill, result) in enumerate(iter_results(), 1):
+        prefix = f"[{idx}/{len(targets)}] {bill['bill_id']}"
+        if result.success and result.headline and result.summary:
+            save(prefix, result)
+            print(f"{prefix} ✓ 성공: {result.headline[:40]}...")
+            success_count += 1
+            key = bill_keys.get(bill['bill_id'])
+            if key is not None:
+                cache_entries.append((key, result))
+                for dup in duplicates.get(key, []):
+                    save(prefix, replace(result, bill_id=dup['bill_id'], title=dup['title'] or "", body=dup['body'] or ""))
+                    success_count += 1
+                if duplicates.get(key):
+                    print(f"{prefix} ↺ 같은 내용의 의안 {len(duplicates[key])}개에 같은 결과 저장")
+        else:
+            error_msg = result.error or "결과가 비어있음"
+            print(f"{prefix} ✗ 실패: {error_msg[:200]}")
+            error_count += 1
+    
+    # 다음 배치 조회 전에 이번 배치 결과를 모두 저장 (저장 안 된 의안을 다시 요약하지 않도록)
+    try:
+        writer.flush()
+    except psycopg2.Error as e:
+        kept = "저널에 남아 다음 실행 시작 시 다시 저장" if writer.journal_path else "저널 없음, 점유 만료 후 다시 요약"
+        print(f"  ⚠️ DB 저장 실패 ({len(writer.pending)}건 {kept}): {e}")
+    if cache is not None:
+        cache.store(cache_entries)
+    
+    quota_exceeded = worker_pool.quota_exceeded
+    if worker_pool.unprocessed:
+        print(f"  ⚠️ 모든 API 키 할당량 소진으로 {len(worker_pool.unprocessed)}개 의안 미처리")
+    unprocessed = deferred + worker_pool.unprocessed
+    if unprocessed:
+        unprocessed_ids = [bill['bill_id'] for bill in unprocessed]
+        for bill in unprocessed:
+            unprocessed_ids += [dup['bill_id'] for dup in duplicates.get(bill_keys.get(bill['bill_id']), [])]
+        try:
+            release_claims(writer.conn, unprocessed_ids)
+        except psycopg2.Error as e:
+            print(f"  ⚠️ 점유 해제 실패 (점유 만료 후 다시 처리): {e}")
+    
+    # 점유 해제까지 끝난 뒤에 연결 종료
+    if own_writer:
+        try:
+            writer.close()
+        except psycopg2.Error as e:
+            print(f"  ⚠️ DB 저장 실패 (저널에 남은 결과는 다음 실행 시작 시 다시 저장): {e}")
+    
+    # 요약이 저장된 의안이 있으면 웹 캐시(bills 태그) 무효화
+    if success_count > 0:
+        publish_invalidation('bills')
     
     elapsed_time = time.time() - start_time
     print("-" * 60)
@@ -638,11 +1018,41 @@ def process_batch(model_name: str, batch_size: int = 50, start_date: str = '2025
     if quota_exceeded:
         print(f"[중단] API 할당량 초과로 처리 중단")
     print(f"[소요 시간] {elapsed_time:.1f}초 ({elapsed_time/60:.1f}분)")
-    if len(bills) > 0:
-        print(f"[평균] 의안당 {elapsed_time/len(bills):.1f}초")
+    if success_count + error_count > 0:
+        print(f"[처리량] 의안당 {elapsed_time/(success_count + error_count):.1f}초 "
+              f"({(success_count + error_count) / elapsed_time * 60:.1f}건/분)")
+    print(f"[DB 저장] {writer.total_written}건, {writer.flushes}회, {writer.write_time:.2f}초")
+    if cache is not None:
+        print(f"[캐시] 적중 {cache_hits}건, 새로 저장 {len(cache_entries)}건")
+    if batch_requests:
+        print(f"[묶음 요청] {batch_requests}회 (요청당 최대 {prompt_batch}개), 단건 재시도 {fallback_count}개")
+    for label, stats in worker_pool.stats().items():
+        print(f"  {label}: 요청 {stats['requests']}, 성공 {stats['success']}, 429 {stats['rate_limited']}"
+              f"{', 소진' if stats['exhausted'] else ''}")
     
     return (success_count, error_count, quota_exceeded)
 
+def fill_from_cache(writer: SummaryWriter, cache: SummaryCache, start_date: str = '2025-01-01',
+                    chunk_size: int = 500) -> int:
+    """--reuse-cache: 미처리 의안 전체 중 캐시에 결과가 있는 의안만 API 호출 없이 채움. 채운 수 반환"""
+    bills = fetch_unprocessed_bills(limit=None, start_date=start_date, conn=writer.conn)
+    print(f"[발견] 미처리 의안: {len(bills)}개")
+    filled = 0
+    for i in range(0, len(bills), chunk_size):
+        chunk = bills[i:i + chunk_size]
+        keys = {bill['bill_id']: cache.key(bill['title'] or "", bill['body'] or "") for bill in chunk}
+        found = cache.lookup(keys.values())
+        for bill in chunk:
+            entry = found.get(keys[bill['bill_id']])
+            if entry is not None:
+                writer.add(result_from_cache(bill, entry))
+                filled += 1
+        writer.flush()
+    if filled:
+        publish_invalidation('bills')
+    print(f"[캐시] {filled}개 의안을 API 호출 없이 채움 (남은 의안: {len(bills) - filled}개)")
+    return filled
+
 def main():
     ap = argparse.ArgumentParser(
         description="DB에 저장된 의안들을 50개씩 배치로 처리하여 AI 요약 생성 (기본 모델: gemini-2.5-flash)"
@@ -655,44 +1065,79 @@ def main():
                    help="처리 시작 날짜 (기본: 2025-01-01)")
     ap.add_argument("--timeout", type=int, default=60, 
                    help="모델 호출 타임아웃(초)")
-    ap.add_argument("--sleep", type=float, default=2.5, 
-                   help="요청 간 sleep 시간(초, 기본: 2.5)")
+    ap.add_argument("--sleep", type=float, default=None, 
+                   help="(호환용) 키당 요청 간격(초). 지정하면 --rpm 대신 60/sleep 사용")
+    ap.add_argument("--rpm", type=int, default=DEFAULT_RPM,
+                   help=f"키당 분당 요청 수 (기본: GEMINI_RPM 또는 {DEFAULT_RPM})")
+    ap.add_argument("--tpm", type=int, default=DEFAULT_TPM,
+                   help=f"키당 분당 토큰 수 (기본: GEMINI_TPM 또는 {DEFAULT_TPM})")
+    ap.add_argument("--rpd", type=int, default=DEFAULT_RPD,
+                   help=f"키당 일일 요청 수 (기본: GEMINI_RPD 또는 {DEFAULT_RPD})")
+    ap.add_argument("--prompt-batch", type=int, default=1,
+                   help="한 요청에 묶어 보낼 의안 수 (기본: 1, 의안마다 요청. 2 이상이면 JSON 배열 응답으로 묶어 요청)")
+    ap.add_argument("--workers-per-key", type=int, default=2,
+                   help="키당 동시 호출 스레드 수 (기본: 2, 응답 대기 중에도 RPM을 채우도록)")
     ap.add_argument("--auto-continue", action="store_true", default=True,
                    help="자동으로 다음 배치 진행 (기본: True)")
     ap.add_argument("--max-batches", type=int, default=None,
                    help="최대 배치 수 (None이면 무제한)")
     ap.add_argument("--api-keys", type=str, default=None,
                    help="API 키 목록 (쉼표로 구분, 예: key1,key2,key3)")
+    ap.add_argument("--write-batch", type=int, default=10,
+                   help="한 번에 UPDATE할 결과 수 (기본: 10)")
+    ap.add_argument("--journal", default=DEFAULT_JOURNAL_PATH,
+                   help="저장 전 결과 저널 파일 (프로세스마다 <이름>.<호스트>-<pid>.jsonl로 따로 기록, "
+                        "중단 후 재실행 시 복구, 빈 문자열이면 사용 안 함)")
+    ap.add_argument("--lease-minutes", type=int, default=DEFAULT_LEASE_MINUTES,
+                   help=f"의안 점유 유지 시간(분), 지나면 다른 프로세스가 가져감 (기본: {DEFAULT_LEASE_MINUTES})")
+    ap.add_argument("--reuse-cache", action="store_true",
+                   help="API를 호출하지 않고 요약 캐시에 있는 의안(중복·재제출 의안)만 채운 뒤 종료")
+    ap.add_argument("--no-cache", action="store_true",
+                   help="요약 캐시를 사용하지 않음")
+    ap.add_argument("--cache-ttl-days", type=int, default=DEFAULT_TTL_DAYS,
+                   help=f"마지막 사용 후 이 기간이 지난 캐시 항목 삭제 (기본: {DEFAULT_TTL_DAYS}일)")
+    ap.add_argument("--cache-max-rows", type=int, default=DEFAULT_MAX_ROWS,
+                   help=f"캐시 최대 항목 수, 넘으면 오래 안 쓴 항목부터 삭제 (기본: {DEFAULT_MAX_ROWS})")
     
     args = ap.parse_args()
     
+    # 실행 내내 연결 하나를 쓰는 DB writer (시작 시 이전 실행의 저널 복구)
+    writer = SummaryWriter(batch_size=args.write_batch, journal_path=args.journal or None)
+    
+    cache = None
+    if not args.no_cache:
+        cache = SummaryCache(writer.conn, args.model, prompt_version(SYSTEM_GUIDE),
+                             ttl_days=args.cache_ttl_days, max_rows=args.cache_max_rows)
+        evicted = cache.evict()
+        if evicted:
+            print(f"[캐시] 만료/초과 항목 {evicted}개 삭제")
+    
+    if args.reuse_cache:
+        if cache is None or not cache.enabled:
+            print("오류: --reuse-cache는 요약 캐시(ai_summary_cache)가 필요합니다.", file=sys.stderr)
+            writer.close()
+            sys.exit(2)
+        fill_from_cache(writer, cache, start_date=args.start_date)
+        writer.close()
+        return
+    
     # API 키 목록 설정
-    api_keys = []
-    if args.api_keys:
-        # 명령줄 인자에서 가져오기
-        api_keys = [key.strip() for key in args.api_keys.split(",") if key.strip()]
-    else:
-        # 환경변수에서 가져오기 (여러 개 가능: GEMINI_API_KEY_1, GEMINI_API_KEY_2, ...)
-        i = 1
-        while True:
-            key = os.environ.get(f"GEMINI_API_KEY_{i}")
-            if not key:
-                break
-            api_keys.append(key)
-            i += 1
-        
-        # 기본 GEMINI_API_KEY도 추가
-        default_key = os.environ.get("GEMINI_API_KEY")
-        if default_key:
-            api_keys.insert(0, default_key)
+    api_keys = load_api_keys(args.api_keys)
     
     if not api_keys:
         print("오류: API 키가 제공되지 않았습니다.", file=sys.stderr)
         print("해결: --api-keys 옵션 사용 또는 GEMINI_API_KEY 환경변수 설정", file=sys.stderr)
+        writer.close()
         sys.exit(2)
     
-    # API 키 관리자 생성
-    api_key_manager = APIKeyManager(api_keys)
+    # 키별 예산을 가진 동시 호출 풀 (모든 배치에서 공유)
+    rpm = args.rpm
+    if args.sleep:
+        rpm = max(1, int(60 / args.sleep))
+    worker_pool = build_worker_pool(args.model, api_keys, timeout=args.timeout,
+                                    rpm=rpm, tpm=args.tpm, rpd=args.rpd,
+                                    workers_per_key=args.workers_per_key)
+    batch_pool = build_batch_pool(args.model, worker_pool, timeout=args.timeout) if args.prompt_batch > 1 else None
     
     total_success = 0
     total_error = 0
@@ -700,7 +1145,7 @@ def main():
     
     print("=" * 60)
     print("AI 요약 자동 배치 처리 시작")
-    print(f"사용 가능한 API 키: {len(api_keys)}개")
+    print(f"사용 가능한 API 키: {len(api_keys)}개 (키당 RPM {rpm}, TPM {args.tpm}, RPD {args.rpd})")
     print("=" * 60)
     print()
     
@@ -718,9 +1163,12 @@ def main():
             model_name=args.model,
             batch_size=args.batch_size,
             start_date=args.start_date,
-            timeout=args.timeout,
-            base_sleep=args.sleep,
-            api_key_manager=api_key_manager
+            worker_pool=worker_pool,
+            writer=writer,
+            cache=cache,
+            lease_seconds=args.lease_minutes * 60,
+            batch_pool=batch_pool,
+            prompt_batch=args.prompt_batch
         )
         
         total_success += success
@@ -751,6 +1199,8 @@ def main():
         print(f"\n[다음 배치] 3초 후 자동으로 다음 배치를 시작합니다...")
         time.sleep(3)
     
+    writer.close()
+    
     print(f"\n{'=' * 60}")
     print(f"전체 처리 결과")
     print(f"{'=' * 60}")
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+AI 요약 결과 캐시 (ai_summary_cache 테이블)
+
+- 키: (모델, 시스템 프롬프트 버전, 정규화한 제목, 정규화한 본문)의 해시
+  → 대안/재제출 의안처럼 제목·본문이 같은(공백, 발의자 표기만 다른) 의안은 API를 다시 호출하지 않음
+- 프롬프트 버전은 SYSTEM_GUIDE 내용의 해시이므로 프롬프트를 고치면 자동으로 새 키를 사용
+- 만료: 마지막 사용 후 ttl_days가 지난 항목, 그리고 max_rows를 넘는 오래된 항목을 시작할 때 삭제
+- DB 접근은 SummaryWriter와 같은 연결로 메인 스레드에서만
+
+사용 예:
+    cache = SummaryCache(writer.conn, model_name, prompt_version(SYSTEM_GUIDE))
+    hits = cache.lookup([cache.key(title, body) for title, body in ...])
+    cache.store([(key, result), ...])
+"""
+
+import hashlib
+import json
+import re
+import unicodedata
+
+from psycopg2.extras import execute_values
+
+DEFAULT_TTL_DAYS = 180
+DEFAULT_MAX_ROWS = 50000
+
+# 제목에서 의미 없는 차이: 대안/수정안 표기, 발의자 표기 (예: "(홍길동의원 등 10인)")
+_TITLE_NOISE = re.compile(r"\((?:대안|수정안|[^()]*의원[^()]*)\)")
+_SPACES = re.compile(r"\s+")
+
+
+def prompt_version(system_prompt):
+    """시스템 프롬프트 버전 (내용 해시 앞 12자리)"""
+    return hashlib.sha256(system_prompt.encode('utf-8')).hexdigest()[:12]
+
+
+def normalize_text(text):
+    """비교용 정규화: NFKC, 공백 하나로, 앞뒤 공백 제거"""
+    text = unicodedata.normalize('NFKC', text or '')
+    return _SPACES.sub(' ', text).strip()
+
+
+def normalize_title(title):
+    return normalize_text(_TITLE_NOISE.sub('', unicodedata.normalize('NFKC', title or '')))
+
+
+class SummaryCache:
+    """요약 결과 캐시 (테이블이 없으면 비활성화되어 항상 miss)"""
+
+    def __init__(self, conn, model_name, version, ttl_days=DEFAULT_TTL_DAYS, max_rows=DEFAULT_MAX_ROWS):
+        self.conn = conn
+        self.model_name = model_name
+        self.version = version
+        self.ttl_days = ttl_days
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+        with conn.cursor() as cur:
+            cur.execute("SELECT to_regclass('ai_summary_cache') IS NOT NULL")
+            self.enabled = cur.fetchone()[0]
+        conn.commit()
+        if not self.enabled:
+            print("⚠️ ai_summary_cache 테이블이 없어 요약 캐시를 사용하지 않습니다. (create_tables_postgresql.sql 실행 필요)")
+
+    def key(self, title, body):
+        raw = '\x1f'.join([self.model_name, self.version, normalize_title(title), normalize_text(body)])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def evict(self):
+        """만료 항목과 max_rows를 넘는 오래된 항목 삭제. 삭제한 행 수 반환"""
+        if not self.enabled:
+            return 0
+        with self.conn.cursor() as cur:
+            cur.execute("""
+                DELETE FROM ai_summary_cache
+                WHERE last_used_at < CURRENT_TIMESTAMP - make_interval(days => %s)
+            """, (self.ttl_days,))
+            deleted = cur.rowcount
+            cur.execute("""
+                DELETE FROM ai_summary_cache
+                WHERE cache_key IN (
+                    SELECT cache_key FROM ai_summary_cache
+                    ORDER BY last_used_at DESC
+                    OFFSET %s
+                )
+            """, (self.max_rows,))
+            deleted += cur.rowcount
+        self.conn.commit()
+        return deleted
+
+    def lookup(self, keys):
+        """key → {headline, summary, categories, vote_for, vote_against} (찾은 항목은 사용 시각 갱신)"""
+        keys = list(set(keys))
+        if not self.enabled or not keys:
+            self.misses += len(keys)
+            return {}
+        with self.conn.cursor() as cur:
+            cur.execute("""
+                UPDATE ai_summary_cache
+                SET last_used_at = CURRENT_TIMESTAMP, hit_count = hit_count + 1
+                WHERE cache_key = ANY(%s)
+                RETURNING cache_key, headline, summary, categories, vote_for, vote_against
+            """, (keys,))
+            rows = cur.fetchall()
+        self.conn.commit()
+        found = {
+            key: {
+                'headline': headline,
+                'summary': summary,
+                'categories': categories or [],
+                'vote_for': vote_for or {},
+                'vote_against': vote_against or {},
+            }
+            for key, headline, summary, categories, vote_for, vote_against in rows
+        }
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def store(self, entries):
+        """(key, RowResult) 목록을 한 번에 저장 (같은 키는 새 결과로 교체)"""
+        rows = {
+            key: (key, self.model_name, self.version, result.headline, result.summary,
+                  json.dumps(result.categories, ensure_ascii=False),
+                  json.dumps(result.vote_for, ensure_ascii=False),
+                  json.dumps(result.vote_against, ensure_ascii=False))
+            for key, result in entries
+        }
+        if not self.enabled or not rows:
+            return 0
+        with self.conn.cursor() as cur:
+            execute_values(cur, """
+                INSERT INTO ai_summary_cache (
+                    cache_key, model, prompt_version, headline, summary,
+                    categories, vote_for, vote_against, created_at, last_used_at
+                ) VALUES %s
+                ON CONFLICT (cache_key) DO UPDATE SET
+                    headline = EXCLUDED.headline,
+                    summary = EXCLUDED.summary,
+                    categories = EXCLUDED.categories,
+                    vote_for = EXCLUDED.vote_for,
+                    vote_against = EXCLUDED.vote_against,
+                    last_used_at = CURRENT_TIMESTAMP
+            """, list(rows.values()),
+                template="(%s, %s, %s, %s, %s, %s::jsonb, %s::jsonb, %s::jsonb, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)")
+        self.conn.commit()
+        self.stored += len(rows)
+        return len(rows)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'stored': self.stored}
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Gemini 요약 동시 호출 풀 (API 키별 속도 예산)
+
+- API 키마다 KeyBudget: 분당 요청(RPM), 분당 토큰(TPM) 토큰 버킷 + 일일 요청 수(RPD) 상한
+- 키마다 workers_per_key개의 작업 스레드가 같은 작업 큐에서 의안을 가져가 호출 (키 수에 비례해 처리량 증가)
+- 429 응답: 해당 키만 지수 백오프로 잠시 멈추고 의안은 큐에 되돌림 (다른 키의 작업 스레드가 이어서 처리)
+  일일 할당량 초과이거나 429가 연속으로 반복되면 그 키는 소진 처리
+- 결과는 결과 큐로 모아 호출한 쪽(메인 스레드, 단일 DB writer)에 완료 순서대로 전달
+
+사용 예:
+    budgets = [KeyBudget(key, i, rpm=10, tpm=250000, rpd=250) for i, key in enumerate(api_keys)]
+    pool = GeminiWorkerPool(budgets, call=lambda bill, key: call_model_gemini(...), estimate_tokens=...)
+    for bill, result in pool.run(bills):
+        ...  # 메인 스레드에서 DB 저장
+"""
+
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from rate_limit import TokenBucket
+
+RATE_LIMIT_MARKERS = ('429', 'quota', 'exceeded', 'resource_exhausted', 'resource has been exhausted')
+DAILY_QUOTA_MARKERS = ('perday', 'per day', 'daily')
+
+
+def is_rate_limit_error(error):
+    """API 속도/할당량 제한 오류인지 (429, quota exceeded 등)"""
+    text = (error or '').lower()
+    return any(marker in text for marker in RATE_LIMIT_MARKERS)
+
+
+def is_daily_quota_error(error):
+    """일일 할당량 초과인지 (오늘은 이 키를 더 쓸 수 없음)"""
+    text = (error or '').lower().replace('_', ' ')
+    return is_rate_limit_error(error) and any(marker in text for marker in DAILY_QUOTA_MARKERS)
+
+
+class KeyBudget:
+    """API 키 하나의 속도 예산 (RPM/TPM 토큰 버킷 + RPD 상한 + 429 적응형 백오프)"""
+
+    def __init__(self, api_key, index, rpm=10, tpm=250000, rpd=250,
+                 base_backoff=5.0, max_backoff=120.0, max_consecutive_429=5):
+        self.api_key = api_key
+        self.index = index
+        self.rpd = rpd
+        # 요청은 고르게 분산 (버스트 1), 토큰은 10초 분량까지 몰아서 사용 가능
+        self.requests = TokenBucket(rpm / 60.0, capacity=1)
+        self.tokens = TokenBucket(tpm / 60.0, capacity=max(1.0, tpm / 6.0))
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.max_consecutive_429 = max_consecutive_429
+        self.exhausted = False
+        self._lock = threading.Lock()
+        self._day = date.today()
+        self._used_today = 0
+        self._consecutive_429 = 0
+        self._stats = {'requests': 0, 'success': 0, 'rate_limited': 0, 'backoff_total': 0.0}
+
+    @property
+    def label(self):
+        return f"API 키 {self.index + 1} ({self.api_key[:8]}...)"
+
+    def _reserve_daily(self):
+        with self._lock:
+            today = date.today()
+            if today != self._day:
+                self._day, self._used_today = today, 0
+            if self.exhausted or self._used_today >= self.rpd:
+                self.exhausted = True
+                return False
+            self._used_today += 1
+            self._stats['requests'] += 1
+            return True
+
+    def acquire(self, tokens, stop_event=None):
+        """요청 1건 + 예상 토큰 수만큼 예산 확보 (대기). 키가 소진되었거나 중단 요청이면 False"""
+        tokens = min(tokens, self.tokens.capacity)
+        for bucket, amount in ((self.requests, 1), (self.tokens, tokens)):
+            # 1초 이상 기다려야 하면 acquire가 바로 False를 돌려주므로, 소진/중단 여부를 보며 나눠서 대기
+            while not bucket.acquire(amount, timeout=1.0):
+                if self.exhausted or (stop_event is not None and stop_event.is_set()):
+                    return False
+                time.sleep(0.5)
+        return self._reserve_daily()
+
+    def record_success(self):
+        with self._lock:
+            self._consecutive_429 = 0
+            self._stats['success'] += 1
+
+    def record_rate_limit(self, error):
+        """429 처리: 일일 할당량이면 소진, 아니면 지수 백오프 동안 이 키의 발급 중단. 대기 시간(초) 반환"""
+        with self._lock:
+            self._consecutive_429 += 1
+            self._stats['rate_limited'] += 1
+            if is_daily_quota_error(error) or self._consecutive_429 >= self.max_consecutive_429:
+                self.exhausted = True
+                return 0.0
+            delay = min(self.max_backoff, self.base_backoff * (2 ** (self._consecutive_429 - 1)))
+            delay += random.uniform(0, self.base_backoff)
+            self._stats['backoff_total'] += delay
+        self.requests.pause(delay)
+        self.tokens.pause(delay)
+        return delay
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['used_today'] = self._used_today
+        stats['backoff_total'] = round(stats['backoff_total'], 1)
+        stats['exhausted'] = self.exhausted
+        stats['waited'] = self.requests.stats()['waited'] + self.tokens.stats()['waited']
+        return stats
+
+
+class GeminiWorkerPool:
+    """API 키별 작업 스레드로 의안을 동시에 요약하고 결과를 완료 순서대로 돌려주는 풀
+
+    call(bill, api_key) → RowResult 는 작업 스레드에서 실행되므로 DB에 접근하지 않아야 한다.
+    작업 단위가 의안 묶음처럼 다른 형태면 result_error(결과) → 요청 오류 문자열(없으면 None)을 넘긴다.
+    """
+
+    def __init__(self, budgets, call, estimate_tokens, workers_per_key=2, max_attempts=3, result_error=None):
+        self.budgets = budgets
+        self.call = call
+        self.estimate_tokens = estimate_tokens
+        self.result_error = result_error or (lambda result: result.error)
+        self.workers_per_key = max(1, int(workers_per_key))
+        self.max_attempts = max_attempts
+        self.unprocessed = []  # 마지막 run()에서 모든 키가 소진되어 처리하지 못한 의안
+
+    @property
+    def quota_exceeded(self):
+        return all(budget.exhausted for budget in self.budgets)
+
+    def _worker(self, budget, jobs, results, outstanding, stop_event):
+        while not budget.exhausted and not stop_event.is_set():
+            try:
+                bill, attempt = jobs.get(timeout=0.2)
+            except queue.Empty:
+                with outstanding['lock']:
+                    if outstanding['count'] == 0:
+                        return  # 모든 의안 처리 완료
+                continue  # 다른 스레드가 재시도로 되돌릴 수 있으므로 대기
+
+            if not budget.acquire(self.estimate_tokens(bill), stop_event):
+                jobs.put((bill, attempt))  # 이 키는 소진: 다른 키가 처리하도록 되돌림
+                return
+
+            result = self.call(bill, budget.api_key)
+            error = self.result_error(result)
+            if error and is_rate_limit_error(error):
+                delay = budget.record_rate_limit(error)
+                if budget.exhausted:
+                    print(f"  ⚠️ {budget.label} 할당량 소진, 남은 의안은 다른 키로 처리")
+                else:
+                    print(f"  ⏳ {budget.label} 429 응답, {delay:.1f}초 대기")
+                if attempt + 1 < self.max_attempts:
+                    jobs.put((bill, attempt + 1))
+                    continue
+            else:
+                budget.record_success()
+
+            results.put((bill, result))
+            with outstanding['lock']:
+                outstanding['count'] -= 1
+
+    def run(self, bills):
+        """bills를 모든 키로 나누어 처리하고 (bill, RowResult)를 완료 순서대로 yield"""
+        jobs = queue.Queue()
+        results = queue.Queue()
+        for bill in bills:
+            jobs.put((bill, 0))
+        outstanding = {'count': len(bills), 'lock': threading.Lock()}
+        stop_event = threading.Event()
+
+        threads = []
+        for budget in self.budgets:
+            if budget.exhausted:
+                continue
+            for n in range(self.workers_per_key):
+                thread = threading.Thread(target=self._worker, name=f"gemini-{budget.index + 1}-{n + 1}",
+                                          args=(budget, jobs, results, outstanding, stop_event), daemon=True)
+                thread.start()
+                threads.append(thread)
+
+        try:
+            while True:
+                try:
+                    yield results.get(timeout=0.2)
+                except queue.Empty:
+                    if not any(thread.is_alive() for thread in threads):
+                        break
+            while not results.empty():
+                yield results.get_nowait()
+        finally:
+            stop_event.set()
+            for thread in threads:
+                thread.join()
+
+        self.unprocessed = []
+        while not jobs.empty():
+            self.unprocessed.append(jobs.get_nowait()[0])
+
+    def stats(self):
+        return {budget.label: budget.stats() for budget in self.budgets}
@@ -7,14 +7,22 @@ Flask 기반 웹 애플리케이션
 
 import sys
 import os
-from datetime import datetime, date, timedelta
+from datetime import datetime, date
 from flask import Flask, render_template, jsonify, request
-from flask_caching import Cache
 from dotenv import load_dotenv
-import psycopg2
+import threading
+import base64
+import hashlib
+import html
 from psycopg2.extras import RealDictCursor
 import json
 
+from db_pool import ConnectionPool, pool_settings_from_env
+from cache_backend import get_shared_cache
+from member_directory import MemberDirectory
+from quality_profile import quality_profile
+from response_encoding import FastJSONProvider, init_compression
+
 # .env 파일 자동 로드
 load_dotenv()
 
@@ -26,13 +34,13 @@ if sys.platform == 'win32':
 
 app = Flask(__name__)
 
-# 캐시 설정
-cache_config = {
-    'CACHE_TYPE': 'simple',  # 메모리 기반 캐시 (프로덕션에서는 Redis 사용 권장)
-    'CACHE_DEFAULT_TIMEOUT': 300  # 5분 캐시
-}
-app.config.from_mapping(cache_config)
-cache = Cache(app)
+# JSON 응답: orjson(설치 시) + 날짜 ISO 8601 직렬화, Accept-Encoding에 따라 br/gzip 압축
+app.json = FastJSONProvider(app)
+init_compression(app)
+
+# 캐시 설정 (CACHE_REDIS_URL이 있으면 워커 간 공유 Redis, 없으면 프로세스 내 메모리)
+# 수집/요약 스크립트가 bills, votes, members 태그를 무효화하면 관련 응답이 바로 갱신됨
+cache = get_shared_cache()
 
 
 # 데이터베이스 설정 (로컬/GCP 모두 지원)
@@ -56,15 +64,21 @@ def get_db_config():
         'port': db_port
     }
 
-def get_db_connection():
-    """데이터베이스 연결 생성"""
-    try:
-        config = get_db_config()
-        conn = psycopg2.connect(**config)
-        return conn
-    except Exception as e:
-        print(f"데이터베이스 연결 오류: {e}")
-        raise
+_db_pool = None
+_db_pool_lock = threading.Lock()
+
+def get_db_pool():
+    """공용 커넥션 풀 (첫 요청 시 생성 - gunicorn 워커 fork 이후에 만들어지도록)"""
+    global _db_pool
+    if _db_pool is None:
+        with _db_pool_lock:
+            if _db_pool is None:
+                try:
+                    _db_pool = ConnectionPool(get_db_config(), **pool_settings_from_env())
+                except Exception as e:
+                    print(f"데이터베이스 연결 오류: {e}")
+                    raise
+    return _db_pool
 
 def format_date_for_json(dt):
     """날짜 객체를 JSON 직렬화 가능한 문자열로 변환"""
@@ -81,124 +95,103 @@ def index():
     """메인 페이지"""
     return render_template('index.html')
 
+@app.route('/api/db/pool')
+def get_db_pool_stats():
+    """커넥션 풀 대여/반납 통계"""
+    return jsonify(get_db_pool().stats())
+
+@app.route('/api/cache/stats')
+def get_cache_stats():
+    """캐시 적중/무효화 통계 (현재 워커 기준)"""
+    stats = cache.stats()
+    stats['member_directory'] = member_directory.stats()
+    return jsonify(stats)
+
+# 통계 집계 쿼리 (scripts/db/create_tables_postgresql.sql의 bill_stats_rollup 정의와 동일)
+# 월 x 진행단계 x 처리구분 x 표결여부 단위로 묶어 한 번에 조회
+BILL_STATS_ROLLUP_SQL = """
+    SELECT 
+        TO_CHAR(b.proposal_month, 'YYYY-MM') as month,
+        COALESCE(b.proc_stage_cd, '미분류') as proc_stage_cd,
+        COALESCE(b.pass_gubn, '미분류') as pass_gubn,
+        (s.bill_id IS NOT NULL) as has_votes,
+        COUNT(*) as bill_count,
+        COALESCE(SUM(s.vote_count), 0) as vote_count,
+        CURRENT_TIMESTAMP as refreshed_at
+    FROM bills b
+    LEFT JOIN bill_vote_summary s ON s.bill_id = b.bill_id AND s.vote_count > 0
+    WHERE b.proposal_date >= '2025-01-01'
+    GROUP BY 1, 2, 3, 4
+"""
+
+def summarize_bill_stats(rows):
+    """통계 집계 행(월/진행단계/처리구분/표결여부별)을 /api/stats 응답 형태로 합산"""
+    stats = {
+        'total_bills': 0,
+        'bills_with_votes': 0,
+        'total_votes': 0,
+        'pending_bills': 0,
+        'processed_bills': 0,
+        'processed_with_votes': 0
+    }
+    proc_stage_stats = {}
+    pass_gubn_stats = {}
+    monthly_bills = {}
+    refreshed_at = None
+    
+    for row in rows:
+        count = row['bill_count']
+        stats['total_bills'] += count
+        stats['total_votes'] += row['vote_count']
+        if row['has_votes']:
+            stats['bills_with_votes'] += count
+        if row['pass_gubn'] == '계류의안':
+            stats['pending_bills'] += count
+        elif row['pass_gubn'] == '처리의안':
+            stats['processed_bills'] += count
+            if row['has_votes']:
+                stats['processed_with_votes'] += count
+        
+        proc_stage_stats[row['proc_stage_cd']] = proc_stage_stats.get(row['proc_stage_cd'], 0) + count
+        pass_gubn_stats[row['pass_gubn']] = pass_gubn_stats.get(row['pass_gubn'], 0) + count
+        monthly_bills[row['month']] = monthly_bills.get(row['month'], 0) + count
+        if refreshed_at is None or row['refreshed_at'] > refreshed_at:
+            refreshed_at = row['refreshed_at']
+    
+    stats['bills_without_votes'] = stats['total_bills'] - stats['bills_with_votes']
+    stats['processed_no_votes'] = stats['processed_bills'] - stats['processed_with_votes']
+    stats['proc_stage_stats'] = proc_stage_stats
+    stats['pass_gubn_stats'] = pass_gubn_stats
+    stats['monthly_bills'] = dict(sorted(monthly_bills.items()))
+    stats['refreshed_at'] = format_date_for_json(refreshed_at)
+    return stats
+
+def fetch_stats(cur, fresh=False):
+    """통계 조회 본문 (/api/stats, /api/bootstrap 공용)"""
+    if fresh:
+        cur.execute(BILL_STATS_ROLLUP_SQL)
+    else:
+        cur.execute("""
+            SELECT month, proc_stage_cd, pass_gubn, has_votes, bill_count, vote_count, refreshed_at
+            FROM bill_stats_rollup
+        """)
+    stats = summarize_bill_stats(cur.fetchall())
+    stats['fresh'] = fresh
+    return stats
+
 @app.route('/api/stats')
-@cache.cached(timeout=300)  # 5분 캐시
+@cache.cached(timeout=300, tags=('bills', 'votes'), unless=lambda: request.args.get('fresh') == '1')  # 5분 캐시 (fresh=1이면 캐시 우회)
 def get_stats():
-    """전체 통계 정보"""
-    conn = get_db_connection()
+    """전체 통계 정보
+
+    수집 스크립트가 실행 후 갱신하는 bill_stats_rollup에서 한 번의 쿼리로 조회.
+    ?fresh=1이면 캐시와 집계 뷰를 우회하여 원본 테이블에서 바로 집계
+    """
+    conn = get_db_pool().getconn()
     cur = conn.cursor(cursor_factory=RealDictCursor)
     
     try:
-        # 전체 의안 수
-        cur.execute("""
-            SELECT COUNT(*) as total_bills
-            FROM bills
-            WHERE proposal_date >= '2025-01-01'
-        """)
-        total_bills = cur.fetchone()['total_bills']
-        
-        # 표결 진행된 의안 수 (EXISTS로 최적화 - 더 빠름)
-        cur.execute("""
-            SELECT COUNT(*) as bills_with_votes
-            FROM bills b
-            WHERE b.proposal_date >= '2025-01-01'
-              AND EXISTS (SELECT 1 FROM votes v WHERE v.bill_id = b.bill_id)
-        """)
-        bills_with_votes = cur.fetchone()['bills_with_votes']
-        
-        # 전체 표결 결과 수 (인덱스 활용)
-        cur.execute("""
-            SELECT COUNT(*) as total_votes
-            FROM votes v
-            WHERE EXISTS (
-                SELECT 1 FROM bills b 
-                WHERE b.bill_id = v.bill_id 
-                  AND b.proposal_date >= '2025-01-01'
-            )
-        """)
-        total_votes = cur.fetchone()['total_votes']
-        
-        # 표결 결과가 없는 의안 수
-        bills_without_votes = total_bills - bills_with_votes
-        
-        # 계류의안 수
-        cur.execute("""
-            SELECT COUNT(*) as count
-            FROM bills
-            WHERE proposal_date >= '2025-01-01'
-            AND pass_gubn = '계류의안'
-        """)
-        pending_bills = cur.fetchone()['count']
-        
-        # 처리의안 수
-        cur.execute("""
-            SELECT COUNT(*) as count
-            FROM bills
-            WHERE proposal_date >= '2025-01-01'
-            AND pass_gubn = '처리의안'
-        """)
-        processed_bills = cur.fetchone()['count']
-        
-        # 처리의안 중 표결 결과가 있는 의안 수 (EXISTS로 최적화)
-        cur.execute("""
-            SELECT COUNT(*) as count
-            FROM bills b
-            WHERE b.proposal_date >= '2025-01-01'
-              AND b.pass_gubn = '처리의안'
-              AND EXISTS (SELECT 1 FROM votes v WHERE v.bill_id = b.bill_id)
-        """)
-        processed_with_votes = cur.fetchone()['count']
-        
-        # 처리의안 중 표결 결과가 없는 의안 수
-        processed_no_votes = processed_bills - processed_with_votes
-        
-        # 진행단계별 통계 (모든 단계)
-        cur.execute("""
-            SELECT 
-                COALESCE(proc_stage_cd, '미분류') as proc_stage_cd,
-                COUNT(*) as count
-            FROM bills
-            WHERE proposal_date >= '2025-01-01'
-            GROUP BY proc_stage_cd
-        """)
-        proc_stage_stats = {row['proc_stage_cd']: row['count'] for row in cur.fetchall()}
-        
-        # 처리/계류 통계
-        cur.execute("""
-            SELECT 
-                COALESCE(pass_gubn, '미분류') as pass_gubn,
-                COUNT(*) as count
-            FROM bills
-            WHERE proposal_date >= '2025-01-01'
-            GROUP BY pass_gubn
-        """)
-        pass_gubn_stats = {row['pass_gubn']: row['count'] for row in cur.fetchall()}
-        
-        # 월별 의안 수
-        cur.execute("""
-            SELECT 
-                TO_CHAR(proposal_date, 'YYYY-MM') as month,
-                COUNT(*) as count
-            FROM bills
-            WHERE proposal_date >= '2025-01-01'
-            GROUP BY TO_CHAR(proposal_date, 'YYYY-MM')
-            ORDER BY month
-        """)
-        monthly_bills = {row['month']: row['count'] for row in cur.fetchall()}
-        
-        return jsonify({
-            'total_bills': total_bills,
-            'bills_with_votes': bills_with_votes,
-            'bills_without_votes': bills_without_votes,
-            'total_votes': total_votes,
-            'pending_bills': pending_bills,
-            'processed_bills': processed_bills,
-            'processed_with_votes': processed_with_votes,
-            'processed_no_votes': processed_no_votes,
-            'proc_stage_stats': proc_stage_stats,
-            'pass_gubn_stats': pass_gubn_stats,
-            'monthly_bills': monthly_bills
-        })
+        return jsonify(fetch_stats(cur, fresh=request.args.get('fresh') == '1'))
     
     except Exception as e:
         print(f"통계 조회 오류: {e}")
@@ -206,113 +199,312 @@ def get_stats():
     
     finally:
         cur.close()
-        conn.close()
+        get_db_pool().putconn(conn)
 
-@app.route('/api/bills')
-@cache.cached(timeout=60, query_string=True)  # 1분 캐시, 쿼리 파라미터별로 캐시
-def get_bills():
-    """의안 목록 조회 (월별 필터링, 제목 검색, 처리구분, 진행단계 필터 지원)"""
-    month = request.args.get('month', None)  # YYYY-MM 형식
-    search = request.args.get('search', None)  # 제목 검색어
-    pass_gubn = request.args.get('pass_gubn', None)  # 처리구분 필터
-    proc_stage = request.args.get('proc_stage', None)  # 진행단계 필터
-    page = int(request.args.get('page', 1))
-    per_page = int(request.args.get('per_page', 20))
-    sort_by = request.args.get('sort_by', 'proposal_date')  # proposal_date, vote_count
-    order = request.args.get('order', 'desc')  # asc, desc
-    
-    conn = get_db_connection()
-    cur = conn.cursor(cursor_factory=RealDictCursor)
+def month_date_range(month):
+    """'YYYY-MM' → (해당 월 1일, 다음 달 1일). 형식이 잘못되면 ValueError"""
+    month_start = datetime.strptime(month, '%Y-%m').date()
+    if month_start.month == 12:
+        month_end = month_start.replace(year=month_start.year + 1, month=1)
+    else:
+        month_end = month_start.replace(month=month_start.month + 1)
+    return month_start, month_end
+
+def encode_bills_cursor(sort_by, order, values):
+    """다음 페이지 커서 생성 (정렬 키 값을 base64로 감싼 불투명 문자열)"""
+    payload = json.dumps([sort_by, order] + list(values), ensure_ascii=False, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_bills_cursor(cursor, sort_by, order):
+    """커서 해석. 정렬 조건이 바뀌었거나 형식이 잘못되면 ValueError"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except Exception:
+        raise ValueError('잘못된 커서입니다.')
+    if not isinstance(payload, list) or payload[:2] != [sort_by, order]:
+        raise ValueError('정렬 조건이 커서와 다릅니다. 첫 페이지부터 다시 조회하세요.')
+    expected = 2 if sort_by == 'proposal_date' else 3
+    if len(payload) - 2 != expected:
+        raise ValueError('잘못된 커서입니다.')
+    return payload[2:]
+
+SEARCH_MODES = ('all', 'title', 'fuzzy')
+SEARCH_SNIPPET_RADIUS = 40
+
+# 검색 관련도: 제목 > 헤드라인 > 요약 순 가중치, 제목에 검색어가 그대로 있으면 가산
+SEARCH_RANK_SQL = """(GREATEST(
+                    word_similarity(%s, b.title),
+                    word_similarity(%s, COALESCE(b.headline, '')) * 0.8,
+                    word_similarity(%s, COALESCE(b.summary, '')) * 0.6
+                ) + CASE WHEN b.title ILIKE %s THEN 1 ELSE 0 END)::float8"""
+
+def escape_like(term):
+    """LIKE 패턴 특수문자(%, _, \\) 이스케이프"""
+    return term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+def build_search_condition(search, search_mode):
+    """검색 WHERE 조건과 파라미터 (pg_trgm GIN 인덱스 사용)
+
+    - all: 제목/헤드라인/요약 부분 일치 (기본값)
+    - title: 제목 부분 일치
+    - fuzzy: 단어 유사도(<%) 기반, 오타·띄어쓰기 차이 허용
+    """
+    like = f'%{escape_like(search)}%'
+    if search_mode == 'title':
+        return "b.title ILIKE %s", [like]
+    if search_mode == 'fuzzy':
+        return "(%s <%% b.title OR %s <%% b.headline OR %s <%% b.summary)", [search] * 3
+    return "(b.title ILIKE %s OR b.headline ILIKE %s OR b.summary ILIKE %s)", [like] * 3
+
+def build_search_snippet(search, *texts):
+    """검색어가 처음 나타나는 위치 주변을 잘라 <mark>로 강조 (HTML 이스케이프 완료된 문자열)"""
+    needle = search.lower()
+    for text in texts:
+        if not text:
+            continue
+        pos = text.lower().find(needle)
+        if pos < 0:
+            continue
+        end_match = pos + len(search)
+        start = max(0, pos - SEARCH_SNIPPET_RADIUS)
+        end = min(len(text), end_match + SEARCH_SNIPPET_RADIUS)
+        return ''.join([
+            '…' if start > 0 else '',
+            html.escape(text[start:pos]),
+            '<mark>', html.escape(text[pos:end_match]), '</mark>',
+            html.escape(text[end_match:end]),
+            '…' if end < len(text) else ''
+        ])
+    return None
+
+def estimate_row_count(cur, query, params):
+    """EXPLAIN 추정치로 대략적인 행 수 계산 (COUNT(*) 전체 스캔 없이)"""
+    cur.execute(f"EXPLAIN (FORMAT JSON) {query}", params)
+    plan = list(cur.fetchone().values())[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+FACET_KEYS = ('pass_gubn', 'proc_stage', 'month')
+
+def fetch_bill_facets(cur, base_conditions, base_params, filters):
+    """처리구분/진행단계/월별 의안 수를 GROUPING SETS 한 번의 스캔으로 집계
+
+    - base_conditions/base_params: 모든 패싯에 공통인 조건 (기간, 검색어)
+    - filters: {'month' | 'pass_gubn' | 'proc_stage': (조건, 파라미터)} 선택된 필터
+    각 패싯은 자기 필터를 뺀 나머지 필터를 COUNT(*) FILTER로 적용.
+    반환 형태는 /api/months, /api/pass_gubn_options, /api/proc_stage_options 응답 항목과 같음
+    """
+    count_columns = []
+    params = []
+    for facet in FACET_KEYS:
+        others = [filters[other] for other in FACET_KEYS if other != facet and other in filters]
+        condition = " AND ".join(cond for cond, _ in others) or "TRUE"
+        for _, values in others:
+            params.extend(values)
+        count_columns.append(f"COUNT(*) FILTER (WHERE {condition}) as {facet}_count")
+    params.extend(base_params)
+    count_sql = ",\n            ".join(count_columns)
+    
+    cur.execute(f"""
+        SELECT 
+            GROUPING(b.pass_gubn) = 0 as is_pass_gubn,
+            GROUPING(b.proc_stage_cd) = 0 as is_proc_stage,
+            b.pass_gubn,
+            b.proc_stage_cd,
+            TO_CHAR(b.proposal_month, 'YYYY-MM') as month,
+            TO_CHAR(b.proposal_month, 'YYYY년 MM월') as month_label,
+            {count_sql}
+        FROM bills b
+        WHERE {" AND ".join(base_conditions)}
+        GROUP BY GROUPING SETS ((b.pass_gubn), (b.proc_stage_cd), (b.proposal_month))
+    """, tuple(params))
     
+    facets = {'pass_gubn': [], 'proc_stage': [], 'month': []}
+    for row in cur.fetchall():
+        if row['is_pass_gubn']:
+            if row['pass_gubn'] is not None:
+                facets['pass_gubn'].append({'pass_gubn': row['pass_gubn'], 'bill_count': row['pass_gubn_count']})
+        elif row['is_proc_stage']:
+            if row['proc_stage_cd'] is not None:
+                facets['proc_stage'].append({'proc_stage_cd': row['proc_stage_cd'], 'bill_count': row['proc_stage_count']})
+        elif row['month'] is not None:
+            facets['month'].append({'month': row['month'], 'month_label': row['month_label'], 'bill_count': row['month_count']})
+    
+    facets['pass_gubn'].sort(key=lambda item: -item['bill_count'])
+    facets['proc_stage'].sort(key=lambda item: -item['bill_count'])
+    facets['month'].sort(key=lambda item: item['month'], reverse=True)
+    return facets
+
+def query_bills(cur, args):
+    """의안 목록 조회 본문 (get_bills, /api/bootstrap 공용)
+
+    args는 request.args 형태(get 지원)의 조회 조건. 응답 dict 반환, 조건이 잘못되면 ValueError
+    """
+    month = args.get('month', None)  # YYYY-MM 형식
+    search = (args.get('search') or '').strip() or None  # 검색어
+    search_mode = args.get('search_mode', 'all')  # all, title, fuzzy
+    pass_gubn = args.get('pass_gubn', None)  # 처리구분 필터
+    proc_stage = args.get('proc_stage', None)  # 진행단계 필터
     try:
-        # WHERE 조건 구성
-        where_conditions = ["b.proposal_date >= '2025-01-01'"]
-        params_list = []
-        
-        if month:
-            where_conditions.append("TO_CHAR(b.proposal_date, 'YYYY-MM') = %s")
-            params_list.append(month)
-        
-        if search:
-            where_conditions.append("b.title ILIKE %s")
-            params_list.append(f'%{search}%')
-        
-        if pass_gubn:
-            where_conditions.append("b.pass_gubn = %s")
-            params_list.append(pass_gubn)
-        
-        if proc_stage:
-            where_conditions.append("b.proc_stage_cd = %s")
-            params_list.append(proc_stage)
-        
-        where_clause = " AND ".join(where_conditions)
+        page = max(1, int(args.get('page', 1)))
+        per_page = int(args.get('per_page', 20))
+    except ValueError:
+        raise ValueError('page, per_page는 정수여야 합니다.')
+    sort_by = args.get('sort_by', 'proposal_date')  # proposal_date, vote_count, relevance
+    order = args.get('order', 'desc')  # asc, desc
+    cursor = args.get('cursor', None)  # 커서 모드 (None이면 page 방식)
+    include_total = args.get('include_total', None)  # 커서 모드: approx, exact
+    include_facets = args.get('facets') == '1'  # 필터 옵션별 의안 수 포함
+    
+    if search_mode not in SEARCH_MODES:
+        search_mode = 'all'
+    if sort_by not in ('proposal_date', 'vote_count', 'relevance') or (sort_by == 'relevance' and not search):
+        sort_by = 'proposal_date'
+    order = 'asc' if order.lower() == 'asc' else 'desc'
+    per_page = max(1, min(per_page, 100))
+    
+    # WHERE 조건 구성
+    where_conditions = ["b.proposal_date >= '2025-01-01'"]
+    params_list = []
+    facet_filters = {}  # 패싯 집계에서 자기 자신은 제외할 필터 조건
+    
+    if month:
+        # 날짜 범위 조건 (인덱스 사용 가능) + proposal_month 조건 (월/처리구분/진행단계 복합 인덱스용)
+        try:
+            month_start, month_end = month_date_range(month)
+        except ValueError:
+            raise ValueError('월 형식이 잘못되었습니다. (YYYY-MM)')
+        where_conditions.append("b.proposal_month = %s")
+        where_conditions.append("b.proposal_date >= %s AND b.proposal_date < %s")
+        params_list.extend([month_start, month_start, month_end])
+        facet_filters['month'] = ("b.proposal_month = %s", [month_start])
+    
+    facet_conditions = list(where_conditions[:1])
+    facet_params = []
+    if search:
+        search_condition, search_params = build_search_condition(search, search_mode)
+        where_conditions.append(search_condition)
+        params_list.extend(search_params)
+        facet_conditions.append(search_condition)
+        facet_params.extend(search_params)
+        rank_params = [search, search, search, f'%{escape_like(search)}%']
+    else:
+        rank_params = []
+    
+    if pass_gubn:
+        where_conditions.append("b.pass_gubn = %s")
+        params_list.append(pass_gubn)
+        facet_filters['pass_gubn'] = ("b.pass_gubn = %s", [pass_gubn])
+    
+    if proc_stage:
+        where_conditions.append("b.proc_stage_cd = %s")
+        params_list.append(proc_stage)
+        facet_filters['proc_stage'] = ("b.proc_stage_cd = %s", [proc_stage])
+    
+    where_clause = " AND ".join(where_conditions)
+    count_query = f"""
+        SELECT COUNT(*) as total
+        FROM bills b
+        WHERE {where_clause}
+    """
+    
+    # 정렬 조건 구성
+    if cursor is not None:
+        # 커서 모드: 정렬 키 전체가 같은 방향이어야 행 비교 (a, b) < (x, y) 사용 가능
+        if sort_by == 'vote_count':
+            sort_keys = ["COALESCE(v_stats.vote_count, 0)", "b.proposal_date", "b.bill_id"]
+        elif sort_by == 'relevance':
+            sort_keys = [SEARCH_RANK_SQL, "b.proposal_date", "b.bill_id"]
+        else:
+            sort_keys = ["b.proposal_date", "b.bill_id"]
+        order_by = ", ".join(f"{key} {order.upper()}" for key in sort_keys)
         
-        # 정렬 조건 구성
+        page_conditions = list(where_conditions)
+        page_params = list(params_list)
+        if cursor:
+            cursor_values = decode_bills_cursor(cursor, sort_by, order)
+            comparator = '<' if order == 'desc' else '>'
+            placeholders = ", ".join(["%s"] * len(sort_keys))
+            page_conditions.append(f"({', '.join(sort_keys)}) {comparator} ({placeholders})")
+            if sort_by == 'relevance':
+                page_params.extend(rank_params)
+            page_params.extend(cursor_values)
+        page_where_clause = " AND ".join(page_conditions)
+        if sort_by == 'relevance':
+            # ORDER BY에서는 SELECT의 search_rank 별칭 사용 (파라미터 중복 방지)
+            order_by = f"search_rank {order.upper()}, b.proposal_date {order.upper()}, b.bill_id {order.upper()}"
+        limit_clause = "LIMIT %s"
+        query_params = tuple(rank_params) + tuple(page_params) + (per_page + 1,)
+    else:
         if sort_by == 'vote_count':
             order_by = f"vote_count {order.upper()}, b.proposal_date DESC"
+        elif sort_by == 'relevance':
+            order_by = f"search_rank {order.upper()}, b.proposal_date DESC"
         else:
             order_by = f"b.proposal_date {order.upper()}"
         
         # 전체 개수 조회 (votes 조인 제거 - 성능 향상)
-        count_query = f"""
-            SELECT COUNT(*) as total
-            FROM bills b
-            WHERE {where_clause}
-        """
         cur.execute(count_query, tuple(params_list))
         total = cur.fetchone()['total']
         
-        # 의안 목록 조회 (표결 결과는 서브쿼리로 - 성능 향상)
-        query = f"""
-            SELECT 
-                b.bill_id,
-                b.bill_no,
-                b.title,
-                b.proposal_date,
-                b.proposer_kind,
-                b.proposer_name,
-                b.proc_stage_cd,
-                b.pass_gubn,
-                b.proc_date,
-                b.general_result,
-                b.link_url,
-                COALESCE(v_stats.vote_count, 0) as vote_count,
-                COALESCE(v_stats.vote_for, 0) as vote_for,
-                COALESCE(v_stats.vote_against, 0) as vote_against,
-                COALESCE(v_stats.vote_abstain, 0) as vote_abstain,
-                COALESCE(v_stats.vote_absent, 0) as vote_absent,
-                COALESCE(v_stats.member_count, 0) as member_count
-            FROM bills b
-            LEFT JOIN (
-                SELECT 
-                    bill_id,
-                    COUNT(*) as vote_count,
-                    COUNT(*) FILTER (WHERE vote_result = '찬성') as vote_for,
-                    COUNT(*) FILTER (WHERE vote_result = '반대') as vote_against,
-                    COUNT(*) FILTER (WHERE vote_result = '기권') as vote_abstain,
-                    COUNT(*) FILTER (WHERE vote_result = '불참') as vote_absent,
-                    COUNT(DISTINCT member_no) as member_count
-                FROM votes
-                GROUP BY bill_id
-            ) v_stats ON b.bill_id = v_stats.bill_id
-            WHERE {where_clause}
-            ORDER BY {order_by}
-            LIMIT %s OFFSET %s
-        """
-        
-        offset = (page - 1) * per_page
-        query_params = tuple(params_list) + (per_page, offset)
-        cur.execute(query, query_params)
-        
-        bills = []
-        for row in cur.fetchall():
-            bill = dict(row)
-            # 날짜 형식 변환
-            bill['proposal_date'] = format_date_for_json(bill['proposal_date'])
-            bill['proc_date'] = format_date_for_json(bill['proc_date'])
-            bills.append(bill)
-        
-        return jsonify({
+        page_where_clause = where_clause
+        limit_clause = "LIMIT %s OFFSET %s"
+        query_params = tuple(rank_params) + tuple(params_list) + (per_page, (page - 1) * per_page)
+    
+    # 검색 시 관련도 점수와 스니펫용 헤드라인/요약 함께 조회
+    search_columns = ""
+    if search:
+        search_columns = f""",
+            {SEARCH_RANK_SQL} as search_rank,
+            b.headline as search_headline,
+            b.summary as search_summary"""
+    
+    # 의안 목록 조회 (표결 결과는 bill_vote_summary 집계 테이블에서 - votes 전체 집계 없음)
+    query = f"""
+        SELECT 
+            b.bill_id,
+            b.bill_no,
+            b.title,
+            b.proposal_date,
+            b.proposer_kind,
+            b.proposer_name,
+            b.proc_stage_cd,
+            b.pass_gubn,
+            b.proc_date,
+            b.general_result,
+            b.link_url,
+            COALESCE(v_stats.vote_count, 0) as vote_count,
+            COALESCE(v_stats.vote_for, 0) as vote_for,
+            COALESCE(v_stats.vote_against, 0) as vote_against,
+            COALESCE(v_stats.vote_abstain, 0) as vote_abstain,
+            COALESCE(v_stats.vote_absent, 0) as vote_absent,
+            COALESCE(v_stats.member_count, 0) as member_count{search_columns}
+        FROM bills b
+        LEFT JOIN bill_vote_summary v_stats ON b.bill_id = v_stats.bill_id
+        WHERE {page_where_clause}
+        ORDER BY {order_by}
+        {limit_clause}
+    """
+    cur.execute(query, query_params)
+    rows = cur.fetchall()
+    
+    if cursor is not None:
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+    
+    bills = []
+    for row in rows:
+        bill = dict(row)
+        if search:
+            bill['search_snippet'] = build_search_snippet(
+                search, bill.pop('search_headline'), bill.pop('search_summary')
+            )
+        bills.append(bill)
+    
+    if cursor is None:
+        result = {
             'bills': bills,
             'pagination': {
                 'page': page,
@@ -320,7 +512,72 @@ def get_bills():
                 'total': total,
                 'pages': (total + per_page - 1) // per_page
             }
-        })
+        }
+        if include_facets:
+            result['facets'] = fetch_bill_facets(cur, facet_conditions, facet_params, facet_filters)
+        return result
+    
+    next_cursor = None
+    if has_more and bills:
+        last = bills[-1]
+        key_values = [format_date_for_json(last['proposal_date']), last['bill_id']]
+        if sort_by == 'vote_count':
+            key_values.insert(0, last['vote_count'])
+        elif sort_by == 'relevance':
+            key_values.insert(0, last['search_rank'])
+        next_cursor = encode_bills_cursor(sort_by, order, key_values)
+    
+    pagination = {
+        'mode': 'cursor',
+        'per_page': per_page,
+        'next_cursor': next_cursor,
+        'has_more': next_cursor is not None
+    }
+    if include_total == 'exact':
+        cur.execute(count_query, tuple(params_list))
+        pagination['total'] = cur.fetchone()['total']
+        pagination['total_is_estimate'] = False
+    elif include_total == 'approx':
+        pagination['total'] = estimate_row_count(
+            cur, f"SELECT 1 FROM bills b WHERE {where_clause}", tuple(params_list)
+        )
+        pagination['total_is_estimate'] = True
+    if 'total' in pagination:
+        pagination['pages'] = max(1, (pagination['total'] + per_page - 1) // per_page)
+    
+    result = {
+        'bills': bills,
+        'pagination': pagination
+    }
+    if include_facets:
+        result['facets'] = fetch_bill_facets(cur, facet_conditions, facet_params, facet_filters)
+    return result
+
+@app.route('/api/bills')
+@cache.cached(timeout=60, tags=('bills', 'votes'), query_string=True, etag=True)  # 1분 캐시, 쿼리 파라미터별로 캐시, ETag
+def get_bills():
+    """의안 목록 조회 (월별 필터링, 제목 검색, 처리구분, 진행단계 필터 지원)
+
+    페이지 방식:
+    - page/per_page (기존): OFFSET 기반, 정확한 전체 개수 포함
+    - cursor (커서 모드): cursor 파라미터가 있으면 사용 (첫 페이지는 cursor=)
+      응답의 next_cursor로 다음 페이지 조회. 깊은 페이지도 인덱스 범위 스캔.
+      include_total=approx(추정) 또는 exact(COUNT)로 전체 개수 선택 포함
+
+    facets=1: 현재 조건 기준 처리구분/진행단계/월별 의안 수(facets) 포함. 각 항목은 자기 필터만 빼고 계산
+    (처리구분을 고른 상태에서도 다른 처리구분의 건수가 보임)
+
+    검색: search + search_mode(all, title, fuzzy). sort_by=relevance로 관련도순 정렬,
+    검색 결과에는 search_rank, search_snippet(강조 표시된 헤드라인/요약 일부) 포함
+    """
+    conn = get_db_pool().getconn()
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+    
+    try:
+        return jsonify(query_bills(cur, request.args))
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
     except Exception as e:
         print(f"의안 목록 조회 오류: {e}")
@@ -330,73 +587,93 @@ def get_bills():
     
     finally:
         cur.close()
-        conn.close()
+        get_db_pool().putconn(conn)
+
+# 의안 상세 응답 캐시
+# - 서버: 태그(bills, votes, members) 버전별로 응답 본문과 ETag 저장 → 다시 열 때 DB 조회 없음
+# - 클라이언트/CDN: ETag로 재검증(If-None-Match → 304). 브라우저는 매번 재검증, CDN은 잠시 캐시 후 백그라운드 재검증
+BILL_DETAIL_CACHE_TAGS = ('bills', 'votes', 'members')
+# Redis 캐시면 수집 스크립트의 태그 무효화가 보이므로 1시간 보관,
+# 로컬 캐시면 다른 프로세스의 무효화가 보이지 않으므로 CDN(s-maxage)과 같은 60초만 보관
+BILL_DETAIL_CACHE_TIMEOUT = 3600 if cache.stats()['backend'] == 'redis' else 60
+# 의안 상세 응답에 포함하는 bills 컬럼 (source_hash, bill_no_sort, proposal_month 등 내부용 컬럼 제외)
+BILL_DETAIL_COLUMNS = (
+    'bill_id', 'bill_no', 'title', 'proposal_date', 'proposer_kind', 'proposer_name', 'proposer_count',
+    'proc_stage_cd', 'proc_stage_order', 'pass_gubn', 'proc_date', 'general_result', 'link_url',
+    'summary_raw', 'headline', 'summary', 'categories', 'created_at', 'updated_at',
+)
+BILL_DETAIL_CACHE_CONTROL = 'public, max-age=0, s-maxage=60, stale-while-revalidate=300'
+
+def bill_detail_etag(bill_id, bill_updated_at, votes_updated_at, members_fingerprint):
+    """의안 상세 ETag: 의안 수정 시각 + 표결 집계 갱신 시각 + 의원 디렉터리 해시
+
+    수집/요약 스크립트가 의안을 바꾸면 bills.updated_at(트리거), 표결을 바꾸면
+    bill_vote_summary.updated_at이 달라진다. 의원 사진 등은 이 프로세스의 의원 디렉터리가 실제로 읽은
+    데이터의 해시를 쓴다 (로컬 캐시에서는 members 태그 버전이 바뀌지 않고 max_age마다 다시 읽으므로).
+    """
+    raw = f"{bill_id}|{bill_updated_at}|{votes_updated_at}|{members_fingerprint}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+def members_cache_version():
+    """members 태그 버전 (캐시 백엔드 오류 시 None)"""
+    try:
+        return cache.tag_versions(('members',))['members']
+    except Exception as e:
+        print(f"⚠️ 캐시 태그 버전 조회 오류: {e}")
+        return None
+
+# 의원 디렉터리: members 태그 버전이 바뀌면(의원 수집 스크립트 실행 후) 다시 읽음
+member_directory = MemberDirectory(version=members_cache_version)
+
+def conditional_json_response(body, etag, cache_control):
+    """JSON 본문에 ETag/Cache-Control을 붙이고 If-None-Match가 같으면 304로 응답"""
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control
+    return response.make_conditional(request)
 
 @app.route('/api/bills/<bill_id>')
 def get_bill_detail(bill_id):
-    """의안 상세 정보 조회"""
-    conn = get_db_connection()
+    """의안 상세 정보 조회 (ETag 지원, 서버 캐시에 있으면 DB 조회 없이 응답)"""
+    cache_key = f"bill_detail:{bill_id}"
+    cached_detail = cache.get(cache_key, BILL_DETAIL_CACHE_TAGS)
+    if cached_detail is not None:
+        body, etag = cached_detail
+        return conditional_json_response(body, etag, BILL_DETAIL_CACHE_CONTROL)
+    
+    conn = get_db_pool().getconn()
     cur = conn.cursor(cursor_factory=RealDictCursor)
     
     try:
-        # 의안 기본 정보 (서브쿼리로 최적화)
-        cur.execute("""
+        # 의안 기본 정보 + 표결 집계 (정당별 집계 포함, bill_vote_summary에서)
+        cur.execute(f"""
             SELECT 
-                b.*,
+                {', '.join('b.' + column for column in BILL_DETAIL_COLUMNS)},
                 COALESCE(v_stats.vote_count, 0) as vote_count,
                 COALESCE(v_stats.vote_for, 0) as vote_for,
                 COALESCE(v_stats.vote_against, 0) as vote_against,
                 COALESCE(v_stats.vote_abstain, 0) as vote_abstain,
                 COALESCE(v_stats.vote_absent, 0) as vote_absent,
-                COALESCE(v_stats.member_count, 0) as member_count
+                COALESCE(v_stats.member_count, 0) as member_count,
+                COALESCE(v_stats.party_votes, '[]'::jsonb) as party_votes,
+                v_stats.updated_at as votes_updated_at
             FROM bills b
-            LEFT JOIN (
-                SELECT 
-                    bill_id,
-                    COUNT(*) as vote_count,
-                    COUNT(*) FILTER (WHERE vote_result = '찬성') as vote_for,
-                    COUNT(*) FILTER (WHERE vote_result = '반대') as vote_against,
-                    COUNT(*) FILTER (WHERE vote_result = '기권') as vote_abstain,
-                    COUNT(*) FILTER (WHERE vote_result = '불참') as vote_absent,
-                    COUNT(DISTINCT member_no) as member_count
-                FROM votes
-                WHERE bill_id = %s
-                GROUP BY bill_id
-            ) v_stats ON b.bill_id = v_stats.bill_id
+            LEFT JOIN bill_vote_summary v_stats ON b.bill_id = v_stats.bill_id
             WHERE b.bill_id = %s
-        """, (bill_id, bill_id))
+        """, (bill_id,))
         
         bill = cur.fetchone()
         if not bill:
             return jsonify({'error': '의안을 찾을 수 없습니다.'}), 404
         
         bill_dict = dict(bill)
-        bill_dict['proposal_date'] = format_date_for_json(bill_dict['proposal_date'])
-        bill_dict['proc_date'] = format_date_for_json(bill_dict['proc_date'])
-        bill_dict['created_at'] = format_date_for_json(bill_dict['created_at'])
-        bill_dict['updated_at'] = format_date_for_json(bill_dict['updated_at'])
-        
-        # 정당별 표결 결과
-        cur.execute("""
-            SELECT 
-                v.party_name,
-                COUNT(*) as total,
-                COUNT(CASE WHEN v.vote_result = '찬성' THEN 1 END) as vote_for,
-                COUNT(CASE WHEN v.vote_result = '반대' THEN 1 END) as vote_against,
-                COUNT(CASE WHEN v.vote_result = '기권' THEN 1 END) as vote_abstain,
-                COUNT(CASE WHEN v.vote_result = '불참' THEN 1 END) as vote_absent
-            FROM votes v
-            WHERE v.bill_id = %s
-            AND v.party_name IS NOT NULL
-            GROUP BY v.party_name
-            ORDER BY total DESC
-        """, (bill_id,))
         
-        party_votes = []
-        for row in cur.fetchall():
-            party_votes.append(dict(row))
-        
-        bill_dict['party_votes'] = party_votes
+        # 의원 코드/사진은 assembly_members JOIN 대신 프로세스 내 의원 디렉터리에서 (버전이 바뀌었을 때만 다시 읽음)
+        member_directory.refresh(cur)
+        etag = bill_detail_etag(
+            bill_id, bill_dict['updated_at'], bill_dict.pop('votes_updated_at'),
+            member_directory.fingerprint
+        )
         
         # 의원별 표결 결과 (찬성/반대/기권/불참별로 분류)
         cur.execute("""
@@ -405,10 +682,10 @@ def get_bill_detail(bill_id):
                 v.party_name,
                 v.district_name,
                 v.vote_result,
-                am.member_id,
-                am.photo_url
+                v.member_id,
+                v.member_no,
+                v.mona_cd
             FROM votes v
-            LEFT JOIN assembly_members am ON v.member_id = am.member_id
             WHERE v.bill_id = %s
             AND v.member_name IS NOT NULL
             ORDER BY 
@@ -430,15 +707,16 @@ def get_bill_detail(bill_id):
             '불참': []
         }
         
-        for row in cur.fetchall():
-            vote_data = dict(row)
+        for vote_data in member_directory.decorate([dict(row) for row in cur.fetchall()]):
             vote_result = vote_data.get('vote_result', '')
             if vote_result in member_votes_by_result:
                 member_votes_by_result[vote_result].append(vote_data)
         
         bill_dict['member_votes_by_result'] = member_votes_by_result
         
-        return jsonify(bill_dict)
+        body = jsonify(bill_dict).get_data()
+        cache.set(cache_key, (body, etag), BILL_DETAIL_CACHE_TAGS, BILL_DETAIL_CACHE_TIMEOUT)
+        return conditional_json_response(body, etag, BILL_DETAIL_CACHE_CONTROL)
     
     except Exception as e:
         print(f"의안 상세 조회 오류: {e}")
@@ -448,29 +726,60 @@ def get_bill_detail(bill_id):
     
     finally:
         cur.close()
-        conn.close()
+        get_db_pool().putconn(conn)
+
+def fetch_month_options(cur):
+    """월 목록 (최근 월부터)"""
+    # proposal_month(생성 컬럼) 기준 그룹화 - 월별 복합 인덱스만으로 집계 가능
+    cur.execute("""
+        SELECT 
+            TO_CHAR(proposal_month, 'YYYY-MM') as month,
+            TO_CHAR(proposal_month, 'YYYY년 MM월') as month_label,
+            COUNT(*) as bill_count
+        FROM bills
+        WHERE proposal_date >= '2025-01-01'
+        GROUP BY proposal_month
+        ORDER BY proposal_month DESC
+    """)
+    return [dict(row) for row in cur.fetchall()]
+
+def fetch_pass_gubn_options(cur):
+    """처리구분 옵션 (의안 수 많은 순)"""
+    cur.execute("""
+        SELECT DISTINCT
+            pass_gubn,
+            COUNT(*) as bill_count
+        FROM bills
+        WHERE proposal_date >= '2025-01-01'
+        AND pass_gubn IS NOT NULL
+        GROUP BY pass_gubn
+        ORDER BY bill_count DESC
+    """)
+    return [dict(row) for row in cur.fetchall()]
+
+def fetch_proc_stage_options(cur):
+    """진행단계 옵션 (의안 수 많은 순)"""
+    cur.execute("""
+        SELECT DISTINCT
+            proc_stage_cd,
+            COUNT(*) as bill_count
+        FROM bills
+        WHERE proposal_date >= '2025-01-01'
+        AND proc_stage_cd IS NOT NULL
+        GROUP BY proc_stage_cd
+        ORDER BY bill_count DESC
+    """)
+    return [dict(row) for row in cur.fetchall()]
 
 @app.route('/api/months')
-@cache.cached(timeout=600)  # 10분 캐시 (월별 데이터는 자주 변경되지 않음)
+@cache.cached(timeout=600, tags=('bills',))  # 10분 캐시 (월별 데이터는 자주 변경되지 않음)
 def get_available_months():
     """사용 가능한 월 목록 조회"""
-    conn = get_db_connection()
+    conn = get_db_pool().getconn()
     cur = conn.cursor(cursor_factory=RealDictCursor)
     
     try:
-        cur.execute("""
-            SELECT DISTINCT
-                TO_CHAR(proposal_date, 'YYYY-MM') as month,
-                TO_CHAR(proposal_date, 'YYYY년 MM월') as month_label,
-                COUNT(*) as bill_count
-            FROM bills
-            WHERE proposal_date >= '2025-01-01'
-            GROUP BY TO_CHAR(proposal_date, 'YYYY-MM'), TO_CHAR(proposal_date, 'YYYY년 MM월')
-            ORDER BY month DESC
-        """)
-        
-        months = [dict(row) for row in cur.fetchall()]
-        return jsonify({'months': months})
+        return jsonify({'months': fetch_month_options(cur)})
     
     except Exception as e:
         print(f"월 목록 조회 오류: {e}")
@@ -478,29 +787,17 @@ def get_available_months():
     
     finally:
         cur.close()
-        conn.close()
+        get_db_pool().putconn(conn)
 
 @app.route('/api/pass_gubn_options')
-@cache.cached(timeout=600)  # 10분 캐시
+@cache.cached(timeout=600, tags=('bills',))  # 10분 캐시
 def get_pass_gubn_options():
-    """처리구분 옵션 목록 조회"""
-    conn = get_db_connection()
+    """처리구분 옵션 목록 조회 (전체 기준. 현재 필터 기준 건수는 /api/bills?facets=1)"""
+    conn = get_db_pool().getconn()
     cur = conn.cursor(cursor_factory=RealDictCursor)
     
     try:
-        cur.execute("""
-            SELECT DISTINCT
-                pass_gubn,
-                COUNT(*) as bill_count
-            FROM bills
-            WHERE proposal_date >= '2025-01-01'
-            AND pass_gubn IS NOT NULL
-            GROUP BY pass_gubn
-            ORDER BY bill_count DESC
-        """)
-        
-        options = [dict(row) for row in cur.fetchall()]
-        return jsonify({'options': options})
+        return jsonify({'options': fetch_pass_gubn_options(cur)})
     
     except Exception as e:
         print(f"처리구분 옵션 조회 오류: {e}")
@@ -508,29 +805,17 @@ def get_pass_gubn_options():
     
     finally:
         cur.close()
-        conn.close()
+        get_db_pool().putconn(conn)
 
 @app.route('/api/proc_stage_options')
-@cache.cached(timeout=600)  # 10분 캐시
+@cache.cached(timeout=600, tags=('bills',))  # 10분 캐시
 def get_proc_stage_options():
-    """진행단계 옵션 목록 조회"""
-    conn = get_db_connection()
+    """진행단계 옵션 목록 조회 (전체 기준. 현재 필터 기준 건수는 /api/bills?facets=1)"""
+    conn = get_db_pool().getconn()
     cur = conn.cursor(cursor_factory=RealDictCursor)
     
     try:
-        cur.execute("""
-            SELECT DISTINCT
-                proc_stage_cd,
-                COUNT(*) as bill_count
-            FROM bills
-            WHERE proposal_date >= '2025-01-01'
-            AND proc_stage_cd IS NOT NULL
-            GROUP BY proc_stage_cd
-            ORDER BY bill_count DESC
-        """)
-        
-        options = [dict(row) for row in cur.fetchall()]
-        return jsonify({'options': options})
+        return jsonify({'options': fetch_proc_stage_options(cur)})
     
     except Exception as e:
         print(f"진행단계 옵션 조회 오류: {e}")
@@ -538,7 +823,49 @@ def get_proc_stage_options():
     
     finally:
         cur.close()
-        conn.close()
+        get_db_pool().putconn(conn)
+
+# 첫 화면 의안 목록 기본 조건 (static/js/app.js의 loadBills 첫 페이지 요청과 동일)
+BOOTSTRAP_BILLS_DEFAULTS = {
+    'cursor': '',
+    'per_page': '20',
+    'sort_by': 'proposal_date',
+    'order': 'desc',
+    'include_total': 'approx',
+    'facets': '1'
+}
+
+@app.route('/api/bootstrap')
+@cache.cached(timeout=60, tags=('bills', 'votes'), query_string=True)  # 1분 캐시 (의안 목록과 동일)
+def get_bootstrap():
+    """첫 화면 데이터 (통계, 필터 옵션, 의안 목록 첫 페이지)를 한 번의 요청과 하나의 연결로 조회
+
+    쿼리 파라미터(month, search, pass_gubn, proc_stage, sort_by, order 등)는 /api/bills와 같고
+    없으면 BOOTSTRAP_BILLS_DEFAULTS 사용. 필터 옵션은 현재 조건 기준 패싯(facets)으로 제공:
+    {stats, bills, pagination, facets: {pass_gubn, proc_stage, month}}
+    """
+    bills_args = dict(BOOTSTRAP_BILLS_DEFAULTS)
+    bills_args.update(request.args.to_dict())
+    conn = get_db_pool().getconn()
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+    
+    try:
+        payload = query_bills(cur, bills_args)
+        payload['stats'] = fetch_stats(cur)
+        return jsonify(payload)
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    except Exception as e:
+        print(f"첫 화면 데이터 조회 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+    
+    finally:
+        cur.close()
+        get_db_pool().putconn(conn)
 
 def get_table_korean_info(table_name):
     """테이블명에 대한 한글명과 설명 반환"""
@@ -571,6 +898,10 @@ def get_table_korean_info(table_name):
             'name': '진행 단계 매핑',
             'description': '의안의 진행 단계 코드(접수, 심사, 본회의, 처리완료 등)를 읽기 쉬운 이름으로 매핑하는 설정 테이블입니다.'
         },
+        'bill_vote_summary': {
+            'name': '의안별 표결 집계',
+            'description': '표결 정보를 의안별로 미리 집계한 테이블입니다. 의안 목록/상세 조회 시 votes 전체를 집계하지 않도록 표결 수집 시 함께 갱신됩니다.'
+        },
         'bill_similarity': {
             'name': '의안 유사도',
             'description': '의안 간의 유사도를 계산한 결과를 저장하는 테이블입니다. 유사도 점수(0.0~1.0)로 저장되며, 하나의 계산 방법을 사용합니다. (추후 기능)'
@@ -704,6 +1035,17 @@ def get_column_korean_name(table_name, column_name):
             'stage_order': '진행 단계 순서',
             'description': '설명',
         },
+        'bill_vote_summary': {
+            'bill_id': '의안ID',
+            'vote_count': '전체 표결 수',
+            'vote_for': '찬성 수',
+            'vote_against': '반대 수',
+            'vote_abstain': '기권 수',
+            'vote_absent': '불참 수',
+            'member_count': '참여 의원 수',
+            'party_votes': '정당별 표결 집계',
+            'updated_at': '갱신일시',
+        },
         'bill_similarity': {
             'bill_id_1': '의안ID 1',
             'bill_id_2': '의안ID 2',
@@ -717,7 +1059,7 @@ def get_column_korean_name(table_name, column_name):
 @app.route('/db-structure')
 def db_structure():
     """데이터베이스 테이블 구조 조회"""
-    conn = get_db_connection()
+    conn = get_db_pool().getconn()
     cur = conn.cursor(cursor_factory=RealDictCursor)
     
     try:
@@ -845,133 +1187,61 @@ def db_structure():
     
     finally:
         cur.close()
-        conn.close()
+        get_db_pool().putconn(conn)
 
 @app.route('/members/quality')
 def members_quality_dashboard():
     """의원 정보 데이터 품질 대시보드"""
     return render_template('members_quality.html')
 
+# 의원 정보 품질 점검 필드
+MEMBER_QUALITY_FIELDS = [
+    ('name', '의원명'),
+    ('name_chinese', '한자명'),
+    ('name_english', '영문명'),
+    ('party', '정당명'),
+    ('district', '선거구'),
+    ('district_type', '선거구 구분'),
+    ('committee', '소속위원회'),
+    ('current_committee', '현재위원회'),
+    ('era', '당선 대수'),
+    ('election_type', '선거 구분'),
+    ('gender', '성별'),
+    ('birth_date', '생년월일'),
+    ('birth_type', '생년 구분'),
+    ('duty_name', '직책명'),
+    ('phone', '전화번호'),
+    ('email', '이메일'),
+    ('homepage_url', '홈페이지'),
+    ('office_room', '사무실 호수'),
+    ('aide_name', '보좌관'),
+    ('secretary_name', '비서'),
+    ('assistant_name', '조수'),
+    ('photo_url', '사진 URL'),
+    ('brief_history', '약력'),
+    ('mona_cd', 'MONA 코드'),
+    ('member_no', '의원번호'),
+]
+
 @app.route('/api/members/quality/stats')
-@cache.cached(timeout=300)  # 5분 캐시
+@cache.cached(timeout=300, tags=('members',))  # 5분 캐시
 def get_members_quality_stats():
-    """의원 정보 데이터 품질 통계"""
-    conn = get_db_connection()
+    """의원 정보 데이터 품질 통계 (필드별 통계와 의원별 완성도를 한 번의 스캔으로 계산)"""
+    conn = get_db_pool().getconn()
     cur = conn.cursor(cursor_factory=RealDictCursor)
     
     try:
-        # 전체 의원 수
-        cur.execute("SELECT COUNT(*) as total FROM assembly_members")
-        total = cur.fetchone()['total']
-        
-        # 필드별 NULL 비율 계산
-        fields = [
-            ('name', '의원명'),
-            ('name_chinese', '한자명'),
-            ('name_english', '영문명'),
-            ('party', '정당명'),
-            ('district', '선거구'),
-            ('district_type', '선거구 구분'),
-            ('committee', '소속위원회'),
-            ('current_committee', '현재위원회'),
-            ('era', '당선 대수'),
-            ('election_type', '선거 구분'),
-            ('gender', '성별'),
-            ('birth_date', '생년월일'),
-            ('birth_type', '생년 구분'),
-            ('duty_name', '직책명'),
-            ('phone', '전화번호'),
-            ('email', '이메일'),
-            ('homepage_url', '홈페이지'),
-            ('office_room', '사무실 호수'),
-            ('aide_name', '보좌관'),
-            ('secretary_name', '비서'),
-            ('assistant_name', '조수'),
-            ('photo_url', '사진 URL'),
-            ('brief_history', '약력'),
-            ('mona_cd', 'MONA 코드'),
-            ('member_no', '의원번호'),
-        ]
-        
-        field_stats = []
-        for field, label in fields:
-            cur.execute(f"""
-                SELECT 
-                    COUNT(*) as total,
-                    COUNT({field}) as filled,
-                    COUNT(*) - COUNT({field}) as missing
-                FROM assembly_members
-            """)
-            result = cur.fetchone()
-            filled = result['filled']
-            missing = result['missing']
-            completion_rate = (filled / total * 100) if total > 0 else 0
-            
-            field_stats.append({
-                'field': field,
-                'label': label,
-                'total': total,
-                'filled': filled,
-                'missing': missing,
-                'completion_rate': round(completion_rate, 1)
-            })
-        
-        # 의원별 데이터 완성도
-        cur.execute("""
-            SELECT 
-                member_id,
-                name,
-                party,
-                district,
-                (
-                    CASE WHEN name IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN name_chinese IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN name_english IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN party IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN district IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN district_type IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN committee IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN current_committee IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN era IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN election_type IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN gender IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN birth_date IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN birth_type IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN duty_name IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN phone IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN email IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN homepage_url IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN office_room IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN aide_name IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN secretary_name IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN assistant_name IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN photo_url IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN brief_history IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN mona_cd IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN member_no IS NOT NULL THEN 1 ELSE 0 END
-                ) as filled_fields,
-                25 as total_fields
-            FROM assembly_members
-            ORDER BY filled_fields ASC, name ASC
-        """)
-        
-        members = []
-        for row in cur.fetchall():
-            completion_rate = (row['filled_fields'] / row['total_fields'] * 100) if row['total_fields'] > 0 else 0
-            members.append({
-                'member_id': row['member_id'],
-                'name': row['name'],
-                'party': row['party'],
-                'district': row['district'],
-                'filled_fields': row['filled_fields'],
-                'total_fields': row['total_fields'],
-                'completion_rate': round(completion_rate, 1)
-            })
+        profile = quality_profile(
+            cur, 'assembly_members', MEMBER_QUALITY_FIELDS,
+            row_columns=['member_id', 'name', 'party', 'district'],
+            order_by='filled_fields ASC, name ASC',
+            cache=cache, cache_tags=('members',)
+        )
         
         return jsonify({
-            'total_members': total,
-            'field_stats': field_stats,
-            'members': members
+            'total_members': profile.total,
+            'field_stats': profile.field_stats(),
+            'members': profile.row_stats()
         })
     
     except Exception as e:
@@ -980,161 +1250,70 @@ def get_members_quality_stats():
     
     finally:
         cur.close()
-        conn.close()
+        get_db_pool().putconn(conn)
 
 @app.route('/bills/quality')
 def bills_quality_dashboard():
     """의안 정보 데이터 품질 대시보드"""
     return render_template('bills_quality.html')
 
+# 의안 정보 품질 점검 필드 (텍스트 필드는 빈 문자열, JSONB 필드는 빈 객체도 누락으로 처리)
+BILL_QUALITY_FIELDS = [
+    ('bill_id', '의안ID', 'default'),
+    ('bill_no', '의안번호', 'default'),
+    ('title', '의안명', 'default'),
+    ('proposal_date', '제안일', 'default'),
+    ('proposer_kind', '제안자구분', 'default'),
+    ('proposer_name', '제안자명', 'default'),
+    ('proc_stage_cd', '진행단계', 'default'),
+    ('pass_gubn', '처리구분', 'default'),
+    ('proc_date', '처리일', 'default'),
+    ('general_result', '일반결과', 'default'),
+    ('summary_raw', '원문내용', 'text'),
+    ('headline', 'AI 헤드라인', 'text'),
+    ('summary', 'AI 요약', 'text'),
+    ('categories', '카테고리', 'jsonb'),
+    ('vote_for', '찬성 가중치', 'jsonb'),
+    ('vote_against', '반대 가중치', 'jsonb'),
+    ('proc_stage_order', '진행단계 순서', 'default'),
+    ('proposer_count', '제안자 수', 'default'),
+    ('link_url', '링크 URL', 'text'),
+]
+
 @app.route('/api/bills/quality/stats')
-@cache.cached(timeout=300)  # 5분 캐시
+@cache.cached(timeout=300, tags=('bills',))  # 5분 캐시
 def get_bills_quality_stats():
-    """의안 정보 데이터 품질 통계"""
-    conn = get_db_connection()
+    """의안 정보 데이터 품질 통계 (필드별 통계와 의안별 완성도를 한 번의 스캔으로 계산)"""
+    conn = get_db_pool().getconn()
     cur = conn.cursor(cursor_factory=RealDictCursor)
     
     try:
-        # 전체 의안 수
-        cur.execute("SELECT COUNT(*) as total FROM bills WHERE proposal_date >= '2025-01-01'")
-        total = cur.fetchone()['total']
+        profile = quality_profile(
+            cur, 'bills', BILL_QUALITY_FIELDS,
+            where="proposal_date >= '2025-01-01'",
+            row_columns=['bill_id', 'bill_no', 'title', 'proposer_kind', 'pass_gubn', 'proc_stage_cd', 'proposal_date'],
+            order_by='filled_fields ASC, proposal_date DESC',
+            cache=cache, cache_tags=('bills',)
+        )
         
-        # 필드별 NULL 비율 계산
-        # 텍스트 필드는 NULL과 빈 문자열 모두 체크
-        fields = [
-            ('bill_id', '의안ID', 'default'),
-            ('bill_no', '의안번호', 'default'),
-            ('title', '의안명', 'default'),
-            ('proposal_date', '제안일', 'default'),
-            ('proposer_kind', '제안자구분', 'default'),
-            ('proposer_name', '제안자명', 'default'),
-            ('proc_stage_cd', '진행단계', 'default'),
-            ('pass_gubn', '처리구분', 'default'),
-            ('proc_date', '처리일', 'default'),
-            ('general_result', '일반결과', 'default'),
-            ('summary_raw', '원문내용', 'text'),  # 텍스트 필드: 빈 문자열도 체크
-            ('headline', 'AI 헤드라인', 'text'),  # 텍스트 필드: 빈 문자열도 체크
-            ('summary', 'AI 요약', 'text'),  # 텍스트 필드: 빈 문자열도 체크
-            ('categories', '카테고리', 'jsonb'),  # JSONB 필드
-            ('vote_for', '찬성 가중치', 'jsonb'),  # JSONB 필드
-            ('vote_against', '반대 가중치', 'jsonb'),  # JSONB 필드
-            ('proc_stage_order', '진행단계 순서', 'default'),
-            ('proposer_count', '제안자 수', 'default'),
-            ('link_url', '링크 URL', 'text'),  # 텍스트 필드: 빈 문자열도 체크
-        ]
+        bills = profile.row_stats()
+        for bill in bills:
+            del bill['proposal_date']  # 정렬용
         
-        field_stats = []
-        for field, label, field_type in fields:
-            if field_type == 'text':
-                # 텍스트 필드: NULL과 빈 문자열(공백 제거 후) 모두 체크
-                cur.execute(f"""
-                    SELECT 
-                        COUNT(*) as total,
-                        COUNT(*) FILTER (WHERE {field} IS NOT NULL AND TRIM({field}) != '') as filled,
-                        COUNT(*) FILTER (WHERE {field} IS NULL OR TRIM({field}) = '') as missing
-                    FROM bills
-                    WHERE proposal_date >= '2025-01-01'
-                """)
-            elif field_type == 'jsonb':
-                # JSONB 필드: NULL과 빈 객체 체크
-                cur.execute(f"""
-                    SELECT 
-                        COUNT(*) as total,
-                        COUNT(*) FILTER (WHERE {field} IS NOT NULL AND {field} != 'null'::jsonb AND {field} != '{{}}'::jsonb) as filled,
-                        COUNT(*) FILTER (WHERE {field} IS NULL OR {field} = 'null'::jsonb OR {field} = '{{}}'::jsonb) as missing
-                    FROM bills
-                    WHERE proposal_date >= '2025-01-01'
-                """)
-            else:
-                # 기본 필드: NULL만 체크
-                cur.execute(f"""
-                    SELECT 
-                        COUNT(*) as total,
-                        COUNT({field}) as filled,
-                        COUNT(*) - COUNT({field}) as missing
-                    FROM bills
-                    WHERE proposal_date >= '2025-01-01'
-                """)
-            
-            result = cur.fetchone()
-            filled = result['filled']
-            missing = result['missing']
-            completion_rate = (filled / total * 100) if total > 0 else 0
-            
-            field_stats.append({
-                'field': field,
-                'label': label,
-                'total': total,
-                'filled': filled,
-                'missing': missing,
-                'completion_rate': round(completion_rate, 1)
-            })
-        
-        # 의안별 데이터 완성도
-        cur.execute("""
-            SELECT 
-                bill_id,
-                bill_no,
-                title,
-                proposer_kind,
-                pass_gubn,
-                proc_stage_cd,
-                (
-                    CASE WHEN bill_id IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN bill_no IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN title IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN proposal_date IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN proposer_kind IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN proposer_name IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN proc_stage_cd IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN pass_gubn IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN proc_date IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN general_result IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN summary_raw IS NOT NULL AND TRIM(summary_raw) != '' THEN 1 ELSE 0 END +
-                    CASE WHEN headline IS NOT NULL AND TRIM(headline) != '' THEN 1 ELSE 0 END +
-                    CASE WHEN summary IS NOT NULL AND TRIM(summary) != '' THEN 1 ELSE 0 END +
-                    CASE WHEN categories IS NOT NULL AND categories != 'null'::jsonb AND categories != '{}'::jsonb THEN 1 ELSE 0 END +
-                    CASE WHEN vote_for IS NOT NULL AND vote_for != 'null'::jsonb AND vote_for != '{}'::jsonb THEN 1 ELSE 0 END +
-                    CASE WHEN vote_against IS NOT NULL AND vote_against != 'null'::jsonb AND vote_against != '{}'::jsonb THEN 1 ELSE 0 END +
-                    CASE WHEN proc_stage_order IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN proposer_count IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN link_url IS NOT NULL AND TRIM(link_url) != '' THEN 1 ELSE 0 END
-                ) as filled_fields,
-                19 as total_fields
-            FROM bills
-            WHERE proposal_date >= '2025-01-01'
-            ORDER BY filled_fields ASC, proposal_date DESC
-        """)
-        
-        bills = []
-        for row in cur.fetchall():
-            completion_rate = (row['filled_fields'] / row['total_fields'] * 100) if row['total_fields'] > 0 else 0
-            bills.append({
-                'bill_id': row['bill_id'],
-                'bill_no': row['bill_no'],
-                'title': row['title'],
-                'proposer_kind': row['proposer_kind'],
-                'pass_gubn': row['pass_gubn'],
-                'proc_stage_cd': row['proc_stage_cd'],
-                'filled_fields': row['filled_fields'],
-                'total_fields': row['total_fields'],
-                'completion_rate': round(completion_rate, 1)
-            })
-        
-        # 표결 결과 연결 통계
+        # 표결 결과 연결 통계 (bill_vote_summary 집계 테이블 사용)
         cur.execute("""
             SELECT 
-                COUNT(DISTINCT b.bill_id) FILTER (WHERE v.bill_id IS NOT NULL) as bills_with_votes,
-                COUNT(DISTINCT b.bill_id) FILTER (WHERE v.bill_id IS NULL) as bills_without_votes
+                COUNT(*) FILTER (WHERE s.bill_id IS NOT NULL) as bills_with_votes,
+                COUNT(*) FILTER (WHERE s.bill_id IS NULL) as bills_without_votes
             FROM bills b
-            LEFT JOIN votes v ON b.bill_id = v.bill_id
+            LEFT JOIN bill_vote_summary s ON b.bill_id = s.bill_id AND s.vote_count > 0
             WHERE b.proposal_date >= '2025-01-01'
         """)
         vote_stats = cur.fetchone()
         
         return jsonify({
-            'total_bills': total,
-            'field_stats': field_stats,
+            'total_bills': profile.total,
+            'field_stats': profile.field_stats(),
             'bills': bills,
             'vote_stats': {
                 'bills_with_votes': vote_stats['bills_with_votes'],
@@ -1148,12 +1327,57 @@ def get_bills_quality_stats():
     
     finally:
         cur.close()
-        conn.close()
+        get_db_pool().putconn(conn)
+
+# 표결 정보 품질 점검 필드 (행 수가 많아 필드별 집계만 제공)
+VOTE_QUALITY_FIELDS = [
+    ('bill_id', '의안ID'),
+    ('bill_no', '의안번호'),
+    ('bill_name', '의안명', 'text'),
+    ('member_no', '의원번호'),
+    ('mona_cd', 'MONA 코드'),
+    ('member_id', '의원코드'),
+    ('member_name', '의원명', 'text'),
+    ('party_name', '정당명', 'text'),
+    ('district_name', '선거구명', 'text'),
+    ('vote_result', '표결결과', 'text'),
+    ('vote_date', '표결일시'),
+    ('era', '국회 대수'),
+    ('session_code', '회기 코드'),
+    ('current_committee', '현재 위원회', 'text'),
+]
+
+@app.route('/api/votes/quality/stats')
+@cache.cached(timeout=300, tags=('votes',))  # 5분 캐시
+def get_votes_quality_stats():
+    """표결 정보 데이터 품질 통계 (필드별 채움 비율, 집계 쿼리 1회)"""
+    conn = get_db_pool().getconn()
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+    
+    try:
+        profile = quality_profile(
+            cur, 'votes', VOTE_QUALITY_FIELDS,
+            where="vote_date >= '2025-01-01'",
+            cache=cache, cache_tags=('votes',)
+        )
+        
+        return jsonify({
+            'total_votes': profile.total,
+            'field_stats': profile.field_stats()
+        })
+    
+    except Exception as e:
+        print(f"표결 품질 통계 조회 오류: {e}")
+        return jsonify({'error': str(e)}), 500
+    
+    finally:
+        cur.close()
+        get_db_pool().putconn(conn)
 
 @app.route('/api/bills/quality/detail/<bill_id>')
 def get_bill_quality_detail(bill_id):
     """특정 의안의 데이터 상세 정보"""
-    conn = get_db_connection()
+    conn = get_db_pool().getconn()
     cur = conn.cursor(cursor_factory=RealDictCursor)
     
     try:
@@ -1238,12 +1462,12 @@ def get_bill_quality_detail(bill_id):
     
     finally:
         cur.close()
-        conn.close()
+        get_db_pool().putconn(conn)
 
 @app.route('/api/members/quality/detail/<member_id>')
 def get_member_quality_detail(member_id):
     """특정 의원의 데이터 상세 정보"""
-    conn = get_db_connection()
+    conn = get_db_pool().getconn()
     cur = conn.cursor(cursor_factory=RealDictCursor)
     
     try:
@@ -1332,7 +1556,7 @@ def get_member_quality_detail(member_id):
     
     finally:
         cur.close()
-        conn.close()
+        get_db_pool().putconn(conn)
 
 if __name__ == '__main__':
     print("=" * 60)
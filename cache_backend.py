@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""
+공용 캐시 백엔드 (태그 기반 무효화)
+
+- RedisCacheBackend: CACHE_REDIS_URL 설정 시 사용 (gunicorn 워커와 수집 스크립트가 같은 캐시 공유)
+- LocalCacheBackend: 프로세스 내 메모리 캐시 (Redis 없이 동일하게 동작, 개발/테스트용)
+
+태그(bills, votes, members)마다 버전 번호를 저장하고 캐시 키에 포함한다.
+invalidate('bills')는 버전만 올리므로 이전 항목은 더 이상 조회되지 않고 TTL이 지나면 사라진다.
+
+환경 변수:
+    CACHE_REDIS_URL     Redis 주소 (예: redis://localhost:6379/0, 없으면 로컬 캐시)
+    CACHE_KEY_PREFIX    키 접두어 (기본: mypoly)
+
+수집 스크립트에서 사용 예:
+    sys.path.insert(0, project_root)
+    from cache_backend import publish_invalidation
+
+    conn.commit()
+    publish_invalidation('bills')
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+import time
+from functools import wraps
+from urllib.parse import urlencode
+
+CACHE_TAGS = ('bills', 'votes', 'members')
+
+
+class LocalCacheBackend:
+    """프로세스 내 메모리 캐시 (스레드 안전, 만료/최대 개수 관리)"""
+
+    def __init__(self, max_entries=1000):
+        self.max_entries = max_entries
+        self._data = {}  # key -> (만료 시각 또는 None, 값)
+        self._lock = threading.Lock()
+
+    def _get_live(self, key, now):
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at is not None and expires_at <= now:
+            del self._data[key]
+            return None
+        return value
+
+    def get(self, key):
+        with self._lock:
+            return self._get_live(key, time.monotonic())
+
+    def get_many(self, keys):
+        now = time.monotonic()
+        with self._lock:
+            return [self._get_live(key, now) for key in keys]
+
+    def set(self, key, value, timeout=None):
+        now = time.monotonic()
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.max_entries:
+                self._prune(now)
+            self._data[key] = ((now + timeout) if timeout else None, value)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def incr(self, key):
+        with self._lock:
+            value = (self._get_live(key, time.monotonic()) or 0) + 1
+            self._data[key] = (None, value)
+            return value
+
+    def get_counters(self, keys):
+        return self.get_many(keys)
+
+    def _prune(self, now):
+        """만료 항목 제거 후에도 가득 차 있으면 먼저 만료될 항목부터 제거 (태그 버전은 유지)"""
+        for key in [k for k, (exp, _) in self._data.items() if exp is not None and exp <= now]:
+            del self._data[key]
+        overflow = len(self._data) - self.max_entries + 1
+        if overflow > 0:
+            expiring = sorted((exp, k) for k, (exp, _) in self._data.items() if exp is not None)
+            for _, key in expiring[:overflow]:
+                del self._data[key]
+
+
+class RedisCacheBackend:
+    """Redis 캐시 (redis 패키지 필요, 값은 pickle로 저장)"""
+
+    def __init__(self, url, socket_timeout=2.0):
+        import redis  # 선택 의존성: CACHE_REDIS_URL을 쓸 때만 필요
+        self._client = redis.Redis.from_url(url, socket_timeout=socket_timeout)
+
+    def get(self, key):
+        raw = self._client.get(key)
+        return pickle.loads(raw) if raw is not None else None
+
+    def get_many(self, keys):
+        return [pickle.loads(raw) if raw is not None else None for raw in self._client.mget(keys)]
+
+    def set(self, key, value, timeout=None):
+        self._client.set(key, pickle.dumps(value), ex=int(timeout) if timeout else None)
+
+    def delete(self, key):
+        self._client.delete(key)
+
+    def incr(self, key):
+        return self._client.incr(key)
+
+    def ping(self):
+        return self._client.ping()
+
+    def get_counters(self, keys):
+        """incr로 만든 값 조회 (pickle이 아닌 정수 문자열로 저장됨)"""
+        return [int(raw) if raw is not None else None for raw in self._client.mget(keys)]
+
+
+class TaggedCache:
+    """태그 버전을 키에 포함하는 캐시 (백엔드 공통)"""
+
+    def __init__(self, backend, prefix='mypoly'):
+        self.backend = backend
+        self.prefix = prefix
+        self._stats = {'hits': 0, 'misses': 0, 'errors': 0, 'invalidations': 0}
+        self._lock = threading.Lock()
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _tag_key(self, tag):
+        return f"{self.prefix}:tag:{tag}"
+
+    def tag_versions(self, tags):
+        """태그별 현재 버전 (한 번의 조회로 가져옴)"""
+        values = self.backend.get_counters([self._tag_key(tag) for tag in tags])
+        return {tag: value or 0 for tag, value in zip(tags, values)}
+
+    def make_key(self, key, tags):
+        versions = self.tag_versions(tags)
+        version_part = ",".join(f"{tag}={versions[tag]}" for tag in sorted(tags))
+        return f"{self.prefix}:{key}:{version_part}"
+
+    def get(self, key, tags=()):
+        try:
+            value = self.backend.get(self.make_key(key, tags))
+        except Exception as e:
+            print(f"⚠️ 캐시 조회 오류: {e}")
+            self._count('errors')
+            return None
+        self._count('hits' if value is not None else 'misses')
+        return value
+
+    def set(self, key, value, tags=(), timeout=300):
+        try:
+            self.backend.set(self.make_key(key, tags), value, timeout)
+        except Exception as e:
+            print(f"⚠️ 캐시 저장 오류: {e}")
+            self._count('errors')
+
+    def invalidate(self, *tags):
+        """태그 버전 증가 → 해당 태그가 붙은 캐시 항목 전체 무효화"""
+        for tag in tags:
+            if tag not in CACHE_TAGS:
+                raise ValueError(f"알 수 없는 캐시 태그: {tag}")
+            self.backend.incr(self._tag_key(tag))
+            self._count('invalidations')
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        stats['backend'] = 'redis' if isinstance(self.backend, RedisCacheBackend) else 'local'
+        return stats
+
+    def cached(self, timeout=300, tags=(), query_string=False, unless=None, etag=False):
+        """Flask 뷰 응답 캐시 데코레이터 (200 응답만 저장)
+
+        - tags: 이 응답이 의존하는 데이터 태그 (invalidate 시 함께 무효화)
+        - query_string: 쿼리 파라미터별로 따로 캐시
+        - unless: True를 반환하면 캐시를 사용하지 않음 (인자 없는 함수)
+        - etag: 본문 해시로 ETag를 붙이고 If-None-Match가 같으면 304 (본문 전송 생략)
+        """
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                from flask import current_app, request
+
+                if unless is not None and unless():
+                    return view(*args, **kwargs)
+
+                key = f"view:{request.path}"
+                if query_string:
+                    args_encoded = urlencode(sorted(request.args.items(multi=True)))
+                    key += ":" + hashlib.md5(args_encoded.encode('utf-8')).hexdigest()
+
+                cached_value = self.get(key, tags)
+                if cached_value is not None:
+                    body, mimetype = cached_value
+                    response = current_app.response_class(body, mimetype=mimetype)
+                else:
+                    response = current_app.make_response(view(*args, **kwargs))
+                    if response.status_code != 200 or response.direct_passthrough:
+                        return response
+                    body = response.get_data()
+                    self.set(key, (body, response.mimetype), tags, timeout)
+
+                if etag:
+                    response.set_etag(hashlib.md5(body).hexdigest())
+                    return response.make_conditional(request)
+                return response
+            return wrapper
+        return decorator
+
+
+def cache_from_env(prefix=None):
+    """환경 변수에 따라 Redis 또는 로컬 캐시 생성 (Redis 연결 실패 시 로컬로 대체)"""
+    prefix = prefix or os.environ.get('CACHE_KEY_PREFIX', 'mypoly')
+    redis_url = os.environ.get('CACHE_REDIS_URL')
+    if redis_url:
+        try:
+            backend = RedisCacheBackend(redis_url)
+            backend.ping()  # 연결 확인
+            return TaggedCache(backend, prefix)
+        except Exception as e:
+            print(f"⚠️ Redis 캐시 사용 불가, 로컬 캐시로 대체: {e}")
+    return TaggedCache(LocalCacheBackend(), prefix)
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+def get_shared_cache():
+    """프로세스 공용 캐시 (최초 사용 시 생성)"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = cache_from_env()
+    return _shared_cache
+
+
+def publish_invalidation(*tags):
+    """수집 스크립트/요약 스크립트용: 커밋 후 태그 무효화 (실패해도 작업은 계속)"""
+    cache = get_shared_cache()
+    try:
+        cache.invalidate(*tags)
+    except Exception as e:
+        print(f"⚠️ 캐시 무효화 실패 ({', '.join(tags)}): {e}")
+        return False
+    if cache.stats()['backend'] == 'local':
+        print(f"  ℹ️ CACHE_REDIS_URL 미설정: 캐시 무효화({', '.join(tags)})는 이 프로세스에만 적용됩니다")
+    return True
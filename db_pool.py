@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+공용 PostgreSQL 커넥션 풀
+
+- Flask 앱(app.py)과 수집 스크립트(scripts/db)가 함께 사용
+- 최대 연결 수 제한 (초과 시 대기, 타임아웃 시 PoolTimeout)
+- 일정 시간 이상 놀던 연결은 대여 전에 헬스 체크 (SELECT 1)
+- 연결마다 statement_timeout 설정
+- 대여/반납 통계 (stats())
+
+환경 변수 (앱 기본값 기준, 스크립트는 pool_settings_from_env 인자로 기본값 변경):
+    DB_POOL_MIN              최소 연결 수 (기본: 1)
+    DB_POOL_MAX              최대 연결 수 (기본: 10)
+    DB_POOL_TIMEOUT          연결 대기 최대 시간(초, 기본: 10)
+    DB_STATEMENT_TIMEOUT_MS  쿼리 타임아웃(ms, 기본: 15000, 0이면 제한 없음)
+    DB_POOL_HEALTH_CHECK     헬스 체크 간격(초, 기본: 30)
+
+스크립트에서 사용 예:
+    sys.path.insert(0, project_root)
+    from db_pool import ConnectionPool, pool_settings_from_env
+
+    pool = ConnectionPool(get_db_config(), **pool_settings_from_env(maxconn=4, statement_timeout_ms=0))
+    with pool.connection() as conn:
+        ...
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import psycopg2
+from psycopg2 import pool as pg_pool
+
+
+class PoolTimeout(pg_pool.PoolError):
+    """풀에서 제한 시간 안에 연결을 얻지 못함"""
+
+
+def pool_settings_from_env(prefix='DB_', minconn=1, maxconn=10, acquire_timeout=10.0,
+                           statement_timeout_ms=15000, health_check_interval=30.0):
+    """환경 변수에서 풀 설정 읽기 (환경 변수가 없으면 인자로 받은 기본값 사용)"""
+    env = os.environ.get
+    return {
+        'minconn': int(env(f'{prefix}POOL_MIN', minconn)),
+        'maxconn': int(env(f'{prefix}POOL_MAX', maxconn)),
+        'acquire_timeout': float(env(f'{prefix}POOL_TIMEOUT', acquire_timeout)),
+        'statement_timeout_ms': int(env(f'{prefix}STATEMENT_TIMEOUT_MS', statement_timeout_ms)),
+        'health_check_interval': float(env(f'{prefix}POOL_HEALTH_CHECK', health_check_interval)),
+    }
+
+
+class ConnectionPool:
+    """크기가 제한된 스레드 안전 커넥션 풀"""
+
+    def __init__(self, db_config, minconn=1, maxconn=10, acquire_timeout=10.0,
+                 statement_timeout_ms=15000, health_check_interval=30.0,
+                 slow_acquire_warning=1.0, **connect_kwargs):
+        if maxconn < 1:
+            raise ValueError("maxconn은 1 이상이어야 합니다.")
+        minconn = max(0, min(minconn, maxconn))
+
+        options = connect_kwargs.pop('options', '')
+        if statement_timeout_ms:
+            options = f"{options} -c statement_timeout={int(statement_timeout_ms)}".strip()
+        if options:
+            connect_kwargs['options'] = options
+
+        self.maxconn = maxconn
+        self.acquire_timeout = acquire_timeout
+        self.health_check_interval = health_check_interval
+        self.slow_acquire_warning = slow_acquire_warning
+
+        self._pool = pg_pool.ThreadedConnectionPool(minconn, maxconn, **db_config, **connect_kwargs)
+        # ThreadedConnectionPool은 한도 초과 시 바로 예외를 던지므로 세마포어로 대기시킨다
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._lock = threading.Lock()
+        self._last_used = {}  # id(conn) -> 마지막 반납 시각
+
+        self._stats = {
+            'borrowed': 0,
+            'returned': 0,
+            'in_use': 0,
+            'max_in_use': 0,
+            'timeouts': 0,
+            'health_check_failures': 0,
+            'wait_time_total': 0.0,
+            'wait_time_max': 0.0,
+        }
+
+    def getconn(self, timeout=None):
+        """풀에서 연결 대여 (사용 후 반드시 putconn 호출)"""
+        timeout = self.acquire_timeout if timeout is None else timeout
+        started = time.monotonic()
+        if not self._slots.acquire(timeout=timeout):
+            with self._lock:
+                self._stats['timeouts'] += 1
+            raise PoolTimeout(f"{timeout:.1f}초 안에 DB 연결을 얻지 못했습니다 (최대 {self.maxconn}개 사용 중)")
+
+        try:
+            conn = self._checkout()
+        except Exception:
+            self._slots.release()
+            raise
+
+        waited = time.monotonic() - started
+        with self._lock:
+            self._stats['borrowed'] += 1
+            self._stats['in_use'] += 1
+            self._stats['max_in_use'] = max(self._stats['max_in_use'], self._stats['in_use'])
+            self._stats['wait_time_total'] += waited
+            self._stats['wait_time_max'] = max(self._stats['wait_time_max'], waited)
+        if waited >= self.slow_acquire_warning:
+            print(f"⚠️ DB 연결 대기 {waited:.2f}초 (사용 중: {self._stats['in_use']}/{self.maxconn})")
+        return conn
+
+    def putconn(self, conn, close=False):
+        """연결 반납 (열린 트랜잭션은 풀이 롤백)"""
+        if conn is None:
+            return
+        close = close or conn.closed != 0
+        try:
+            with self._lock:
+                # 닫히는 연결의 id는 새 연결에 재사용될 수 있으므로 기록을 지운다
+                if close:
+                    self._last_used.pop(id(conn), None)
+                else:
+                    self._last_used[id(conn)] = time.monotonic()
+            self._pool.putconn(conn, close=close)
+        finally:
+            with self._lock:
+                self._stats['returned'] += 1
+                self._stats['in_use'] -= 1
+            self._slots.release()
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """with 문용 대여/반납. 예외 시 롤백 후 반납한다."""
+        conn = self.getconn(timeout=timeout)
+        try:
+            yield conn
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            self.putconn(conn)
+
+    def stats(self):
+        """대여/반납 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['max_size'] = self.maxconn
+        stats['wait_time_avg'] = (stats['wait_time_total'] / stats['borrowed']) if stats['borrowed'] else 0.0
+        stats['wait_time_total'] = round(stats['wait_time_total'], 4)
+        stats['wait_time_max'] = round(stats['wait_time_max'], 4)
+        stats['wait_time_avg'] = round(stats['wait_time_avg'], 4)
+        return stats
+
+    def closeall(self):
+        self._pool.closeall()
+
+    def _checkout(self):
+        # 끊어진 연결은 버리고 최대 2번까지 새로 받는다
+        for _ in range(3):
+            conn = self._pool.getconn()
+            if self._is_healthy(conn):
+                return conn
+            with self._lock:
+                self._stats['health_check_failures'] += 1
+                self._last_used.pop(id(conn), None)
+            self._pool.putconn(conn, close=True)
+        raise psycopg2.OperationalError("정상 DB 연결을 얻지 못했습니다.")
+
+    def _is_healthy(self, conn):
+        if conn.closed:
+            return False
+        with self._lock:
+            last_used = self._last_used.get(id(conn))
+        # 새 연결이거나 최근에 쓰인 연결은 검사 생략
+        if last_used is None or time.monotonic() - last_used < self.health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
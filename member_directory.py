@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+프로세스 내 의원 디렉터리 (assembly_members 전체를 메모리에 보관)
+
+- 22대 의원은 약 300명이므로 한 번 읽어 member_id / member_no / mona_cd로 바로 조회
+  → 의안 상세의 의원별 표결(약 300행)마다 assembly_members를 JOIN하지 않음
+- 버전: 캐시 태그 'members' 버전. 의원 수집 스크립트가 publish_invalidation('members')를 호출하면
+  다음 조회 때 다시 읽음 (CACHE_REDIS_URL이 없으면 다른 프로세스의 무효화가 보이지 않으므로 max_age마다 다시 읽음)
+- 다시 읽는 동안 다른 스레드는 기존 디렉터리를 그대로 사용
+- fingerprint: 읽어 온 의원 정보의 해시 (응답 ETag에 포함하면 실제로 읽은 데이터가 바뀔 때만 ETag가 바뀜)
+
+사용 예:
+    members = MemberDirectory(version=lambda: cache.tag_versions(('members',))['members'])
+    members.refresh(cur)                # 버전이 바뀌었거나 오래되었으면 다시 읽음
+    members.decorate(vote_rows)         # 행마다 member_id, photo_url 채움
+"""
+
+import hashlib
+import threading
+import time
+
+MEMBER_DIRECTORY_COLUMNS = ('member_id', 'member_no', 'mona_cd', 'name', 'party', 'district', 'photo_url')
+
+
+class MemberDirectory:
+    """member_id / member_no / mona_cd → 의원 정보 dict"""
+
+    def __init__(self, version, max_age=600):
+        self._version_source = version  # () → 현재 버전 (알 수 없으면 None)
+        self.max_age = max_age
+        self._lock = threading.Lock()  # 다시 읽기용 (조회는 잠그지 않음)
+        self._stats_lock = threading.Lock()  # 통계 카운터용 (다시 읽는 중에도 조회가 기다리지 않도록 분리)
+        self._version = None
+        self._loaded_at = None
+        self._indexes = ({}, {}, {})  # (member_id, member_no, mona_cd)별
+        self.fingerprint = None  # 마지막으로 읽은 의원 정보의 해시 (읽기 전에는 None)
+        self._stats = {'loads': 0, 'lookups': 0, 'misses': 0}
+
+    def _is_fresh(self, version):
+        if self._loaded_at is None:
+            return False
+        if version is not None and version != self._version:
+            return False
+        return time.monotonic() - self._loaded_at < self.max_age
+
+    def refresh(self, cur):
+        """버전이 바뀌었거나 max_age가 지났으면 cur(RealDictCursor)로 다시 읽음. 다시 읽었으면 True"""
+        version = self._version_source()
+        if self._is_fresh(version):
+            return False
+        with self._lock:
+            if self._is_fresh(version):
+                return False  # 다른 스레드가 먼저 읽음
+            cur.execute(f"SELECT {', '.join(MEMBER_DIRECTORY_COLUMNS)} FROM assembly_members ORDER BY member_id")
+            by_id, by_no, by_mona = {}, {}, {}
+            digest = hashlib.md5()
+            for row in cur.fetchall():
+                member = dict(row)
+                digest.update(repr([member[column] for column in MEMBER_DIRECTORY_COLUMNS]).encode('utf-8'))
+                by_id[member['member_id']] = member
+                if member['member_no']:
+                    by_no[member['member_no']] = member
+                if member['mona_cd']:
+                    by_mona[member['mona_cd']] = member
+            self._indexes = (by_id, by_no, by_mona)
+            self.fingerprint = digest.hexdigest()
+            self._version = version
+            self._loaded_at = time.monotonic()
+            with self._stats_lock:
+                self._stats['loads'] += 1
+            return True
+
+    def _find(self, member_id, member_no, mona_cd):
+        by_id, by_no, by_mona = self._indexes
+        return (by_id.get(member_id) if member_id else None) \
+            or (by_no.get(member_no) if member_no else None) \
+            or (by_mona.get(mona_cd) if mona_cd else None)
+
+    def _count(self, lookups, misses):
+        with self._stats_lock:
+            self._stats['lookups'] += lookups
+            self._stats['misses'] += misses
+
+    def lookup(self, member_id=None, member_no=None, mona_cd=None):
+        """member_id → member_no → mona_cd 순서로 찾음 (없으면 None)"""
+        member = self._find(member_id, member_no, mona_cd)
+        self._count(1, 0 if member else 1)
+        return member
+
+    def decorate(self, rows):
+        """표결 행(member_id, member_no, mona_cd 포함)에 member_id, photo_url을 채우고 매핑용 키는 제거"""
+        misses = 0
+        for row in rows:
+            member = self._find(row.get('member_id'), row.pop('member_no', None), row.pop('mona_cd', None))
+            if member is None:
+                misses += 1
+            row['member_id'] = member['member_id'] if member else None
+            row['photo_url'] = member['photo_url'] if member else None
+        self._count(len(rows), misses)  # 행마다 잠그지 않고 호출당 한 번
+        return rows
+
+    def stats(self):
+        by_id, _, _ = self._indexes
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['members'] = len(by_id)
+        stats['version'] = self._version
+        return stats
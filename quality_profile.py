@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+데이터 품질 프로파일 (필드별 채움 비율, 행별 완성도)
+
+- 테이블을 한 번만 읽어 모든 필드의 채움 여부를 계산 (필드마다 COUNT 쿼리를 돌리지 않음)
+- 행 목록이 필요하면 행마다 완성도 벡터('1101...', 필드 순서대로 1=채움)를 받아 Python에서 합산
+- 행 목록이 필요 없는 큰 테이블(votes)은 COUNT(*) FILTER 집계 한 번으로 처리
+- cache(cache_backend.TaggedCache)를 넘기면 계산 결과(행별 벡터 포함)를 태그와 함께 캐시
+
+사용 예:
+    profile = quality_profile(cur, 'assembly_members', MEMBER_QUALITY_FIELDS,
+                              row_columns=['member_id', 'name'], order_by='filled_fields ASC, name ASC',
+                              cache=cache, cache_tags=('members',))
+    profile.field_stats()   # 필드별 통계
+    profile.row_stats()     # 행별 완성도 (row_columns + filled_fields, total_fields, completion_rate)
+"""
+
+import hashlib
+import json
+from collections import namedtuple
+
+# kind: default(NULL만 체크), text(NULL/공백 문자열), jsonb(NULL/'null'/빈 객체)
+QualityField = namedtuple('QualityField', ['name', 'label', 'kind'])
+QualityField.__new__.__defaults__ = ('default',)
+
+
+def field_filled_sql(field):
+    """필드가 '채워졌는지' 판단하는 SQL 조건"""
+    name = field.name
+    if field.kind == 'text':
+        return f"({name} IS NOT NULL AND TRIM({name}) != '')"
+    if field.kind == 'jsonb':
+        return f"({name} IS NOT NULL AND {name} != 'null'::jsonb AND {name} != '{{}}'::jsonb)"
+    return f"({name} IS NOT NULL)"
+
+
+class QualityProfile:
+    """quality_profile() 결과"""
+
+    def __init__(self, fields, total, filled_counts, rows=None):
+        self.fields = fields
+        self.total = total
+        self.filled_counts = filled_counts
+        self.rows = rows  # 행 목록 모드일 때만: row_columns + quality_vector + filled_fields
+
+    def field_stats(self):
+        """필드별 채움/누락 수와 완성도(%)"""
+        stats = []
+        for field, filled in zip(self.fields, self.filled_counts):
+            completion_rate = (filled / self.total * 100) if self.total > 0 else 0
+            stats.append({
+                'field': field.name,
+                'label': field.label,
+                'total': self.total,
+                'filled': filled,
+                'missing': self.total - filled,
+                'completion_rate': round(completion_rate, 1)
+            })
+        return stats
+
+    def row_stats(self):
+        """행별 완성도 (벡터 자체는 응답에서 제외)"""
+        total_fields = len(self.fields)
+        result = []
+        for row in self.rows or []:
+            item = {k: v for k, v in row.items() if k != 'quality_vector'}
+            item['total_fields'] = total_fields
+            item['completion_rate'] = round(row['filled_fields'] / total_fields * 100, 1) if total_fields > 0 else 0
+            result.append(item)
+        return result
+
+    def missing_fields(self, row):
+        """행의 벡터에서 비어 있는 필드명 목록"""
+        return [field.name for field, flag in zip(self.fields, row['quality_vector']) if flag == '0']
+
+    def to_cache(self):
+        return (self.total, self.filled_counts, self.rows)
+
+    @classmethod
+    def from_cache(cls, fields, value):
+        total, filled_counts, rows = value
+        return cls(fields, total, filled_counts, rows)
+
+
+def quality_profile(cur, table, fields, where=None, params=(), row_columns=None, order_by=None,
+                    cache=None, cache_tags=(), cache_timeout=300):
+    """테이블 품질 프로파일을 한 번의 스캔으로 계산
+
+    Args:
+        cur: RealDictCursor
+        table: 테이블명 (코드에 고정된 값만 사용)
+        fields: QualityField 또는 (name, label[, kind]) 튜플 목록
+        where: WHERE 조건 (파라미터는 params)
+        row_columns: 행 목록 모드에서 함께 받을 컬럼 (None이면 집계만)
+        order_by: 행 목록 정렬 (filled_fields 별칭 사용 가능)
+        cache / cache_tags: 결과 캐시 (태그 무효화 시 재계산)
+    """
+    fields = [f if isinstance(f, QualityField) else QualityField(*f) for f in fields]
+
+    cache_key = None
+    if cache is not None:
+        signature = json.dumps([table, fields, where, list(params), row_columns, order_by], default=str)
+        cache_key = f"quality:{table}:{hashlib.md5(signature.encode('utf-8')).hexdigest()}"
+        cached = cache.get(cache_key, cache_tags)
+        if cached is not None:
+            return QualityProfile.from_cache(fields, cached)
+
+    conditions = [field_filled_sql(f) for f in fields]
+    where_sql = f"WHERE {where}" if where else ""
+
+    if row_columns:
+        # 행 목록 모드: 행별 완성도 벡터를 받아 필드별 합계를 Python에서 계산 (스캔 1회)
+        vector_sql = " || ".join(f"(CASE WHEN {c} THEN '1' ELSE '0' END)" for c in conditions)
+        cur.execute(f"""
+            SELECT q.*, LENGTH(REPLACE(q.quality_vector, '0', '')) as filled_fields
+            FROM (
+                SELECT {', '.join(row_columns)}, {vector_sql} as quality_vector
+                FROM {table}
+                {where_sql}
+            ) q
+            {f'ORDER BY {order_by}' if order_by else ''}
+        """, tuple(params))
+        rows = [dict(row) for row in cur.fetchall()]
+        filled_counts = [0] * len(fields)
+        for row in rows:
+            for i, flag in enumerate(row['quality_vector']):
+                if flag == '1':
+                    filled_counts[i] += 1
+        profile = QualityProfile(fields, len(rows), filled_counts, rows)
+    else:
+        # 집계 모드: 필드별 COUNT(*) FILTER를 한 쿼리에 모아 계산 (큰 테이블용)
+        aggregates = ", ".join(f"COUNT(*) FILTER (WHERE {c}) as f{i}" for i, c in enumerate(conditions))
+        cur.execute(f"""
+            SELECT COUNT(*) as total, {aggregates}
+            FROM {table}
+            {where_sql}
+        """, tuple(params))
+        result = cur.fetchone()
+        profile = QualityProfile(fields, result['total'], [result[f'f{i}'] for i in range(len(fields))])
+
+    if cache_key is not None:
+        cache.set(cache_key, profile.to_cache(), cache_tags, cache_timeout)
+    return profile
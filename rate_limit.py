@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+토큰 버킷 속도 제한 (스레드 안전)
+
+- 수집 스크립트: 공공 API 초당 호출 수 제한
+- AI 요약: API 키별 분당 요청/토큰 제한
+
+초당 rate개씩 토큰이 채워지고 최대 capacity개까지 쌓인다.
+acquire()는 토큰이 모자라면 채워질 때까지 기다린다 (락 밖에서 대기).
+
+사용 예:
+    bucket = TokenBucket(rate=2.0, capacity=2)
+    bucket.acquire()          # 필요하면 대기
+    requests.get(...)
+    bucket.pause(5.0)         # 429 응답 시 잠시 발급 중단
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """토큰 버킷 속도 제한기"""
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._stats = {'acquired': 0, 'waited': 0, 'wait_time_total': 0.0, 'pauses': 0}
+
+    def _refill(self, now):
+        elapsed = now - max(self._updated_at, self._paused_until)
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = max(now, self._updated_at)
+
+    def _reserve(self, tokens, now):
+        """토큰을 가져갈 수 있으면 0, 아니면 기다려야 할 시간(초)"""
+        if now < self._paused_until:
+            return self._paused_until - now
+        self._refill(now)
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return 0.0
+        return (tokens - self._tokens) / self.rate
+
+    def try_acquire(self, tokens=1):
+        """대기 없이 토큰 획득 시도"""
+        with self._lock:
+            if self._reserve(tokens, time.monotonic()) == 0.0:
+                self._stats['acquired'] += 1
+                return True
+            return False
+
+    def acquire(self, tokens=1, timeout=None):
+        """토큰을 얻을 때까지 대기. timeout 초과 시 False"""
+        if tokens > self.capacity:
+            raise ValueError(f"요청 토큰({tokens})이 버킷 용량({self.capacity})보다 큽니다.")
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        waited = False
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._reserve(tokens, now)
+                if wait == 0.0:
+                    self._stats['acquired'] += 1
+                    if waited:
+                        self._stats['waited'] += 1
+                        self._stats['wait_time_total'] += now - started
+                    return True
+            if deadline is not None and now + wait > deadline:
+                return False
+            waited = True
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """일정 시간 토큰 발급 중단 (429 등 서버가 속도 제한을 알린 경우), 쌓인 토큰도 비움"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+            self._stats['pauses'] += 1
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        stats['wait_time_total'] = round(stats['wait_time_total'], 3)
+        return stats
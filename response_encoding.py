@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+API 응답 인코딩 (JSON 직렬화 + 압축)
+
+- FastJSONProvider: Flask JSON 공급자. orjson이 설치되어 있으면 사용, 없으면 표준 json
+  날짜/시각은 ISO 8601 문자열('2025-01-02', '2025-01-02T10:00:00')로 바로 직렬화하므로
+  뷰에서 행마다 format_date_for_json으로 변환할 필요가 없음
+- init_compression(app): Accept-Encoding에 따라 br(brotli 설치 시) 또는 gzip으로 JSON/텍스트 응답 압축
+  작은 응답(기본 1KB 미만)은 압축하지 않음
+
+환경 변수:
+    RESPONSE_COMPRESS_MIN_BYTES  압축 최소 크기(바이트, 기본: 1024, 0이면 압축 안 함)
+    RESPONSE_GZIP_LEVEL          gzip 압축 수준 (기본: 6)
+    RESPONSE_BROTLI_QUALITY      brotli 압축 품질 (기본: 5)
+
+사용 예:
+    app.json = FastJSONProvider(app)
+    init_compression(app)
+"""
+
+import decimal
+import gzip
+import json
+import os
+import uuid
+from datetime import date, datetime, time
+
+from flask import request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson  # 선택 의존성: 빠른 JSON 직렬화
+except ImportError:
+    orjson = None
+
+try:
+    import brotli  # 선택 의존성: br 압축
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = ('application/json', 'text/html', 'text/css', 'text/plain', 'application/javascript', 'text/javascript')
+
+
+def json_default(value):
+    """표준 json/orjson이 직접 처리하지 못하는 값 변환"""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"JSON으로 변환할 수 없는 값: {type(value).__name__}")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """jsonify/get_json용 JSON 공급자 (orjson 우선, 날짜는 ISO 8601)
+
+    키 정렬은 기본 공급자와 같게 유지 (같은 데이터면 같은 바이트 → 캐시/ETag 안정)
+    """
+
+    ensure_ascii = False
+    sort_keys = True
+
+    def dumps(self, obj, **kwargs):
+        if orjson is not None and not kwargs:
+            return orjson.dumps(obj, default=json_default, option=self._orjson_option()).decode('utf-8')
+        kwargs.setdefault('default', json_default)
+        kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        if orjson is not None:
+            body = orjson.dumps(obj, default=json_default, option=self._orjson_option())
+        else:
+            body = self.dumps(obj, separators=(',', ':')).encode('utf-8')
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+    def _orjson_option(self):
+        return orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if self.sort_keys else 0)
+
+
+def _int_env(name, default):
+    value = os.environ.get(name)
+    return int(value) if value not in (None, '') else default
+
+
+def choose_encoding(accept_encoding):
+    """Accept-Encoding 헤더에서 사용할 압축 방식 선택 (br > gzip, q=0은 제외)"""
+    accepted = {}
+    for part in (accept_encoding or '').split(','):
+        name, _, params = part.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name] = quality
+
+    def allowed(name):
+        return accepted.get(name, accepted.get('*', 0.0)) > 0
+
+    if brotli is not None and allowed('br'):
+        return 'br'
+    if allowed('gzip'):
+        return 'gzip'
+    return None
+
+
+def compress_body(body, encoding, gzip_level=6, brotli_quality=5):
+    if encoding == 'br':
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+def init_compression(app, min_bytes=None):
+    """app에 응답 압축 after_request 훅 등록"""
+    min_bytes = _int_env('RESPONSE_COMPRESS_MIN_BYTES', 1024) if min_bytes is None else min_bytes
+    gzip_level = _int_env('RESPONSE_GZIP_LEVEL', 6)
+    brotli_quality = _int_env('RESPONSE_BROTLI_QUALITY', 5)
+
+    @app.after_request
+    def compress_response(response):
+        if min_bytes <= 0 or response.mimetype not in COMPRESSIBLE_MIMETYPES:
+            return response
+        response.vary.add('Accept-Encoding')
+        if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+                or 'Content-Encoding' in response.headers):
+            return response
+        encoding = choose_encoding(request.headers.get('Accept-Encoding'))
+        if encoding is None:
+            return response
+        body = response.get_data()
+        if len(body) < min_bytes:
+            return response
+
+        response.set_data(compress_body(body, encoding, gzip_level, brotli_quality))
+        response.headers['Content-Encoding'] = encoding
+        # 압축 본문은 원본과 바이트가 다르므로 강한 ETag는 약한 ETag로 (If-None-Match는 약한 비교라 304 유지)
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+    return compress_response
@@ -0,0 +1,429 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+웹 API 지연 시간 벤치마크 (합성 데이터, 재현 가능)
+
+1. 벤치마크용 로컬 PostgreSQL DB(기본: mypoly_bench)를 create_tables_postgresql.sql로 만들고
+   합성 의안/의원/표결 데이터를 원하는 규모로 채움 (generate_series, 서버 안에서 생성)
+2. Flask 테스트 클라이언트로 주요 API를 반복 호출하여 p50/p95/p99 지연 시간과 요청당 쿼리 수 기록
+
+- 쿼리 수: 앱 커넥션 풀을 쿼리 수를 세는 연결로 바꿔서 측정 (cursor.execute 호출 수, execute_values 포함)
+- 기본은 캐시를 끈 상태(요청마다 캐시 태그 무효화)로 SQL 자체를 측정, --cache면 캐시 적중 포함
+- DB 접속 정보는 앱과 같은 환경 변수(DB_HOST, DB_USER, DB_PASSWORD, DB_PORT), DB 이름만 --db-name
+
+사용 예:
+    python scripts/bench/bench_api.py --scale 10000                         # 1만 건 (처음 한 번 데이터 생성)
+    python scripts/bench/bench_api.py --scale 100000 --reseed --requests 30
+    python scripts/bench/bench_api.py --endpoints bills,bill_detail,stats --json bench_api.json
+"""
+
+import argparse
+import io
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+import psycopg2
+import psycopg2.extensions
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(BENCH_DIR))
+SCHEMA_PATH = os.path.join(PROJECT_ROOT, 'scripts', 'db', 'create_tables_postgresql.sql')
+sys.path.insert(0, PROJECT_ROOT)
+
+from bench_common import latency_summary, print_table, write_json
+
+# (이름, URL 템플릿) - {bill_id}, {member_id}, {month}는 합성 데이터에서 무작위로 채움
+ENDPOINTS = [
+    ('bills', '/api/bills'),
+    ('bills_month', '/api/bills?month={month}'),
+    ('bills_filter', '/api/bills?pass_gubn=계류의안&proc_stage=심사'),
+    ('bills_search', '/api/bills?search=주택'),
+    ('bills_vote_sort', '/api/bills?sort_by=vote_count'),
+    ('bills_deep_page', '/api/bills?page=200'),
+    ('bills_cursor', '/api/bills?cursor='),
+    ('bills_facets', '/api/bills?cursor=&facets=1&month={month}'),
+    ('bill_detail', '/api/bills/{bill_id}'),
+    ('bootstrap', '/api/bootstrap'),
+    ('stats', '/api/stats'),
+    ('months', '/api/months'),
+    ('pass_gubn_options', '/api/pass_gubn_options'),
+    ('proc_stage_options', '/api/proc_stage_options'),
+    ('bills_quality', '/api/bills/quality/stats'),
+    ('members_quality', '/api/members/quality/stats'),
+    ('votes_quality', '/api/votes/quality/stats'),
+    ('bill_quality_detail', '/api/bills/quality/detail/{bill_id}'),
+    ('member_quality_detail', '/api/members/quality/detail/{member_id}'),
+]
+
+SEED_MEMBERS_SQL = """
+    INSERT INTO assembly_members (
+        member_id, name, party, district, district_type, committee, current_committee,
+        era, election_type, gender, birth_date, duty_name, phone, email, mona_cd, member_no
+    )
+    SELECT
+        'BENCH_M' || lpad(g::text, 5, '0'),
+        '의원' || g,
+        (ARRAY['정당A', '정당B', '정당C', '무소속'])[1 + g %% 4],
+        CASE WHEN g %% 6 = 0 THEN '비례대표' ELSE '지역구' || (g %% 250) END,
+        CASE WHEN g %% 6 = 0 THEN '비례대표' ELSE '지역구' END,
+        '위원회' || (g %% 17),
+        '위원회' || (g %% 17),
+        '제22대',
+        CASE WHEN g %% 6 = 0 THEN '비례대표' ELSE '지역구' END,
+        CASE WHEN g %% 5 = 0 THEN '여' ELSE '남' END,
+        DATE '1960-01-01' + (g * 37) %% 10000,
+        '국회의원',
+        CASE WHEN g %% 3 = 0 THEN NULL ELSE '02-788-' || lpad(g::text, 4, '0') END,
+        CASE WHEN g %% 4 = 0 THEN NULL ELSE 'member' || g || '@assembly.go.kr' END,
+        'MONA' || lpad(g::text, 5, '0'),
+        (10000 + g)::text
+    FROM generate_series(1, %(members)s) g
+"""
+
+SEED_BILLS_SQL = """
+    INSERT INTO bills (
+        bill_id, bill_no, title, proposal_date, proposer_kind, proposer_name,
+        proc_stage_cd, pass_gubn, proc_date, general_result, summary_raw,
+        headline, summary, categories, vote_for, vote_against,
+        proc_stage_order, proposer_count, link_url
+    )
+    SELECT
+        'BENCH' || lpad(g::text, 9, '0'),
+        (2200000 + g)::text,
+        (ARRAY['주택법', '국민건강보험법', '조세특례제한법', '근로기준법', '도로교통법', '개인정보 보호법'])[1 + g %% 6]
+            || ' 일부개정법률안(의원' || (g %% 300) || ' 등 10인)',
+        DATE '2025-01-01' + (g * 7) %% 300,
+        CASE WHEN g %% 20 = 0 THEN '정부' ELSE '의원' END,
+        '의원' || (g %% 300),
+        s.stage,
+        CASE WHEN s.stage = '처리완료' THEN '처리완료' ELSE '계류의안' END,
+        CASE WHEN s.stage = '처리완료' THEN DATE '2025-01-01' + (g * 7) %% 300 + 30 END,
+        CASE WHEN s.stage = '처리완료' THEN '원안가결' END,
+        '제안이유 및 주요내용 ' || g || ' ' || repeat('현행법은 공공 임대주택 공급 대상을 정하고 있으나 청년 주거 지원이 부족하다는 지적이 있음. ', 12),
+        CASE WHEN g %% 10 <> 3 THEN '청년 공공 임대주택 공급 대상 확대로 주거 부담 완화 ' || g END,
+        CASE WHEN g %% 10 <> 3 THEN '청년도 공공 임대주택을 신청할 수 있게 한다. 주거비 부담을 줄이려는 취지다.' END,
+        CASE WHEN g %% 10 <> 3 THEN jsonb_build_array((ARRAY['주거', '복지', '재정', '일자리'])[1 + g %% 4]) END,
+        CASE WHEN g %% 10 <> 3 THEN '{"P": 1, "U": 1}'::jsonb END,
+        CASE WHEN g %% 10 <> 3 THEN '{"M": 1, "T": 1}'::jsonb END,
+        m.stage_order,
+        1 + g %% 12,
+        'https://likms.assembly.go.kr/bill/billDetail.do?billId=BENCH' || lpad(g::text, 9, '0')
+    FROM generate_series(1, %(scale)s) g
+    CROSS JOIN LATERAL (
+        SELECT CASE
+            WHEN g %% 1000 < %(voted_per_mille)s THEN (ARRAY['본회의', '처리완료'])[1 + g %% 2]
+            WHEN g %% 10 < 6 THEN '접수'
+            ELSE '심사'
+        END AS stage
+    ) s
+    LEFT JOIN proc_stage_mapping m ON m.stage_code = s.stage
+"""
+
+# 본회의/처리완료 의안마다 의원 votes_per_bill명의 표결
+SEED_VOTES_SQL = """
+    INSERT INTO votes (
+        bill_id, bill_no, bill_name, member_no, mona_cd, member_id, member_name,
+        party_name, vote_result, vote_date, era
+    )
+    SELECT
+        b.bill_id, b.bill_no, b.title, m.member_no, m.mona_cd, m.member_id, m.name, m.party,
+        (ARRAY['찬성', '찬성', '찬성', '찬성', '반대', '기권', '불참'])[1 + (hashtext(b.bill_id || m.member_id) & 2147483647) %% 7],
+        COALESCE(b.proc_date, b.proposal_date + 20)::timestamp + interval '14 hours',
+        22
+    FROM bills b
+    CROSS JOIN (
+        SELECT * FROM assembly_members ORDER BY member_id LIMIT %(votes_per_bill)s
+    ) m
+    WHERE b.bill_id LIKE 'BENCH%%' AND b.proc_stage_cd IN ('본회의', '처리완료')
+"""
+
+
+# ---------- 쿼리 수 측정 ----------
+
+_query_count = threading.local()
+_counting_cursors = {}
+
+
+def _counting_cursor(factory):
+    """cursor 클래스 → execute 호출 수를 세는 하위 클래스 (클래스마다 한 번만 생성)"""
+    cls = _counting_cursors.get(factory)
+    if cls is None:
+        def execute(self, query, vars=None):
+            _query_count.value = getattr(_query_count, 'value', 0) + 1
+            return factory.execute(self, query, vars)
+        cls = type(f"Counting{factory.__name__}", (factory,), {'execute': execute})
+        _counting_cursors[factory] = cls
+    return cls
+
+
+class CountingConnection(psycopg2.extensions.connection):
+    """모든 커서(RealDictCursor 등 cursor_factory 지정 포함)의 execute 호출 수를 스레드별로 셈"""
+
+    def cursor(self, *args, **kwargs):
+        factory = kwargs.pop('cursor_factory', None) or self.cursor_factory or psycopg2.extensions.cursor
+        return super().cursor(*args, cursor_factory=_counting_cursor(factory), **kwargs)
+
+
+def reset_query_count():
+    _query_count.value = 0
+
+
+def query_count():
+    return getattr(_query_count, 'value', 0)
+
+
+# ---------- 데이터 준비 ----------
+
+def server_config(db_name):
+    """앱과 같은 환경 변수로 접속 정보 (DB 이름만 벤치마크용)"""
+    password = os.environ.get('DB_PASSWORD') or os.environ.get('LOCAL_DB_PASSWORD')
+    if not password:
+        raise ValueError("DB_PASSWORD 또는 LOCAL_DB_PASSWORD 환경 변수가 필요합니다.")
+    return {
+        'host': os.environ.get('DB_HOST') or os.environ.get('LOCAL_DB_HOST', 'localhost'),
+        'database': db_name,
+        'user': os.environ.get('DB_USER') or os.environ.get('LOCAL_DB_USER', 'postgres'),
+        'password': password,
+        'port': int(os.environ.get('DB_PORT') or os.environ.get('LOCAL_DB_PORT', '5432')),
+    }
+
+
+def ensure_database(db_name, reseed):
+    """벤치마크 DB 생성 (reseed면 삭제 후 다시 생성). 새로 만들었으면 True"""
+    conn = psycopg2.connect(**server_config('postgres'))
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1 FROM pg_database WHERE datname = %s", (db_name,))
+            exists = cur.fetchone() is not None
+            if exists and reseed:
+                print(f"[DB] {db_name} 삭제 후 다시 생성")
+                cur.execute(f'DROP DATABASE "{db_name}"')
+                exists = False
+            if not exists:
+                cur.execute(f'CREATE DATABASE "{db_name}" ENCODING \'UTF8\' TEMPLATE template0')
+                return True
+    finally:
+        conn.close()
+    return False
+
+
+def seed(db_name, scale, members, votes_per_bill, voted_ratio):
+    """스키마 생성 + 합성 데이터 적재 + 집계 갱신"""
+    conn = psycopg2.connect(**server_config(db_name))
+    try:
+        with conn.cursor() as cur:
+            started = time.time()
+            cur.execute("SELECT to_regclass('bills') IS NOT NULL")
+            if not cur.fetchone()[0]:  # 스키마 파일의 CREATE TRIGGER는 한 번만 실행 가능
+                with open(SCHEMA_PATH, 'r', encoding='utf-8') as f:
+                    cur.execute(f.read())
+                conn.commit()
+
+            params = {
+                'scale': scale,
+                'members': max(members, votes_per_bill),
+                'votes_per_bill': votes_per_bill,
+                'voted_per_mille': int(round(voted_ratio * 1000)),
+            }
+            steps = [
+                ("의원", SEED_MEMBERS_SQL),
+                ("의안", SEED_BILLS_SQL),
+                ("표결", SEED_VOTES_SQL),
+            ]
+            for label, sql in steps:
+                step_started = time.time()
+                cur.execute(sql, params)
+                print(f"[생성] {label} {cur.rowcount:,}건 ({time.time() - step_started:.1f}초)", flush=True)
+            conn.commit()
+
+            cur.execute("SELECT refresh_bill_vote_summary(ARRAY(SELECT DISTINCT bill_id FROM votes))")
+            cur.execute("REFRESH MATERIALIZED VIEW bill_stats_rollup")
+            conn.commit()
+            conn.autocommit = True
+            cur.execute("ANALYZE")
+            print(f"[생성 완료] {time.time() - started:.1f}초")
+    finally:
+        conn.close()
+
+
+def seeded_bill_count(db_name):
+    conn = psycopg2.connect(**server_config(db_name))
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT to_regclass('bills') IS NOT NULL")
+            if not cur.fetchone()[0]:
+                return 0
+            cur.execute("SELECT COUNT(*) FROM bills WHERE bill_id LIKE 'BENCH%'")
+            return cur.fetchone()[0]
+    finally:
+        conn.close()
+
+
+def sample_values(db_name, size=200):
+    """URL 템플릿에 넣을 의안/의원/월 표본"""
+    conn = psycopg2.connect(**server_config(db_name))
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT bill_id FROM bills TABLESAMPLE SYSTEM (5) LIMIT %s", (size,))
+            bill_ids = [row[0] for row in cur.fetchall()]
+            if not bill_ids:
+                cur.execute("SELECT bill_id FROM bills LIMIT %s", (size,))
+                bill_ids = [row[0] for row in cur.fetchall()]
+            cur.execute("SELECT member_id FROM assembly_members LIMIT %s", (size,))
+            member_ids = [row[0] for row in cur.fetchall()]
+            cur.execute("SELECT DISTINCT TO_CHAR(proposal_month, 'YYYY-MM') FROM bills")
+            months = [row[0] for row in cur.fetchall()]
+    finally:
+        conn.close()
+    return {'bill_id': bill_ids, 'member_id': member_ids, 'month': months}
+
+
+# ---------- 측정 ----------
+
+def build_url(template, samples):
+    values = {name: random.choice(options) for name, options in samples.items() if options}
+    return template.format(**values)
+
+
+def measure_endpoint(web, name, template, samples, requests_count, warmup, use_cache, concurrency):
+    """엔드포인트 하나를 requests_count번 호출 → 결과 dict"""
+    latencies = []
+    queries = []
+    errors = 0
+    lock = threading.Lock()
+
+    def one_request(client, record):
+        nonlocal errors
+        url = build_url(template, samples)
+        if not use_cache:
+            web.cache.invalidate('bills', 'votes', 'members')
+        reset_query_count()
+        started = time.perf_counter()
+        response = client.get(url)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if not record:
+            return
+        with lock:
+            latencies.append(elapsed_ms)
+            queries.append(query_count())
+            if response.status_code != 200:
+                errors += 1
+
+    def worker(count):
+        client = web.app.test_client()
+        for _ in range(count):
+            one_request(client, True)
+
+    warm_client = web.app.test_client()
+    for _ in range(warmup):
+        one_request(warm_client, False)
+
+    started = time.perf_counter()
+    if concurrency <= 1:
+        worker(requests_count)
+    else:
+        counts = [requests_count // concurrency + (1 if i < requests_count % concurrency else 0)
+                  for i in range(concurrency)]
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(worker, counts))
+    elapsed = time.perf_counter() - started
+
+    summary = latency_summary(latencies)
+    return {
+        'endpoint': name,
+        'url': template,
+        'requests': summary['count'],
+        'errors': errors,
+        'p50_ms': summary['p50'],
+        'p95_ms': summary['p95'],
+        'p99_ms': summary['p99'],
+        'max_ms': summary['max'],
+        'rps': round(len(latencies) / elapsed, 1) if elapsed else None,
+        'queries_per_request': round(sum(queries) / len(queries), 2) if queries else None,
+        'queries_max': max(queries) if queries else None,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="웹 API 지연 시간 벤치마크 (합성 데이터)")
+    ap.add_argument("--db-name", default="mypoly_bench", help="벤치마크용 DB 이름 (기본: mypoly_bench, 운영 DB 사용 금지)")
+    ap.add_argument("--scale", type=int, default=10000, help="합성 의안 수 (예: 10000, 100000, 1000000)")
+    ap.add_argument("--members", type=int, default=300, help="합성 의원 수 (기본: 300)")
+    ap.add_argument("--votes-per-bill", type=int, default=300, help="표결 의안당 표결 수 (기본: 300)")
+    ap.add_argument("--voted-ratio", type=float, default=0.1, help="표결이 있는(본회의/처리완료) 의안 비율 (기본: 0.1)")
+    ap.add_argument("--reseed", action="store_true", help="벤치마크 DB를 지우고 다시 생성")
+    ap.add_argument("--skip-seed", action="store_true", help="데이터 생성 없이 기존 DB로 측정")
+    ap.add_argument("--requests", type=int, default=50, help="엔드포인트당 측정 요청 수 (기본: 50)")
+    ap.add_argument("--warmup", type=int, default=3, help="엔드포인트당 측정 전 요청 수 (기본: 3)")
+    ap.add_argument("--concurrency", type=int, default=1, help="동시 요청 스레드 수 (기본: 1)")
+    ap.add_argument("--cache", action="store_true", help="앱 캐시 사용 (기본: 요청마다 캐시 무효화하여 SQL 측정)")
+    ap.add_argument("--endpoints", default=None, help=f"측정할 엔드포인트 (쉼표 구분, 기본: 전체) {[n for n, _ in ENDPOINTS]}")
+    ap.add_argument("--seed", type=int, default=42, help="난수 시드 (기본: 42)")
+    ap.add_argument("--json", default=None, help="결과를 JSON 파일로 저장")
+    args = ap.parse_args()
+
+    if args.db_name == (os.environ.get('DB_NAME') or os.environ.get('LOCAL_DB_NAME')) and not args.skip_seed:
+        print(f"오류: --db-name({args.db_name})이 앱 DB와 같습니다. 벤치마크용 DB 이름을 지정하세요.", file=sys.stderr)
+        sys.exit(2)
+
+    if not args.skip_seed:
+        created = ensure_database(args.db_name, args.reseed)
+        existing = 0 if created else seeded_bill_count(args.db_name)
+        if existing == 0:
+            print(f"[생성] {args.db_name}: 의안 {args.scale:,}건, 표결 의안당 {args.votes_per_bill}건 "
+                  f"(비율 {args.voted_ratio})", flush=True)
+            seed(args.db_name, args.scale, args.members, args.votes_per_bill, args.voted_ratio)
+        elif existing != args.scale:
+            print(f"⚠️ 기존 데이터 {existing:,}건으로 측정합니다 (--scale {args.scale:,}로 다시 만들려면 --reseed)")
+        else:
+            print(f"[DB] 기존 데이터 사용: 의안 {existing:,}건")
+
+    # 앱은 DB_NAME 환경 변수로 접속하므로 import 전에 벤치마크 DB로 바꾸고, 커넥션 풀은 쿼리 수를 세는 연결로 생성
+    os.environ['DB_NAME'] = args.db_name
+    import app as web
+    from db_pool import ConnectionPool, pool_settings_from_env
+    web._db_pool = ConnectionPool(web.get_db_config(), connection_factory=CountingConnection,
+                                  **pool_settings_from_env(maxconn=max(10, args.concurrency + 2)))
+
+    random.seed(args.seed)
+    samples = sample_values(args.db_name)
+    selected = set(args.endpoints.split(',')) if args.endpoints else None
+    endpoints = [(name, url) for name, url in ENDPOINTS if selected is None or name in selected]
+
+    results = []
+    for name, template in endpoints:
+        print(f"[측정] {name}...", flush=True)
+        results.append(measure_endpoint(web, name, template, samples, args.requests, args.warmup,
+                                        args.cache, args.concurrency))
+
+    print()
+    print(f"의안 {seeded_bill_count(args.db_name):,}건, 캐시 {'사용' if args.cache else '미사용'}, "
+          f"동시 요청 {args.concurrency}")
+    print_table(results, [
+        ('endpoint', '엔드포인트'), ('requests', '요청'), ('errors', '오류'),
+        ('p50_ms', 'p50(ms)'), ('p95_ms', 'p95(ms)'), ('p99_ms', 'p99(ms)'), ('max_ms', 'max(ms)'),
+        ('rps', '요청/초'), ('queries_per_request', '쿼리/요청'), ('queries_max', '최대 쿼리'),
+    ])
+    print(f"\n커넥션 풀: {web.get_db_pool().stats()}")
+
+    if args.json:
+        write_json(args.json, {
+            'db_name': args.db_name,
+            'scale': args.scale,
+            'cache': args.cache,
+            'concurrency': args.concurrency,
+            'results': results,
+        })
+
+
+if __name__ == "__main__":
+    main()
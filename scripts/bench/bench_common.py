@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크 공용 도우미 (백분위수, 결과 표 출력, JSON 저장)
+"""
+
+import json
+import math
+
+
+def percentile(values, p):
+    """nearest-rank 백분위수 (values가 비어 있으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(p / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def latency_summary(values_ms):
+    """지연 시간(ms) 목록 → {count, p50, p95, p99, max}"""
+    return {
+        'count': len(values_ms),
+        'p50': _round(percentile(values_ms, 50)),
+        'p95': _round(percentile(values_ms, 95)),
+        'p99': _round(percentile(values_ms, 99)),
+        'max': _round(max(values_ms) if values_ms else None),
+    }
+
+
+def _round(value):
+    return round(value, 1) if value is not None else None
+
+
+def print_table(rows, columns):
+    """rows(dict 목록)를 columns [(키, 제목), ...] 순서로 정렬된 표로 출력"""
+    header = [title for _, title in columns]
+    body = [['-' if row.get(key) is None else str(row.get(key)) for key, _ in columns] for row in rows]
+    widths = [max(_width(cell) for cell in [title] + [line[i] for line in body]) for i, title in enumerate(header)]
+    print('  '.join(_pad(title, widths[i]) for i, title in enumerate(header)))
+    print('  '.join('-' * width for width in widths))
+    for line in body:
+        print('  '.join(_pad(cell, widths[i]) for i, cell in enumerate(line)))
+
+
+def _width(text):
+    # 한글은 터미널에서 두 칸
+    return sum(2 if ord(ch) > 0x1100 else 1 for ch in text)
+
+
+def _pad(text, width):
+    return text + ' ' * (width - _width(text))
+
+
+def write_json(path, payload):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2, default=str)
+    print(f"결과 저장: {path}")
@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+API 응답 직렬화/압축 벤치마크 (DB 없이 합성 응답 사용)
+
+엔드포인트별 응답과 같은 형태의 합성 데이터를 만들어 인코더마다 직렬화 시간과 응답 크기를 비교한다.
+
+- legacy: Flask 기본 JSON 공급자 + 뷰에서 행마다 format_date_for_json 변환 (변경 전 방식)
+- stdlib: response_encoding.FastJSONProvider, 표준 json (orjson 미설치 환경)
+- orjson: response_encoding.FastJSONProvider, orjson (설치되어 있을 때만)
+- 크기: 원본, gzip, br(brotli 설치 시) 바이트와 압축 시간
+
+사용 예:
+    python scripts/bench/bench_serialization.py
+    python scripts/bench/bench_serialization.py --repeat 200 --quality-rows 20000 --json bench_serialization.json
+"""
+
+import argparse
+import io
+import os
+import random
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(BENCH_DIR))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+from flask import Flask
+
+import response_encoding
+from bench_common import print_table, write_json
+from response_encoding import FastJSONProvider, compress_body
+
+PARTIES = ['더불어민주당', '국민의힘', '조국혁신당', '개혁신당', '진보당', '무소속']
+VOTE_RESULTS = ['찬성', '반대', '기권', '불참']
+PROC_STAGES = ['접수', '소관위접수', '소관위심사', '본회의의결', '공포', '대안반영폐기']
+
+
+def format_date_for_json(dt):
+    """app.format_date_for_json과 동일 (legacy 인코더의 행별 변환용)"""
+    if dt is None:
+        return None
+    return dt.isoformat()
+
+
+def synthetic_bill(rng, n, with_summary=False):
+    proposal_date = date(2025, 1, 1) + timedelta(days=rng.randrange(300))
+    bill = {
+        'bill_id': f'PRC_B{n:08d}',
+        'bill_no': str(2200000 + n),
+        'title': f'주택임대차보호법 일부개정법률안({rng.choice(["김", "이", "박"])}의원 등 {rng.randint(10, 15)}인)',
+        'proposal_date': proposal_date,
+        'proposer_kind': '의원',
+        'proposer_name': '홍길동의원 등 10인',
+        'proc_stage_cd': rng.choice(PROC_STAGES),
+        'pass_gubn': rng.choice(['계류의안', '처리의안']),
+        'proc_date': proposal_date + timedelta(days=rng.randrange(60)) if rng.random() < 0.4 else None,
+        'general_result': None,
+        'link_url': f'https://likms.assembly.go.kr/bill/billDetail.do?billId=PRC_B{n:08d}',
+        'vote_count': 0, 'vote_for': 0, 'vote_against': 0, 'vote_abstain': 0, 'vote_absent': 0, 'member_count': 0,
+    }
+    if with_summary:
+        bill.update({
+            'summary_raw': '제안이유 및 주요내용 ' * 80,
+            'headline': '전세사기 피해 임차인 보호 강화',
+            'summary': '임차인의 보증금 반환을 보장하기 위해 ' * 10,
+            'categories': ['부동산', '민생'],
+            'vote_for': {'P': 1, 'M': 0}, 'vote_against': {'P': 0, 'M': 1},
+            'created_at': datetime(2025, 1, 1, 9, 0, 0),
+            'updated_at': datetime(2025, 3, 1, 12, 30, 15, 123456),
+        })
+    return bill
+
+
+def payload_bill_detail(rng, members):
+    bill = synthetic_bill(rng, 1, with_summary=True)
+    bill['party_votes'] = [{'party_name': p, 'total': 50, 'vote_for': 40, 'vote_against': 5,
+                            'vote_abstain': 3, 'vote_absent': 2} for p in PARTIES]
+    by_result = {result: [] for result in VOTE_RESULTS}
+    for i in range(members):
+        result = rng.choice(VOTE_RESULTS)
+        by_result[result].append({
+            'member_name': f'의원{i:03d}', 'party_name': rng.choice(PARTIES), 'district_name': '서울 종로구',
+            'vote_result': result, 'member_id': f'M{i:05d}', 'photo_url': f'https://www.assembly.go.kr/photo/{i}.jpg',
+        })
+    bill['member_votes_by_result'] = by_result
+    return bill, ('proposal_date', 'proc_date', 'created_at', 'updated_at'), None
+
+
+def payload_bills_page(rng, per_page):
+    bills = [synthetic_bill(rng, n) for n in range(per_page)]
+    payload = {'bills': bills, 'pagination': {'mode': 'cursor', 'per_page': per_page, 'next_cursor': 'x' * 60,
+                                              'has_more': True, 'total': 12000, 'total_is_estimate': True}}
+    return payload, None, ('bills', ('proposal_date', 'proc_date'))
+
+
+def payload_quality_stats(rng, rows):
+    bills = [{
+        'bill_id': f'PRC_B{n:08d}', 'bill_no': str(2200000 + n), 'title': '의안 제목 ' * 4,
+        'proposer_kind': '의원', 'pass_gubn': '계류의안', 'proc_stage_cd': rng.choice(PROC_STAGES),
+        'filled_fields': rng.randint(8, 16), 'total_fields': 16, 'completion_rate': round(rng.random() * 100, 1),
+    } for n in range(rows)]
+    fields = [{'field': f'field_{i}', 'label': f'필드 {i}', 'filled': rows - i, 'total': rows,
+               'rate': 99.0} for i in range(16)]
+    return {'total_bills': rows, 'fields': fields, 'bills': bills}, None, None
+
+
+def legacy_prepare(payload, top_dates, row_dates):
+    """변경 전 뷰 코드처럼 dict를 복사하며 날짜 필드를 문자열로 변환"""
+    if top_dates:
+        payload = dict(payload)
+        for key in top_dates:
+            payload[key] = format_date_for_json(payload.get(key))
+    if row_dates:
+        list_key, keys = row_dates
+        rows = []
+        for row in payload[list_key]:
+            row = dict(row)
+            for key in keys:
+                row[key] = format_date_for_json(row[key])
+            rows.append(row)
+        payload = dict(payload, **{list_key: rows})
+    return payload
+
+
+@contextmanager
+def orjson_disabled():
+    saved = response_encoding.orjson
+    response_encoding.orjson = None
+    try:
+        yield
+    finally:
+        response_encoding.orjson = saved
+
+
+def build_encoders():
+    legacy_app = Flask('bench_legacy')
+    fast_app = Flask('bench_fast')
+    fast_app.json = FastJSONProvider(fast_app)
+
+    def legacy(payload, top_dates, row_dates):
+        with legacy_app.app_context():
+            return legacy_app.json.response(legacy_prepare(payload, top_dates, row_dates)).get_data()
+
+    def stdlib(payload, top_dates, row_dates):
+        with fast_app.app_context(), orjson_disabled():
+            return fast_app.json.response(payload).get_data()
+
+    def fast_orjson(payload, top_dates, row_dates):
+        with fast_app.app_context():
+            return fast_app.json.response(payload).get_data()
+
+    encoders = [('legacy', legacy), ('stdlib', stdlib)]
+    if response_encoding.orjson is not None:
+        encoders.append(('orjson', fast_orjson))
+    return encoders
+
+
+def time_ms(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), result
+
+
+def main():
+    ap = argparse.ArgumentParser(description="API 응답 직렬화/압축 벤치마크 (합성 응답)")
+    ap.add_argument("--repeat", type=int, default=50, help="측정 반복 횟수 (중앙값 사용, 기본: 50)")
+    ap.add_argument("--members", type=int, default=300, help="의안 상세의 의원별 표결 수 (기본: 300)")
+    ap.add_argument("--per-page", type=int, default=100, help="의안 목록 한 페이지 의안 수 (기본: 100)")
+    ap.add_argument("--quality-rows", type=int, default=5000, help="품질 통계 의안 수 (기본: 5000)")
+    ap.add_argument("--seed", type=int, default=42, help="난수 시드 (기본: 42)")
+    ap.add_argument("--json", default=None, help="결과를 JSON 파일로 저장")
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    payloads = [
+        ('bill_detail', payload_bill_detail(rng, args.members)),
+        ('bills_page', payload_bills_page(rng, args.per_page)),
+        ('bills_quality', payload_quality_stats(rng, args.quality_rows)),
+    ]
+    encodings = ['gzip'] + (['br'] if response_encoding.brotli is not None else [])
+    print(f"orjson: {'사용' if response_encoding.orjson is not None else '미설치'}, "
+          f"brotli: {'사용' if response_encoding.brotli is not None else '미설치'}, 반복 {args.repeat}회\n")
+
+    rows = []
+    for name, (payload, top_dates, row_dates) in payloads:
+        for encoder_name, encoder in build_encoders():
+            ms, body = time_ms(lambda: encoder(payload, top_dates, row_dates), args.repeat)
+            row = {'endpoint': name, 'encoder': encoder_name, 'serialize_ms': round(ms, 3), 'bytes': len(body)}
+            for encoding in encodings:
+                compress_ms, compressed = time_ms(lambda: compress_body(body, encoding), max(1, args.repeat // 5))
+                row[f'{encoding}_bytes'] = len(compressed)
+                row[f'{encoding}_ms'] = round(compress_ms, 3)
+            rows.append(row)
+
+    columns = [('endpoint', '엔드포인트'), ('encoder', '인코더'), ('serialize_ms', '직렬화(ms)'), ('bytes', '원본(B)')]
+    for encoding in encodings:
+        columns += [(f'{encoding}_bytes', f'{encoding}(B)'), (f'{encoding}_ms', f'{encoding}(ms)')]
+    print_table(rows, columns)
+
+    if args.json:
+        write_json(args.json, {'args': vars(args), 'results': rows})
+
+
+if __name__ == '__main__':
+    main()
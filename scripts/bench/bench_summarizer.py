@@ -0,0 +1,340 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+AI 요약 처리량 벤치마크 (Gemini 할당량을 쓰지 않는 오프라인 실행)
+
+bill_headline_summarizer_db.process_batch를 그대로 실행하되 genai.GenerativeModel 자리에
+지연 시간, 오류율, 429(분당/일일 할당량)를 설정할 수 있는 스텁 모델을 넣는다.
+동시 호출(키 수, 키당 작업 스레드)이나 묶음 요청(--prompt-batch)을 바꿨을 때 처리량 변화를 비교하는 용도.
+
+- 의안: 합성 데이터 (기본) 또는 --db: 실제 DB의 미처리 의안 점유/저장 (요약이 실제로 저장되므로 벤치마크용 DB에서만)
+- DB 저장: 합성 모드에서는 flush마다 --write-latency-ms만큼 지연하는 메모리 writer
+- 결과: 의안/초, 요청 지연 p50/p95, DB 저장 시간, 키별 요청 분배(429, 소진 여부)
+
+사용 예:
+    python scripts/bench/bench_summarizer.py                      # 기본 시나리오 묶음
+    python scripts/bench/bench_summarizer.py --bills 300 --keys 3 --prompt-batch 5 --latency-ms 800
+    python scripts/bench/bench_summarizer.py --rate-limit-rate 0.05 --daily-quota 40 --json bench_summarizer.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(BENCH_DIR))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'ai_summarizer'))
+sys.path.insert(0, PROJECT_ROOT)
+
+import bill_headline_summarizer_db as summarizer
+from bench_common import latency_summary, print_table, write_json
+
+# 기본 시나리오: (이름, 설정 덮어쓰기)
+DEFAULT_SCENARIOS = [
+    ("단건, 키 1개", {'keys': 1, 'prompt_batch': 1}),
+    ("단건, 키 3개", {'keys': 3, 'prompt_batch': 1}),
+    ("묶음 5, 키 3개", {'keys': 3, 'prompt_batch': 5}),
+    ("묶음 5, 키 3개, 429 10%", {'keys': 3, 'prompt_batch': 5, 'rate_limit_rate': 0.1}),
+    ("단건, 키 3개, 일일 할당량 30", {'keys': 3, 'prompt_batch': 1, 'daily_quota': 30}),
+]
+
+
+class StubStats:
+    """스텁 모델 호출 기록 (작업 스레드에서 동시에 기록)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies_ms = []
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.per_key = {}
+
+    def count_key(self, api_key):
+        with self.lock:
+            self.requests += 1
+            self.per_key[api_key] = self.per_key.get(api_key, 0) + 1
+            return self.per_key[api_key]
+
+    def record(self, elapsed_ms, error=None):
+        with self.lock:
+            self.latencies_ms.append(elapsed_ms)
+            if error == 'rate_limit':
+                self.rate_limited += 1
+            elif error:
+                self.errors += 1
+
+
+class StubResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class StubGenerativeModel:
+    """genai.GenerativeModel 대역: generate_content만 흉내 (지연 + 오류/429 주입 + 요청 형식에 맞는 JSON 응답)"""
+
+    def __init__(self, options, stats, api_key, batch):
+        self.options = options
+        self.stats = stats
+        self.api_key = api_key
+        self.batch = batch
+
+    def generate_content(self, prompt, request_options=None):
+        options = self.options
+        used = self.stats.count_key(self.api_key)
+        started = time.time()
+        latency = options['latency_ms'] * random.lognormvariate(0, options['jitter']) / 1000.0
+        if self.batch:
+            # 묶음 요청은 의안 수만큼 출력이 길어짐
+            latency *= 1 + options['batch_overhead'] * (prompt.count('- id:') - 1)
+        time.sleep(latency)
+
+        if options['daily_quota'] and used > options['daily_quota']:
+            self.stats.record((time.time() - started) * 1000, 'rate_limit')
+            raise Exception("429 Resource has been exhausted: GenerateRequestsPerDayPerProjectPerModel quota exceeded")
+        roll = random.random()
+        if roll < options['rate_limit_rate']:
+            self.stats.record((time.time() - started) * 1000, 'rate_limit')
+            raise Exception("429 Resource has been exhausted (e.g. check quota).")
+        if roll < options['rate_limit_rate'] + options['error_rate']:
+            self.stats.record((time.time() - started) * 1000, 'error')
+            raise Exception("500 An internal error has occurred")
+
+        self.stats.record((time.time() - started) * 1000)
+        if self.batch:
+            ids = re.findall(r"- id: (\d+)", prompt)
+            items = [stub_item(i) for i in ids if random.random() >= options['item_drop_rate']]
+            return StubResponse(json.dumps(items, ensure_ascii=False))
+        return StubResponse(json.dumps(stub_item(None), ensure_ascii=False))
+
+
+def stub_item(item_id):
+    item = {
+        "headline": "공공 임대주택 공급 대상을 청년까지 넓혀 주거 부담 완화",
+        "summary": "청년도 공공 임대주택을 신청할 수 있게 한다. 주거비 부담을 줄이려는 취지다.",
+        "categories": ["주거"],
+        "vote": {"for": {"P": 1, "U": 1}, "against": {"M": 1, "T": 1}},
+    }
+    if item_id is not None:
+        item = {"id": item_id, **item}
+    return item
+
+
+class SyntheticBacklog:
+    """claim_unprocessed_bills/release_claims 대역 (합성 의안 목록에서 앞에서부터 점유)"""
+
+    def __init__(self, count, body_chars):
+        body = ("이 법은 청년의 주거 안정을 위하여 공공 임대주택 공급 대상을 확대하려는 것임. " * 40)[:body_chars]
+        self.pending = [
+            {'bill_id': f"BENCH_{i:07d}", 'title': f"주택법 일부개정법률안 {i}", 'body': body}
+            for i in range(count)
+        ]
+        self.lock = threading.Lock()
+
+    def claim(self, conn, limit=50, start_date=None, lease_seconds=None, owner=None):
+        with self.lock:
+            claimed, self.pending = self.pending[:limit], self.pending[limit:]
+        return claimed
+
+    def release(self, conn, bill_ids, owner=None):
+        return len(bill_ids)  # 합성 모드에서는 할당량 소진으로 남은 의안을 다시 돌리지 않음 (무한 반복 방지)
+
+
+class MemoryWriter:
+    """SummaryWriter 대역: add/flush 인터페이스 동일, flush마다 write_latency_ms + 행당 row_latency_ms 지연"""
+
+    def __init__(self, batch_size, write_latency_ms, row_latency_ms):
+        self.conn = None
+        self.batch_size = max(1, batch_size)
+        self.write_latency = write_latency_ms / 1000.0
+        self.row_latency = row_latency_ms / 1000.0
+        self.pending = []
+        self.total_written = 0
+        self.flushes = 0
+        self.write_time = 0.0
+
+    def add(self, result):
+        self.pending.append(result.bill_id)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return 0
+        started = time.time()
+        time.sleep(self.write_latency + self.row_latency * len(self.pending))
+        self.write_time += time.time() - started
+        written = len(self.pending)
+        self.total_written += written
+        self.flushes += 1
+        self.pending = []
+        return written
+
+    def close(self):
+        self.flush()
+
+
+def run_scenario(name, options, verbose=False):
+    """시나리오 하나 실행 → 결과 dict"""
+    random.seed(options['seed'])
+    stats = StubStats()
+    summarizer.HAS_GENAI = True
+    summarizer.get_gemini_model = lambda model_name, api_key, batch=False: StubGenerativeModel(options, stats, api_key, batch)
+    summarizer.publish_invalidation = lambda *tags: True
+
+    if options['db']:
+        writer = summarizer.SummaryWriter(batch_size=options['write_batch'], journal_path=None)
+    else:
+        backlog = SyntheticBacklog(options['bills'], options['body_chars'])
+        summarizer.claim_unprocessed_bills = backlog.claim
+        summarizer.release_claims = backlog.release
+        writer = MemoryWriter(options['write_batch'], options['write_latency_ms'], options['row_latency_ms'])
+
+    api_keys = [f"bench-key-{i + 1:02d}" for i in range(options['keys'])]
+    worker_pool = summarizer.build_worker_pool('stub-model', api_keys, rpm=options['rpm'], tpm=options['tpm'],
+                                               rpd=options['rpd'], workers_per_key=options['workers_per_key'])
+    for budget in worker_pool.budgets:
+        budget.base_backoff = options['backoff']
+        budget.max_backoff = options['backoff'] * 8
+    batch_pool = (summarizer.build_batch_pool('stub-model', worker_pool)
+                  if options['prompt_batch'] > 1 else None)
+
+    success = error = batches = 0
+    quota_exceeded = False
+    started = time.time()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(sys.stdout if verbose else output):
+        while options['max_bills'] is None or success + error < options['max_bills']:
+            batches += 1
+            ok, failed, quota_exceeded = summarizer.process_batch(
+                'stub-model', batch_size=options['batch_size'], worker_pool=worker_pool, writer=writer,
+                batch_pool=batch_pool, prompt_batch=options['prompt_batch'])
+            success += ok
+            error += failed
+            if quota_exceeded or (ok == 0 and failed == 0):
+                break
+        writer.close()
+    elapsed = time.time() - started
+
+    keys = []
+    for budget in worker_pool.budgets:
+        key_stats = budget.stats()
+        keys.append({
+            'key': budget.api_key,
+            'requests': stats.per_key.get(budget.api_key, 0),
+            'success': key_stats['success'],
+            'rate_limited': key_stats['rate_limited'],
+            'exhausted': key_stats['exhausted'],
+        })
+    latency = latency_summary(stats.latencies_ms)
+    return {
+        'scenario': name,
+        'options': {k: v for k, v in options.items() if k != 'db'},
+        'bills_ok': success,
+        'bills_failed': error,
+        'batches': batches,
+        'elapsed_s': round(elapsed, 2),
+        'bills_per_s': round(success / elapsed, 2) if elapsed else None,
+        'requests': stats.requests,
+        'requests_per_bill': round(stats.requests / success, 2) if success else None,
+        'latency_p50_ms': latency['p50'],
+        'latency_p95_ms': latency['p95'],
+        'errors_injected': stats.errors,
+        'rate_limited': stats.rate_limited,
+        'db_write_s': round(writer.write_time, 3),
+        'db_flushes': writer.flushes,
+        'quota_exceeded': quota_exceeded,
+        'keys': keys,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="AI 요약 처리량 오프라인 벤치마크 (스텁 Gemini 모델)")
+    ap.add_argument("--bills", type=int, default=120, help="합성 의안 수 (기본: 120)")
+    ap.add_argument("--max-bills", type=int, default=None, help="--db 모드에서 처리할 최대 의안 수")
+    ap.add_argument("--body-chars", type=int, default=1200, help="합성 의안 본문 길이 (기본: 1200자)")
+    ap.add_argument("--keys", type=int, default=None, help="API 키 수 (지정하면 기본 시나리오 대신 이 설정 하나만 실행)")
+    ap.add_argument("--prompt-batch", type=int, default=None, help="묶음 요청 의안 수 (지정하면 단일 시나리오)")
+    ap.add_argument("--workers-per-key", type=int, default=2, help="키당 작업 스레드 (기본: 2)")
+    ap.add_argument("--batch-size", type=int, default=50, help="process_batch 한 번에 점유할 의안 수 (기본: 50)")
+    ap.add_argument("--write-batch", type=int, default=10, help="한 번에 저장할 결과 수 (기본: 10)")
+    ap.add_argument("--rpm", type=int, default=600, help="키당 분당 요청 수 (기본: 600, 스텁이므로 실제 한도보다 크게)")
+    ap.add_argument("--tpm", type=int, default=10000000, help="키당 분당 토큰 수")
+    ap.add_argument("--rpd", type=int, default=100000, help="키당 일일 요청 수 (KeyBudget 상한)")
+    ap.add_argument("--backoff", type=float, default=0.5, help="429 기본 백오프(초) (기본: 0.5, 실제 실행은 5)")
+    ap.add_argument("--latency-ms", type=float, default=200, help="스텁 응답 지연 중앙값(ms) (기본: 200)")
+    ap.add_argument("--jitter", type=float, default=0.3, help="지연 분산 (로그정규 sigma, 기본: 0.3)")
+    ap.add_argument("--batch-overhead", type=float, default=0.3,
+                    help="묶음 요청에서 의안 1개가 늘 때마다 추가되는 지연 비율 (기본: 0.3)")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="500 오류 비율 (기본: 0)")
+    ap.add_argument("--rate-limit-rate", type=float, default=0.0, help="429(분당) 비율 (기본: 0)")
+    ap.add_argument("--daily-quota", type=int, default=0, help="키당 이 요청 수를 넘으면 일일 할당량 429 (0이면 없음)")
+    ap.add_argument("--item-drop-rate", type=float, default=0.0, help="묶음 응답에서 항목이 빠지는 비율 (기본: 0)")
+    ap.add_argument("--write-latency-ms", type=float, default=5.0, help="합성 DB 저장 1회 지연(ms) (기본: 5)")
+    ap.add_argument("--row-latency-ms", type=float, default=0.2, help="합성 DB 저장 행당 지연(ms) (기본: 0.2)")
+    ap.add_argument("--db", action="store_true",
+                    help="실제 DB의 미처리 의안을 점유/저장 (요약이 저장되므로 벤치마크용 DB에서만 사용)")
+    ap.add_argument("--seed", type=int, default=42, help="난수 시드 (기본: 42)")
+    ap.add_argument("--verbose", action="store_true", help="process_batch 출력 표시")
+    ap.add_argument("--json", default=None, help="결과를 JSON 파일로 저장")
+    args = ap.parse_args()
+
+    base = {
+        'bills': args.bills, 'max_bills': args.max_bills, 'body_chars': args.body_chars,
+        'keys': args.keys or 1, 'prompt_batch': args.prompt_batch or 1,
+        'workers_per_key': args.workers_per_key, 'batch_size': args.batch_size, 'write_batch': args.write_batch,
+        'rpm': args.rpm, 'tpm': args.tpm, 'rpd': args.rpd, 'backoff': args.backoff,
+        'latency_ms': args.latency_ms, 'jitter': args.jitter, 'batch_overhead': args.batch_overhead,
+        'error_rate': args.error_rate, 'rate_limit_rate': args.rate_limit_rate, 'daily_quota': args.daily_quota,
+        'item_drop_rate': args.item_drop_rate, 'write_latency_ms': args.write_latency_ms,
+        'row_latency_ms': args.row_latency_ms, 'db': args.db, 'seed': args.seed,
+    }
+    if args.keys is not None or args.prompt_batch is not None or args.db:
+        scenarios = [("사용자 지정", {})]
+    else:
+        scenarios = DEFAULT_SCENARIOS
+
+    if args.db:
+        print("⚠️ --db: 설정된 DB의 미처리 의안에 스텁 요약이 저장됩니다. 벤치마크용 DB인지 확인하세요.")
+        if args.max_bills is None:
+            base['max_bills'] = args.bills
+
+    results = []
+    for name, overrides in scenarios:
+        print(f"[실행] {name}...", flush=True)
+        results.append(run_scenario(name, {**base, **overrides}, verbose=args.verbose))
+
+    print()
+    print_table(results, [
+        ('scenario', '시나리오'), ('bills_ok', '성공'), ('bills_failed', '실패'), ('elapsed_s', '시간(s)'),
+        ('bills_per_s', '의안/초'), ('requests', '요청'), ('requests_per_bill', '요청/의안'),
+        ('latency_p50_ms', 'p50(ms)'), ('latency_p95_ms', 'p95(ms)'), ('rate_limited', '429'),
+        ('db_write_s', 'DB 저장(s)'), ('db_flushes', 'flush'),
+    ])
+    print()
+    print("키별 요청 분배 (요청/성공/429, 소진 여부)")
+    for result in results:
+        shares = ', '.join(
+            f"{key['key'][-2:]}: {key['requests']}/{key['success']}/{key['rate_limited']}{' 소진' if key['exhausted'] else ''}"
+            for key in result['keys']
+        )
+        quota = ' → 전체 할당량 소진' if result['quota_exceeded'] else ''
+        print(f"  {result['scenario']}: {shares}{quota}")
+
+    if args.json:
+        write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+수집 스크립트 공용 대량 적재 도우미
+
+- COPY ... FROM STDIN (text 형식)으로 여러 행을 한 번에 임시 테이블에 적재
+- 이후 INSERT ... SELECT ... ON CONFLICT 한 번으로 본 테이블에 반영 (행마다 왕복하지 않음)
+- upsert_rows: execute_values로 한 페이지를 한 번에 upsert, 원본 해시(source_hash)가 같은 행은 UPDATE하지 않음
+"""
+
+import hashlib
+import io
+import json
+from datetime import date, datetime
+
+from psycopg2.extras import execute_values
+
+
+def json_default(value):
+    """json.dumps용: 날짜는 ISO 문자열"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def content_hash(values):
+    """값 목록의 체크섬 (순서 포함, 날짜는 ISO 문자열로 비교)"""
+    encoded = json.dumps(values, ensure_ascii=False, default=json_default, separators=(',', ':'))
+    return hashlib.md5(encoded.encode('utf-8')).hexdigest()
+
+
+def _copy_value(value):
+    """COPY text 형식 값 (NULL은 \\N, 특수문자 이스케이프)"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, (datetime, date)):
+        return value.isoformat(sep=' ') if isinstance(value, datetime) else value.isoformat()
+    text = str(value)
+    return (text.replace('\\', '\\\\')
+                .replace('\t', '\\t')
+                .replace('\n', '\\n')
+                .replace('\r', '\\r'))
+
+
+def copy_rows(cur, table, columns, rows):
+    """rows(튜플 목록)를 COPY로 table에 적재. 적재한 행 수 반환"""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write('\t'.join(_copy_value(value) for value in row))
+        buffer.write('\n')
+    buffer.seek(0)
+    cur.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+    return len(rows)
+
+
+def upsert_rows(cur, table, columns, rows, key_column, hash_column='source_hash', page_size=500):
+    """rows(튜플, columns 순서)를 execute_values로 한 번에 upsert
+
+    - 행마다 columns 값의 해시를 hash_column에 저장하고, 기존 행의 해시가 같으면 UPDATE하지 않음
+      (updated_at, WAL이 변경 없는 행 때문에 늘지 않음)
+    - 같은 키가 여러 번 있으면 마지막 행만 사용 (ON CONFLICT는 한 문장에서 같은 행을 두 번 갱신할 수 없음)
+
+    반환: (신규, 업데이트, 변경 없음) 건수
+    """
+    key_index = columns.index(key_column)
+    unique_rows = list({row[key_index]: row for row in rows}.values())
+    if not unique_rows:
+        return 0, 0, 0
+
+    update_columns = [c for c in columns if c != key_column] + [hash_column]
+    placeholders = ', '.join(['%s'] * (len(columns) + 1))
+    results = execute_values(cur, f"""
+        INSERT INTO {table} ({', '.join(columns)}, {hash_column}, created_at, updated_at)
+        VALUES %s
+        ON CONFLICT ({key_column}) DO UPDATE SET
+            {', '.join(f'{c} = EXCLUDED.{c}' for c in update_columns)},
+            updated_at = CURRENT_TIMESTAMP
+        WHERE {table}.{hash_column} IS DISTINCT FROM EXCLUDED.{hash_column}
+        RETURNING (xmax = 0) AS inserted
+    """, [tuple(row) + (content_hash(list(row)),) for row in unique_rows],
+        template=f"({placeholders}, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)",
+        page_size=page_size, fetch=True)
+
+    inserted = sum(1 for (is_insert,) in results if is_insert)
+    updated = len(results) - inserted
+    return inserted, updated, len(unique_rows) - len(results)
@@ -7,17 +7,24 @@
 
 import os
 import sys
-import psycopg2
-from xml.etree import ElementTree as ET
-import requests
 from datetime import datetime
-import time
 
 if sys.platform == 'win32':
     import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 프로젝트 루트의 공용 모듈 (db_pool, cache_backend, rate_limit)
+sys.path.insert(0, PROJECT_ROOT)
+from db_pool import ConnectionPool, pool_settings_from_env
+from cache_backend import publish_invalidation
+from rate_limit import TokenBucket
+from fetch_engine import make_session
+from page_stream import Field, RecordSpec, fetch_records, prefetch
+from bulk_load import upsert_rows
+
 ASSEMBLY_KEY = os.environ.get("ASSEMBLY_SERVICE_KEY")
 if not ASSEMBLY_KEY:
     raise ValueError("ASSEMBLY_SERVICE_KEY environment variable is required")
@@ -56,9 +63,14 @@ def get_db_config():
             'port': 5432
         }
 
-def get_db_connection():
-    config = get_db_config()
-    return psycopg2.connect(**config)
+_db_pool = None
+
+def get_db_pool():
+    """스크립트용 커넥션 풀 (DB_POOL_MAX 등 환경 변수로 조정, 수집 쿼리는 타임아웃 없음)"""
+    global _db_pool
+    if _db_pool is None:
+        _db_pool = ConnectionPool(get_db_config(), **pool_settings_from_env(maxconn=4, statement_timeout_ms=0))
+    return _db_pool
 
 def parse_date(date_str):
     if not date_str:
@@ -72,13 +84,62 @@ def parse_date(date_str):
         pass
     return None
 
+# 의원 API 항목(row) → dict (빈 값은 NULL로 저장, member_id/name만 빈 문자열 유지)
+MEMBER_ROW_SPEC = RecordSpec('row', [
+    # 기본 정보
+    Field('member_id', 'NAAS_CD'),
+    Field('name', 'NAAS_NM'),
+    Field('name_chinese', 'NAAS_CH_NM', empty=None),
+    Field('name_english', 'NAAS_EN_NM', empty=None),
+    # 정당 및 선거 정보
+    Field('party', 'PLPT_NM', empty=None),
+    Field('district', 'ELECD_NM', empty=None),
+    Field('district_type', 'ELECD_DIV_NM', empty=None),
+    # 위원회 정보
+    Field('committee', 'BLNG_CMIT_NM', empty=None),
+    Field('current_committee', 'CMIT_NM', empty=None),
+    # 경력 정보
+    Field('era', 'GTELT_ERACO', empty=None),
+    Field('election_type', 'RLCT_DIV_NM', empty=None),
+    # 개인 정보
+    Field('gender', 'NTR_DIV', empty=None),
+    Field('birth_date', 'BIRDY_DT', convert=parse_date),
+    Field('birth_type', 'BIRDY_DIV_CD', empty=None),
+    Field('duty_name', 'DTY_NM', empty=None),
+    # 연락처 정보
+    Field('phone', 'NAAS_TEL_NO', empty=None),
+    Field('email', 'NAAS_EMAIL_ADDR', empty=None),
+    Field('homepage_url', 'NAAS_HP_URL', empty=None),
+    Field('office_room', 'OFFM_RNUM_NO', empty=None),
+    # 보좌진 정보
+    Field('aide_name', 'AIDE_NM', empty=None),
+    Field('secretary_name', 'CHF_SCRT_NM', empty=None),
+    Field('assistant_name', 'SCRT_NM', empty=None),
+    # 기타 정보
+    Field('photo_url', 'NAAS_PIC', empty=None),
+    Field('brief_history', 'BRF_HST', empty=None),
+])
+
+# assembly_members 저장 컬럼 (MEMBER_ROW_SPEC 필드 순서와 동일)
+MEMBER_COLUMNS = [field.name for field in MEMBER_ROW_SPEC.fields]
+
+def member_api_params(page, page_size):
+    return {
+        "KEY": ASSEMBLY_KEY,
+        "Type": "xml",
+        "pIndex": page,
+        "pSize": page_size,
+        "AGE": "22"
+    }
+
 def collect_22nd_members_complete():
     """22대 모든 국회의원 정보 완전 수집"""
-    conn = get_db_connection()
+    conn = get_db_pool().getconn()
     cur = conn.cursor()
     
     total_inserted = 0
     total_updated = 0
+    total_unchanged = 0
     
     print("=" * 80)
     print("22대 모든 국회의원 정보 완전 수집 시작")
@@ -89,22 +150,25 @@ def collect_22nd_members_complete():
     page_size = 300
     max_pages = 10  # 22대는 약 300명이므로 충분
     
-    while page <= max_pages:
-        print(f"\n페이지 {page} 처리 중...")
-        params = {
-            "KEY": ASSEMBLY_KEY,
-            "Type": "xml",
-            "pIndex": page,
-            "pSize": page_size,
-            "AGE": "22"
-        }
-        
+    session = make_session(pool_size=1)
+    bucket = TokenBucket(rate=1.0, capacity=1)  # API 호출 제한 (초당 1회)
+    
+    def fetch_page(page):
+        return fetch_records(session, MEMBER_INFO_API, member_api_params(page, page_size),
+                             MEMBER_ROW_SPEC, bucket)
+    
+    # 다음 페이지는 현재 페이지를 저장하는 동안 미리 조회 (가득 찬 페이지일 때만)
+    pages = prefetch(range(1, max_pages + 1), fetch_page,
+                     has_more=lambda result: len(result.records) >= page_size)
+    
+    while True:
         try:
-            response = requests.get(MEMBER_INFO_API, params=params, timeout=30)
-            response.raise_for_status()
-            
-            root = ET.fromstring(response.text)
-            items = root.findall(".//row")
+            fetched = next(pages, None)
+            if fetched is None:
+                break
+            page, result = fetched
+            items = result.records
+            print(f"\n페이지 {page} 처리 중...")
             
             if not items:
                 print(f"  페이지 {page}: 데이터 없음, 수집 종료")
@@ -112,153 +176,47 @@ def collect_22nd_members_complete():
             
             print(f"  페이지 {page}: {len(items)}건 조회")
             
-            page_inserted = 0
-            page_updated = 0
-            
-            for item in items:
-                member_id = item.findtext("NAAS_CD", "").strip()
-                if not member_id:
-                    continue
-                
-                # 기본 정보
-                name = item.findtext("NAAS_NM", "").strip()
-                name_chinese = item.findtext("NAAS_CH_NM", "").strip() or None
-                name_english = item.findtext("NAAS_EN_NM", "").strip() or None
-                
-                # 정당 및 선거 정보
-                party = item.findtext("PLPT_NM", "").strip() or None
-                district = item.findtext("ELECD_NM", "").strip() or None
-                district_type = item.findtext("ELECD_DIV_NM", "").strip() or None
-                
-                # 위원회 정보
-                committee = item.findtext("BLNG_CMIT_NM", "").strip() or None
-                current_committee = item.findtext("CMIT_NM", "").strip() or None
-                
-                # 경력 정보
-                era = item.findtext("GTELT_ERACO", "").strip() or None
-                election_type = item.findtext("RLCT_DIV_NM", "").strip() or None
-                
-                # 개인 정보
-                gender = item.findtext("NTR_DIV", "").strip() or None
-                birth_date = parse_date(item.findtext("BIRDY_DT", ""))
-                birth_type = item.findtext("BIRDY_DIV_CD", "").strip() or None
-                duty_name = item.findtext("DTY_NM", "").strip() or None
-                
-                # 연락처 정보
-                phone = item.findtext("NAAS_TEL_NO", "").strip() or None
-                email = item.findtext("NAAS_EMAIL_ADDR", "").strip() or None
-                homepage_url = item.findtext("NAAS_HP_URL", "").strip() or None
-                office_room = item.findtext("OFFM_RNUM_NO", "").strip() or None
-                
-                # 보좌진 정보
-                aide_name = item.findtext("AIDE_NM", "").strip() or None
-                secretary_name = item.findtext("CHF_SCRT_NM", "").strip() or None
-                assistant_name = item.findtext("SCRT_NM", "").strip() or None
-                
-                # 기타 정보
-                photo_url = item.findtext("NAAS_PIC", "").strip() or None
-                brief_history = item.findtext("BRF_HST", "").strip() or None
-                
-                # 22대가 아닌 경우 건너뛰기
-                if era and '22대' not in era:
-                    continue
-                
-                try:
-                    cur.execute("""
-                        INSERT INTO assembly_members (
-                            member_id, name, name_chinese, name_english,
-                            party, district, district_type,
-                            committee, current_committee,
-                            era, election_type,
-                            gender, birth_date, birth_type, duty_name,
-                            phone, email, homepage_url, office_room,
-                            aide_name, secretary_name, assistant_name,
-                            photo_url, brief_history,
-                            created_at, updated_at
-                        ) VALUES (
-                            %s, %s, %s, %s,
-                            %s, %s, %s,
-                            %s, %s,
-                            %s, %s,
-                            %s, %s, %s, %s,
-                            %s, %s, %s, %s,
-                            %s, %s, %s,
-                            %s, %s,
-                            CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
-                        )
-                        ON CONFLICT (member_id) 
-                        DO UPDATE SET
-                            name = EXCLUDED.name,
-                            name_chinese = EXCLUDED.name_chinese,
-                            name_english = EXCLUDED.name_english,
-                            party = EXCLUDED.party,
-                            district = EXCLUDED.district,
-                            district_type = EXCLUDED.district_type,
-                            committee = EXCLUDED.committee,
-                            current_committee = EXCLUDED.current_committee,
-                            era = EXCLUDED.era,
-                            election_type = EXCLUDED.election_type,
-                            gender = EXCLUDED.gender,
-                            birth_date = EXCLUDED.birth_date,
-                            birth_type = EXCLUDED.birth_type,
-                            duty_name = EXCLUDED.duty_name,
-                            phone = EXCLUDED.phone,
-                            email = EXCLUDED.email,
-                            homepage_url = EXCLUDED.homepage_url,
-                            office_room = EXCLUDED.office_room,
-                            aide_name = EXCLUDED.aide_name,
-                            secretary_name = EXCLUDED.secretary_name,
-                            assistant_name = EXCLUDED.assistant_name,
-                            photo_url = EXCLUDED.photo_url,
-                            brief_history = EXCLUDED.brief_history,
-                            updated_at = CURRENT_TIMESTAMP
-                    """, (
-                        member_id, name, name_chinese, name_english,
-                        party, district, district_type,
-                        committee, current_committee,
-                        era, election_type,
-                        gender, birth_date, birth_type, duty_name,
-                        phone, email, homepage_url, office_room,
-                        aide_name, secretary_name, assistant_name,
-                        photo_url, brief_history
-                    ))
-                    
-                    if cur.rowcount > 0:
-                        if "INSERT" in str(cur.statusmessage):
-                            page_inserted += 1
-                            total_inserted += 1
-                        else:
-                            page_updated += 1
-                            total_updated += 1
-                
-                except Exception as e:
-                    print(f"  ⚠️ 오류 (MEMBER_ID: {member_id}): {e}")
-                    conn.rollback()
-                    continue
+            # 22대가 아닌 의원은 제외하고 페이지 단위로 한 번에 저장
+            rows = [
+                tuple(item[column] for column in MEMBER_COLUMNS)
+                for item in items
+                if item['member_id'] and not (item['era'] and '22대' not in item['era'])
+            ]
+            try:
+                page_inserted, page_updated, page_unchanged = upsert_rows(
+                    cur, 'assembly_members', MEMBER_COLUMNS, rows, key_column='member_id')
+                conn.commit()
+            except Exception as e:
+                print(f"  ⚠️ 페이지 {page} 저장 오류: {e}")
+                conn.rollback()
+                page_inserted = page_updated = page_unchanged = 0
+            total_inserted += page_inserted
+            total_updated += page_updated
+            total_unchanged += page_unchanged
+            print(f"  ✅ 페이지 {page} 완료 (신규: {page_inserted}, 업데이트: {page_updated}, 변경 없음: {page_unchanged})")
             
-            conn.commit()
-            print(f"  ✅ 페이지 {page} 완료 (신규: {page_inserted}, 업데이트: {page_updated})")
-            
-            # 다음 페이지가 없으면 종료
-            if len(items) < page_size:
-                break
-            
-            page += 1
-            time.sleep(1)  # API 호출 제한
+            page += 1  # 다음 페이지 조회 오류 시 메시지용 (마지막 페이지면 prefetch가 종료)
             
         except Exception as e:
             print(f"  ❌ 페이지 {page} 오류: {e}")
             conn.rollback()
             break
     
+    pages.close()
+    session.close()
     cur.close()
-    conn.close()
+    get_db_pool().putconn(conn)
+    
+    # members 버전 증가 → 웹 API 캐시와 프로세스 내 의원 디렉터리(member_directory.py)가 다시 읽음
+    if total_inserted > 0 or total_updated > 0:
+        publish_invalidation('members')
     
     print("\n" + "=" * 80)
     print(f"수집 완료!")
     print(f"  - 신규 삽입: {total_inserted:,}건")
     print(f"  - 업데이트: {total_updated:,}건")
     print(f"  - 총 처리: {total_inserted + total_updated:,}건")
+    print(f"  - 변경 없음 (UPDATE 생략): {total_unchanged:,}건")
     print("=" * 80)
 
 if __name__ == '__main__':
@@ -3,15 +3,16 @@
 """
 특정 날짜부터 의안 정보 수집 스크립트
 2025-08-01부터 최근까지
+
+--incremental: collector_sync_state 기반 증분 수집 (신규 페이지 + 다시 확인할 때가 된 미확정 의안이 있는 페이지만 조회)
 """
 
+import argparse
+import math
 import os
 import sys
-import psycopg2
 from urllib.parse import unquote
-from xml.etree import ElementTree as ET
-import requests
-from datetime import datetime
+from datetime import datetime, timedelta
 import time
 import re
 
@@ -20,6 +21,20 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 프로젝트 루트의 공용 모듈 (db_pool, cache_backend, rate_limit)
+sys.path.insert(0, PROJECT_ROOT)
+from db_pool import ConnectionPool, pool_settings_from_env
+from cache_backend import publish_invalidation
+from rate_limit import TokenBucket
+from fetch_engine import FetchError, make_session
+from page_stream import Field, RecordSpec, fetch_records, prefetch
+from bulk_load import content_hash, upsert_rows
+from stats_rollup import refresh_bill_stats_rollup
+from sync_state import (list_position, load_item_states, load_sync_state,
+                        page_of_position, save_item_states, save_sync_state, touch_item_states)
+
 # .env 파일 로드
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(script_dir))
@@ -64,6 +79,18 @@ SERVICE_KEY = unquote(ENCODED_SERVICE_KEY)
 
 BILL_INFO_API = "https://apis.data.go.kr/9710000/BillInfoService2/getBillInfoList"
 
+# 증분 수집 설정
+SYNC_SOURCE = 'bills'
+PAGE_SIZE = 100
+# 마지막 전체 동기화 후 이 기간이 지나면 증분 모드도 전체 동기화로 실행 (누락/위치 어긋남 정리)
+FULL_SYNC_INTERVAL_DAYS = int(os.environ.get('BILL_FULL_SYNC_DAYS', '7'))
+# 미확정 의안 재확인: 마지막 변경 후 흐른 시간의 1/RECHECK_AGE_DIVISOR 간격 (최소 RECHECK_MIN, 최대 RECHECK_MAX)
+# 대부분의 의안은 임기 끝까지 계류하므로 매번 모두 다시 조회하지 않고, 한 번에 RECHECK_MAX_PAGES 페이지까지만
+RECHECK_AGE_DIVISOR = 4
+RECHECK_MIN = timedelta(hours=20)  # 매일 실행하면 최근에 바뀐 의안은 매번 확인
+RECHECK_MAX = timedelta(days=int(os.environ.get('BILL_RECHECK_MAX_DAYS', '14')))
+RECHECK_MAX_PAGES = int(os.environ.get('BILL_RECHECK_MAX_PAGES', '30'))
+
 def get_db_config():
     """환경 변수에서 데이터베이스 설정 가져오기"""
     # Railway는 DATABASE_URL 제공
@@ -96,9 +123,14 @@ def get_db_config():
             'port': int(os.environ.get('LOCAL_DB_PORT', '5432'))
         }
 
-def get_db_connection():
-    config = get_db_config()
-    return psycopg2.connect(**config)
+_db_pool = None
+
+def get_db_pool():
+    """스크립트용 커넥션 풀 (DB_POOL_MAX 등 환경 변수로 조정, 수집 쿼리는 타임아웃 없음)"""
+    global _db_pool
+    if _db_pool is None:
+        _db_pool = ConnectionPool(get_db_config(), **pool_settings_from_env(maxconn=4, statement_timeout_ms=0))
+    return _db_pool
 
 def parse_date(date_str):
     if not date_str:
@@ -172,17 +204,123 @@ def calculate_proc_stage_order(proc_stage_cd):
     # 기본값: None
     return None
 
+BILL_COLUMNS = [
+    'bill_id', 'bill_no', 'title', 'proposal_date', 'proposer_kind', 'proposer_name',
+    'proc_stage_cd', 'pass_gubn', 'proc_date', 'general_result',
+    'summary_raw', 'link_url', 'proc_stage_order',
+]
+
+# 상태 변경 감지 필드 (collector_item_state.change_fields에 마지막 값 저장)
+BILL_CHANGE_FIELDS = ['proc_stage_cd', 'pass_gubn', 'proc_date', 'general_result']
+
+# 이 단계/결과에 도달한 의안은 더 이상 상태가 바뀌지 않는 것으로 보고 증분 수집에서 다시 조회하지 않음
+# 더 바뀌지 않는 최종 결과 (정부이송은 공포/재의 전이므로 제외: 증분 수집 범위에 남김)
+SETTLED_KEYWORDS = ['공포', '철회', '폐기', '부결']
+# 법률안이 아닌 의안(결의안, 동의안, 승인안 등)은 공포 단계가 없으므로 가결되면 확정
+PASSED_KEYWORD = '가결'
+
+def bill_api_params(page, page_size=PAGE_SIZE):
+    return {
+        "serviceKey": SERVICE_KEY,
+        "pageNo": page,
+        "numOfRows": page_size,
+        "start_ord": 22,
+        "end_ord": 22,
+    }
+
+# 의안 목록 API 항목(item) → dict (제안자 이름/진행단계 순서 등 파생 필드는 bill_record_from_item에서)
+BILL_ITEM_SPEC = RecordSpec('item', [
+    Field('bill_id', 'billId'),
+    Field('bill_no', 'billNo'),
+    Field('title', 'billName'),
+    Field('proposal_date', 'proposeDt', convert=parse_date),
+    Field('proposer_kind', 'proposerKind'),
+    # 제안자 이름: API 필드 먼저 확인, 없으면 의안 제목에서 추출
+    Field('proposer_name', ('proposerNm', 'proposerName')),
+    Field('proc_stage_cd', 'procStageCd'),
+    Field('pass_gubn', 'passGubn'),
+    Field('proc_date', 'procDt', convert=parse_date),
+    Field('general_result', 'generalResult'),
+    Field('summary_raw', 'summary'),
+])
+
+def bill_record_from_item(item, stage_orders=None):
+    """BILL_ITEM_SPEC 항목 → bills 행 dict (billId 또는 제안일이 없으면 None)
+    
+    stage_orders: 진행단계 코드 → proc_stage_order 캐시 (페이지 단위로 공유, bill_records_from_items 참고)
+    """
+    bill_id = item['bill_id']
+    if not bill_id:
+        return None
+    
+    # proposal_date가 NULL이면 건너뛰기 (날짜 없는 의안은 수집하지 않음)
+    if not item['proposal_date']:
+        return None
+    
+    record = dict(item)
+    if not record['proposer_name']:
+        record['proposer_name'] = extract_proposer_name_from_title(record['title'])
+    # linkUrl 필드는 API에 없으므로 billId로 생성
+    # 국회 의안 상세 페이지: https://likms.assembly.go.kr/bill/billDetail.do?billId={billId}
+    record['link_url'] = f"https://likms.assembly.go.kr/bill/billDetail.do?billId={bill_id}"
+    stage_cd = record['proc_stage_cd']
+    if stage_orders is None:
+        record['proc_stage_order'] = calculate_proc_stage_order(stage_cd)
+    else:
+        if stage_cd not in stage_orders:
+            stage_orders[stage_cd] = calculate_proc_stage_order(stage_cd)
+        record['proc_stage_order'] = stage_orders[stage_cd]
+    return record
+
+def bill_records_from_items(items):
+    """페이지 항목 전체 → (목록 내 index, bills 행 dict) 목록
+    
+    진행단계 코드는 종류가 적으므로 proc_stage_order는 코드별로 한 번만 계산
+    """
+    stage_orders = {}
+    records = []
+    for index, item in enumerate(items):
+        record = bill_record_from_item(item, stage_orders)
+        if record is not None:
+            records.append((index, record))
+    return records
+
+def bill_record_hash(record):
+    """저장되는 전체 필드의 체크섬 (upsert_bills가 저장하는 bills.source_hash와 같은 값)"""
+    return content_hash([record[column] for column in BILL_COLUMNS])
+
+def is_settled_bill(record):
+    """공포·철회·폐기·부결로 끝났거나, 법률안이 아닌 의안이 가결된 의안인지 (정부이송 단계는 아직 진행 중)"""
+    text = f"{record['proc_stage_cd']} {record['general_result']}"
+    if any(keyword in text for keyword in SETTLED_KEYWORDS):
+        return True
+    return '법률안' not in (record['title'] or '') and PASSED_KEYWORD in (record['general_result'] or '')
+
+def upsert_bills(cur, records):
+    """의안 여러 건을 한 번에 저장 (원본 해시가 같은 의안은 UPDATE 생략)
+    
+    반환: (신규, 업데이트, 변경 없음) 건수
+    """
+    return upsert_rows(cur, 'bills', BILL_COLUMNS,
+                       [tuple(record[column] for column in BILL_COLUMNS) for record in records],
+                       key_column='bill_id')
+
+def fetch_bill_page(session, bucket, page, page_size=PAGE_SIZE):
+    """목록 한 페이지 조회 → ParsedPage (records: BILL_ITEM_SPEC 항목, meta: totalCount)"""
+    return fetch_records(session, BILL_INFO_API, bill_api_params(page, page_size), BILL_ITEM_SPEC,
+                         bucket, meta_tags=('totalCount',))
+
+def page_total_count(result):
+    total_count = result.meta.get('totalCount', '')
+    return int(total_count) if total_count.isdigit() else None
+
 def get_latest_proposal_date():
     """DB에서 가장 최근 제안일 가져오기"""
-    conn = get_db_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute("SELECT MAX(proposal_date) FROM bills WHERE proposal_date IS NOT NULL")
-        result = cur.fetchone()
-        return result[0] if result and result[0] else None
-    finally:
-        cur.close()
-        conn.close()
+    with get_db_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT MAX(proposal_date) FROM bills WHERE proposal_date IS NOT NULL")
+            result = cur.fetchone()
+            return result[0] if result and result[0] else None
 
 def collect_bills_from_date(start_date_str=None, end_date_str=None):
     """의안 정보 수집 (최신 데이터만 빠르게 수집)
@@ -191,11 +329,9 @@ def collect_bills_from_date(start_date_str=None, end_date_str=None):
     - start_date_str가 있으면: 해당 날짜 이후 수집
     - 2025년 의안만 수집합니다 (2025-01-01 이후)
     """
-    conn = get_db_connection()
-    cur = conn.cursor()
-    
     total_inserted = 0
     total_updated = 0
+    total_unchanged = 0
     total_skipped_2024 = 0
     total_skipped_old = 0
     
@@ -218,7 +354,6 @@ def collect_bills_from_date(start_date_str=None, end_date_str=None):
         # DB의 최신 제안일 이후만 수집 (빠른 수집)
         if latest_date:
             # 최신일의 다음 날부터 수집 (중복 방지)
-            from datetime import timedelta
             start_date = latest_date + timedelta(days=1)
             print(f"현재 DB의 최신 제안일: {latest_date}")
             print(f"→ {start_date} 이후의 신규 의안만 수집합니다")
@@ -242,167 +377,309 @@ def collect_bills_from_date(start_date_str=None, end_date_str=None):
             return
     
     page = 1
-    page_size = 100
+    page_size = PAGE_SIZE
     max_pages = 1000  # 최대 페이지 수 제한
     
-    while page <= max_pages:
-        print(f"\n페이지 {page} 처리 중...")
-        
-        params = {
-            "serviceKey": SERVICE_KEY,
-            "pageNo": page,
-            "numOfRows": page_size,
-            "start_ord": 22,
-            "end_ord": 22,
-        }
-        
+    session = make_session(pool_size=1)
+    bucket = TokenBucket(rate=1.0, capacity=1)  # API 호출 제한 (초당 1회)
+    
+    # 다음 페이지는 현재 페이지를 저장하는 동안 미리 조회 (가득 찬 페이지일 때만)
+    pages = prefetch(range(1, max_pages + 1), lambda p: fetch_bill_page(session, bucket, p),
+                     has_more=lambda result: len(result.records) >= page_size)
+    
+    with get_db_pool().connection() as conn:
+        cur = conn.cursor()
         try:
-            response = requests.get(BILL_INFO_API, params=params, timeout=30)
-            response.raise_for_status()
-            
-            root = ET.fromstring(response.text)
-            items = root.findall(".//items/item")
+            while True:
+                try:
+                    fetched = next(pages, None)
+                    if fetched is None:
+                        break
+                    page, result = fetched
+                    items = result.records
+                    print(f"\n페이지 {page} 처리 중...")
             
-            if not items:
-                print(f"  페이지 {page}: 데이터 없음, 수집 종료")
-                break
+                    if not items:
+                        print(f"  페이지 {page}: 데이터 없음, 수집 종료")
+                        break
             
-            print(f"  페이지 {page}: {len(items)}건 조회")
+                    print(f"  페이지 {page}: {len(items)}건 조회")
             
-            page_inserted = 0
-            page_updated = 0
-            page_skipped_old = 0
-            early_exit = False
+                    page_skipped_old = 0
+                    page_records = []
             
-            for item in items:
-                bill_id = item.findtext("billId", "").strip()
-                if not bill_id:
-                    continue
-                
-                proposal_date = parse_date(item.findtext("proposeDt", ""))
-                
-                # proposal_date가 NULL이면 건너뛰기 (날짜 없는 의안은 수집하지 않음)
-                if not proposal_date:
-                    continue
-                
-                # 2025-01-01 이전 데이터는 무조건 건너뛰기 (2024년 데이터 방지)
-                if proposal_date < MIN_DATE:
-                    total_skipped_2024 += 1
-                    continue
+                    for _, record in bill_records_from_items(items):
+                        proposal_date = record['proposal_date']
                 
-                # 제안일이 시작일 이전이면 건너뛰기 (이미 수집한 데이터)
-                if proposal_date < start_date:
-                    total_skipped_old += 1
-                    page_skipped_old += 1
-                    continue
-                
-                # 제안일이 종료일 이후인 것은 건너뛰기
-                if end_date and proposal_date > end_date:
-                    continue
+                        # 2025-01-01 이전 데이터는 무조건 건너뛰기 (2024년 데이터 방지)
+                        if proposal_date < MIN_DATE:
+                            total_skipped_2024 += 1
+                            continue
                 
-                bill_no = item.findtext("billNo", "").strip()
-                title = item.findtext("billName", "").strip()
-                proposer_kind = item.findtext("proposerKind", "").strip()
-                # 제안자 이름: API 필드 먼저 확인, 없으면 의안 제목에서 추출
-                proposer_name = item.findtext("proposerNm", "") or item.findtext("proposerName", "")
-                proposer_name = proposer_name.strip() if proposer_name else ""
-                # API 필드에 없으면 의안 제목에서 추출
-                if not proposer_name:
-                    proposer_name = extract_proposer_name_from_title(title)
-                proc_stage_cd = item.findtext("procStageCd", "").strip()
-                pass_gubn = item.findtext("passGubn", "").strip()
-                proc_date = parse_date(item.findtext("procDt", ""))
-                general_result = item.findtext("generalResult", "").strip()
-                summary_raw = item.findtext("summary", "").strip()
-                # linkUrl 필드는 API에 없으므로 billId로 생성
-                # 국회 의안 상세 페이지: https://likms.assembly.go.kr/bill/billDetail.do?billId={billId}
-                link_url = f"https://likms.assembly.go.kr/bill/billDetail.do?billId={bill_id}" if bill_id else ""
-                # proc_stage_order 계산
-                proc_stage_order = calculate_proc_stage_order(proc_stage_cd)
+                        # 제안일이 시작일 이전이면 건너뛰기 (이미 수집한 데이터)
+                        if proposal_date < start_date:
+                            total_skipped_old += 1
+                            page_skipped_old += 1
+                            continue
                 
-                try:
-                    cur.execute("""
-                        INSERT INTO bills (
-                            bill_id, bill_no, title, proposal_date, proposer_kind, proposer_name,
-                            proc_stage_cd, pass_gubn, proc_date, general_result,
-                            summary_raw, link_url, proc_stage_order, created_at, updated_at
-                        ) VALUES (
-                            %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s,
-                            %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
-                        )
-                        ON CONFLICT (bill_id) 
-                        DO UPDATE SET
-                            bill_no = EXCLUDED.bill_no,
-                            title = EXCLUDED.title,
-                            proposal_date = EXCLUDED.proposal_date,
-                            proposer_kind = EXCLUDED.proposer_kind,
-                            proposer_name = EXCLUDED.proposer_name,
-                            proc_stage_cd = EXCLUDED.proc_stage_cd,
-                            pass_gubn = EXCLUDED.pass_gubn,
-                            proc_date = EXCLUDED.proc_date,
-                            general_result = EXCLUDED.general_result,
-                            summary_raw = EXCLUDED.summary_raw,
-                            link_url = EXCLUDED.link_url,
-                            proc_stage_order = EXCLUDED.proc_stage_order,
-                            updated_at = CURRENT_TIMESTAMP
-                    """, (
-                        bill_id, bill_no, title, proposal_date, proposer_kind, proposer_name,
-                        proc_stage_cd, pass_gubn, proc_date, general_result,
-                        summary_raw, link_url, proc_stage_order
-                    ))
-                    
-                    if cur.rowcount > 0:
-                        if "INSERT" in str(cur.statusmessage):
-                            page_inserted += 1
-                            total_inserted += 1
-                        else:
-                            page_updated += 1
-                            total_updated += 1
+                        # 제안일이 종료일 이후인 것은 건너뛰기
+                        if end_date and proposal_date > end_date:
+                            continue
                 
-                except Exception as e:
-                    print(f"  ⚠️ 오류 (BILL_ID: {bill_id[:20]}...): {e}")
-                    conn.rollback()
-                    continue
-            
-            conn.commit()
-            print(f"  ✅ 페이지 {page} 완료 (신규: {page_inserted}, 업데이트: {page_updated}, 건너뜀: {page_skipped_old})")
+                        page_records.append(record)
             
-            # 연속으로 오래된 데이터만 나오면 조기 종료 (빠른 수집)
-            # 페이지의 90% 이상이 이미 수집한 데이터면 더 이상 신규 데이터가 없을 가능성이 높음
-            if page_skipped_old > len(items) * 0.9 and page_inserted == 0 and page_updated == 0:
-                print(f"  ⚠️ 페이지 {page}: 이미 수집한 데이터만 발견. 신규 데이터 수집 종료.")
-                break
+                    # 페이지 단위로 한 번에 저장
+                    try:
+                        page_inserted, page_updated, page_unchanged = upsert_bills(cur, page_records)
+                        conn.commit()
+                    except Exception as e:
+                        print(f"  ⚠️ 페이지 {page} 저장 오류: {e}")
+                        conn.rollback()
+                        page_inserted = page_updated = page_unchanged = 0
+                    total_inserted += page_inserted
+                    total_updated += page_updated
+                    total_unchanged += page_unchanged
+                    print(f"  ✅ 페이지 {page} 완료 (신규: {page_inserted}, 업데이트: {page_updated}, "
+                          f"변경 없음: {page_unchanged}, 건너뜀: {page_skipped_old})")
             
-            if len(items) < page_size:
-                break
+                    # 연속으로 오래된 데이터만 나오면 조기 종료 (빠른 수집)
+                    # 페이지의 90% 이상이 이미 수집한 데이터면 더 이상 신규 데이터가 없을 가능성이 높음
+                    if page_skipped_old > len(items) * 0.9 and page_inserted == 0 and page_updated == 0:
+                        print(f"  ⚠️ 페이지 {page}: 이미 수집한 데이터만 발견. 신규 데이터 수집 종료.")
+                        break
             
-            page += 1
-            time.sleep(1)  # API 호출 제한
+                    page += 1  # 다음 페이지 조회 오류 시 메시지용 (마지막 페이지면 prefetch가 종료)
         
-        except Exception as e:
-            print(f"  ❌ 페이지 {page} 오류: {e}")
-            break
+                except Exception as e:
+                    print(f"  ❌ 페이지 {page} 오류: {e}")
+                    break
+        finally:
+            pages.close()
+            session.close()
+            cur.close()
     
-    cur.close()
-    conn.close()
+    if total_inserted > 0 or total_updated > 0:
+        refresh_bill_stats_rollup(get_db_pool())
+        publish_invalidation('bills')
     
     print("\n" + "=" * 60)
     print(f"수집 완료!")
     print(f"  - 신규 삽입: {total_inserted}건")
     print(f"  - 업데이트: {total_updated}건")
     print(f"  - 총 처리: {total_inserted + total_updated}건")
+    if total_unchanged > 0:
+        print(f"  - 변경 없음 (UPDATE 생략): {total_unchanged}건")
     if total_skipped_2024 > 0:
         print(f"  - 2024년 데이터 건너뜀: {total_skipped_2024}건")
     if total_skipped_old > 0:
         print(f"  - 이미 수집한 데이터 건너뜀: {total_skipped_old}건")
     print("=" * 60)
 
+def recheck_overdue(item, now):
+    """미확정 의안을 다시 확인할 때가 지났으면 지난 시간(timedelta), 아니면 None
+
+    재확인 간격은 마지막으로 바뀐 뒤 흐른 시간에 비례 (오래 계류 중인 의안일수록 드물게 확인)
+    """
+    if item['last_seen_at'] is None:
+        return RECHECK_MAX
+    changed_at = item['last_changed_at'] or item['last_seen_at']
+    interval = min(max((now - changed_at) / RECHECK_AGE_DIVISOR, RECHECK_MIN), RECHECK_MAX)
+    overdue = now - item['last_seen_at'] - interval
+    return overdue if overdue >= timedelta(0) else None
+
+def plan_incremental_pages(state, item_states, total_count, page_size=PAGE_SIZE, now=None,
+                           max_recheck_pages=RECHECK_MAX_PAGES):
+    """증분 수집할 페이지 번호 목록
+
+    - 지난 동기화 이후 새로 추가된 의안이 있는 앞쪽 페이지 (항상 조회)
+    - 다시 확인할 때가 된 미확정(is_settled=False) 의안이 현재 위치한 페이지
+      (list_position + 현재 totalCount로 계산, 가장 오래 밀린 페이지부터 max_recheck_pages개까지)
+    """
+    now = now or datetime.now()
+    new_count = total_count - state['total_count']
+    pages = set(range(1, (max(new_count, 1) - 1) // page_size + 2))
+    overdue_pages = {}
+    for item in item_states.values():
+        if item['is_settled'] or not item['list_position']:
+            continue
+        overdue = recheck_overdue(item, now)
+        if overdue is None:
+            continue
+        page = page_of_position(total_count, item['list_position'], page_size)
+        if page and page not in pages:
+            overdue_pages[page] = max(overdue_pages.get(page, overdue), overdue)
+    recheck = sorted(overdue_pages, key=lambda page: (-overdue_pages[page], page))[:max_recheck_pages]
+    return sorted(pages.union(recheck))
+
+def collect_bills_incremental(force_full=False):
+    """동기화 상태(collector_sync_state) 기반 의안 수집
+    
+    - 전체 동기화: 모든 페이지 조회 (상태가 없거나, --full, 또는 BILL_FULL_SYNC_DAYS 경과 시)
+    - 증분 동기화: 신규 의안 페이지 + 다시 확인할 때가 된 미확정 의안이 있는 페이지만 조회
+    - 페이지 체크섬이 지난번과 같으면 DB 작업 생략, 의안별 해시가 같으면 UPDATE 생략
+    """
+    MIN_DATE = parse_date("20250101")
+    started = time.time()
+    session = make_session(pool_size=1)
+    bucket = TokenBucket(rate=1.0, capacity=1)  # 기존과 같은 초당 1회 호출
+    
+    totals = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'pages_fetched': 0, 'pages_unchanged': 0}
+    completed = False
+    
+    with get_db_pool().connection() as conn:
+        cur = conn.cursor()
+        try:
+            state = load_sync_state(cur, SYNC_SOURCE)
+            item_states = load_item_states(cur, SYNC_SOURCE)
+            
+            full = (force_full or state is None or state['last_full_sync_at'] is None
+                    or state['page_size'] != PAGE_SIZE
+                    or datetime.now() - state['last_full_sync_at'] >= timedelta(days=FULL_SYNC_INTERVAL_DAYS))
+            
+            first_page = fetch_bill_page(session, bucket, 1)
+            totals['pages_fetched'] += 1
+            total_count = page_total_count(first_page)
+            if total_count is None:
+                print("  ❌ totalCount를 읽을 수 없습니다. 수집 종료")
+                return
+            
+            if not full and total_count < state['total_count']:
+                # 목록에서 의안이 빠지면 위치 계산이 어긋나므로 전체 동기화
+                print(f"  ⚠️ 목록 건수 감소 ({state['total_count']} → {total_count}), 전체 동기화로 전환")
+                full = True
+            
+            last_page = max(1, math.ceil(total_count / PAGE_SIZE))
+            if full:
+                pages = list(range(1, last_page + 1))
+                page_checksums = {}
+            else:
+                pages = plan_incremental_pages(state, item_states, total_count)
+                page_checksums = dict(state['page_checksums'])
+            
+            print("=" * 60)
+            print(f"의안 {'전체' if full else '증분'} 동기화 시작 (목록 {total_count}건, {len(pages)}/{last_page} 페이지 조회)")
+            print("=" * 60)
+            
+            expected = {}  # 조회할 페이지에 있어야 하는 미확정 의안 (위치 어긋남 확인용)
+            if not full:
+                for bill_id, item in item_states.items():
+                    if not item['is_settled'] and item['list_position']:
+                        expected[bill_id] = page_of_position(total_count, item['list_position'], PAGE_SIZE)
+            seen = set()
+            
+            def fetch_page(page):
+                if page == 1:
+                    return first_page
+                totals['pages_fetched'] += 1
+                return fetch_bill_page(session, bucket, page)
+            
+            # 다음 조회 대상 페이지는 현재 페이지를 저장하는 동안 미리 조회
+            for page, result in prefetch(pages, fetch_page):
+                items = result.records
+                if not items:
+                    print(f"  페이지 {page}: 데이터 없음")
+                    break
+                
+                base_index = (page - 1) * PAGE_SIZE
+                entries = [
+                    (list_position(total_count, base_index + i), record, bill_record_hash(record))
+                    for i, record in bill_records_from_items(items)
+                ]
+                seen.update(record['bill_id'] for _, record, _ in entries)
+                
+                # 위치와 내용이 모두 지난번과 같은 페이지는 DB 작업 생략
+                checksum = content_hash([[position, record['bill_id'], h] for position, record, h in entries])
+                if page_checksums.get(str(page)) == checksum:
+                    # 다시 확인한 시각만 갱신 (다음 재확인 시점 계산)
+                    touch_item_states(cur, SYNC_SOURCE, [record['bill_id'] for _, record, _ in entries
+                                                         if record['bill_id'] in item_states])
+                    conn.commit()
+                    totals['pages_unchanged'] += 1
+                    continue
+                
+                changed_records = []
+                state_updates = []
+                checked = []  # 바뀐 것 없이 다시 확인만 한 의안
+                page_has_recent = False
+                for position, record, record_hash in entries:
+                    # 2025-01-01 이전 의안은 저장/추적하지 않음
+                    if record['proposal_date'] < MIN_DATE:
+                        continue
+                    page_has_recent = True
+                    
+                    previous = item_states.get(record['bill_id'])
+                    if previous is None or previous['change_hash'] != record_hash:
+                        changed_records.append(record)
+                    else:
+                        totals['unchanged'] += 1
+                    
+                    settled = is_settled_bill(record)
+                    if (previous is None or previous['change_hash'] != record_hash
+                            or previous['list_position'] != position or previous['is_settled'] != settled):
+                        state_updates.append((
+                            record['bill_id'], position,
+                            {field: record[field] for field in BILL_CHANGE_FIELDS},
+                            record_hash, settled,
+                        ))
+                    else:
+                        checked.append(record['bill_id'])
+                
+                inserted, updated, unchanged = upsert_bills(cur, changed_records)
+                save_item_states(cur, SYNC_SOURCE, state_updates)
+                touch_item_states(cur, SYNC_SOURCE, checked)
+                page_checksums[str(page)] = checksum
+                conn.commit()
+                totals['inserted'] += inserted
+                totals['updated'] += updated
+                totals['unchanged'] += unchanged
+                if inserted or updated:
+                    print(f"  ✅ 페이지 {page}: 신규 {inserted}, 업데이트 {updated}")
+                
+                # 목록은 최신순: 2025년 의안이 하나도 없는 페이지 이후는 조회할 필요 없음
+                if full and not page_has_recent:
+                    print(f"  페이지 {page}: 2025년 이전 의안만 있음, 조회 종료")
+                    break
+            
+            missing = [bill_id for bill_id, page in expected.items() if page in pages and bill_id not in seen]
+            if missing:
+                print(f"  ⚠️ 미확정 의안 {len(missing)}건이 예상 페이지에 없습니다 (다음 전체 동기화에서 정리)")
+            
+            save_sync_state(cur, SYNC_SOURCE, total_count, PAGE_SIZE, page_checksums, full)
+            conn.commit()
+            completed = True
+        
+        except FetchError as e:
+            # 동기화 상태(totalCount)는 저장하지 않음 → 다음 실행에서 같은 신규 페이지를 다시 조회
+            print(f"  ❌ API 호출 실패: {e}")
+        finally:
+            cur.close()
+            session.close()
+    
+    if totals['inserted'] > 0 or totals['updated'] > 0:
+        refresh_bill_stats_rollup(get_db_pool())
+        publish_invalidation('bills')
+    
+    print("\n" + "=" * 60)
+    print(f"{'동기화 완료!' if completed else '동기화 중단 (상태 미저장)'} ({time.time() - started:.1f}초)")
+    print(f"  - 조회 페이지: {totals['pages_fetched']}개 (변경 없는 페이지: {totals['pages_unchanged']}개)")
+    print(f"  - 신규 삽입: {totals['inserted']}건")
+    print(f"  - 업데이트: {totals['updated']}건")
+    print(f"  - 변경 없음: {totals['unchanged']}건")
+    print("=" * 60)
+
 if __name__ == '__main__':
-    import sys
+    parser = argparse.ArgumentParser(description='의안 정보 수집')
     # 인자가 없으면 자동으로 최신 데이터만 수집 (빠름)
     # 인자가 있으면 해당 날짜부터 수집
-    start_date = sys.argv[1] if len(sys.argv) > 1 else None
-    end_date = sys.argv[2] if len(sys.argv) > 2 else None
-    collect_bills_from_date(start_date, end_date)
-
+    parser.add_argument('start_date', nargs='?', help='시작일 (YYYYMMDD)')
+    parser.add_argument('end_date', nargs='?', help='종료일 (YYYYMMDD)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='동기화 상태 기반 증분 수집 (신규 + 상태가 바뀔 수 있는 의안만)')
+    parser.add_argument('--full', action='store_true',
+                        help='동기화 상태 기반 전체 동기화 (모든 페이지 조회 후 상태 재작성)')
+    args = parser.parse_args()
+    
+    if args.incremental or args.full:
+        collect_bills_incremental(force_full=args.full)
+    else:
+        collect_bills_from_date(args.start_date, args.end_date)
@@ -3,21 +3,35 @@
 """
 특정 날짜부터 표결 정보 수집 스크립트
 2025-10-15부터 현재까지
+
+- 의안별 API 호출은 여러 스레드에서 동시에 실행 (토큰 버킷으로 초당 호출 수 제한)
+- DB 저장은 메인 스레드 하나가 여러 의안의 표결을 모아 배치로 처리
+  (COPY로 임시 테이블에 적재 → INSERT ... ON CONFLICT 한 번으로 반영)
 """
 
+import argparse
 import os
 import sys
-import psycopg2
-from xml.etree import ElementTree as ET
-import requests
-from datetime import datetime
-import time
+from functools import partial
+from datetime import datetime, timedelta
+
 
 if sys.platform == 'win32':
     import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 프로젝트 루트의 공용 모듈 (db_pool, cache_backend)
+sys.path.insert(0, PROJECT_ROOT)
+from db_pool import ConnectionPool, pool_settings_from_env
+from cache_backend import publish_invalidation
+from fetch_engine import ConcurrentFetcher
+from page_stream import Field, RecordSpec, parse_records
+from bulk_load import copy_rows
+from stats_rollup import refresh_bill_stats_rollup
+
 # .env 파일 로드
 try:
     from dotenv import load_dotenv
@@ -55,6 +69,11 @@ if not ASSEMBLY_KEY:
 
 VOTE_INFO_API = "https://open.assembly.go.kr/portal/openapi/nojepdqqaweusdfbi"
 
+# 동시 호출 설정 (환경 변수 또는 --concurrency, --rate 옵션)
+DEFAULT_CONCURRENCY = int(os.environ.get('VOTE_API_CONCURRENCY', 4))
+DEFAULT_RATE = float(os.environ.get('VOTE_API_RATE', 4.0))  # 초당 최대 호출 수
+WRITE_BATCH_ROWS = 2000  # 이 행 수만큼 모이면 DB에 저장
+
 def get_db_config():
     """환경 변수에서 데이터베이스 설정 가져오기"""
     # Railway는 DATABASE_URL 제공
@@ -87,9 +106,14 @@ def get_db_config():
             'port': int(os.environ.get('LOCAL_DB_PORT', '5432'))
         }
 
-def get_db_connection():
-    config = get_db_config()
-    return psycopg2.connect(**config)
+_db_pool = None
+
+def get_db_pool():
+    """스크립트용 커넥션 풀 (DB_POOL_MAX 등 환경 변수로 조정, 수집 쿼리는 타임아웃 없음)"""
+    global _db_pool
+    if _db_pool is None:
+        _db_pool = ConnectionPool(get_db_config(), **pool_settings_from_env(maxconn=4, statement_timeout_ms=0))
+    return _db_pool
 
 def parse_datetime(datetime_str):
     """날짜 문자열을 datetime 객체로 변환 (다양한 형식 지원)"""
@@ -113,14 +137,197 @@ def parse_datetime(datetime_str):
         pass
     return None
 
-def collect_votes_from_date(start_date_str=None, end_date_str=None):
+# votes 적재 컬럼 (parse_vote_rows가 만드는 튜플 순서와 동일)
+VOTE_COLUMNS = [
+    'bill_id', 'bill_no', 'bill_name', 'member_no', 'mona_cd',
+    'vote_result', 'vote_date', 'member_name', 'party_name', 'district_name'
+]
+
+def vote_api_params(bill_id):
+    """의안별 표결 API 요청 파라미터"""
+    return {
+        "KEY": ASSEMBLY_KEY,
+        "Type": "xml",
+        "pIndex": 1,
+        "pSize": 300,
+        "BILL_ID": bill_id,
+        "AGE": "22"
+    }
+
+def load_proposal_date_map(cur):
+    """2025년 의안의 bill_id → 제안일 (수집 시작 시 한 번만 조회)
+    
+    최신 의안부터 확인하도록 제안일 내림차순 (최근에 추가된 의안의 표결이 있을 가능성이 높음)
+    """
+    cur.execute("""
+        SELECT bill_id, MAX(proposal_date) as proposal_date
+        FROM bills 
+        WHERE proposal_date >= '2025-01-01'
+        GROUP BY bill_id
+        ORDER BY MAX(proposal_date) DESC, bill_id
+    """)
+    return {row[0]: row[1] for row in cur.fetchall()}
+
+# 표결 API 항목(row) → dict (VOTE_DATE는 형식이 여러 가지라 parse_datetime으로 변환)
+VOTE_ROW_SPEC = RecordSpec('row', [
+    Field('member_no', 'MEMBER_NO'),
+    Field('bill_no', 'BILL_NO'),
+    Field('bill_name', 'BILL_NAME'),
+    Field('mona_cd', 'MONA_CD'),
+    Field('vote_result', 'RESULT_VOTE_MOD'),
+    Field('vote_date', 'VOTE_DATE', convert=parse_datetime),
+    Field('member_name', ('HG_NM', 'NAAS_NM')),
+    Field('party_name', 'POLY_NM'),
+    Field('district_name', 'ORIG_NM'),
+])
+
+def parse_vote_rows(bill_id, stream, proposal_dates, start_date, end_date, min_date):
+    """API 응답(XML 스트림)을 votes 행 튜플 목록으로 변환 (작업 스레드에서 실행, DB 접근 없음)"""
+    proposal_date = proposal_dates.get(bill_id)
+    items = parse_records(stream, VOTE_ROW_SPEC).records
+    if not items:
+        return None  # 표결 데이터 없음
+    
+    # vote_date가 없으면 의안 제안일 사용 (date → datetime)
+    fallback_date = datetime.combine(proposal_date, datetime.min.time()) if proposal_date else None
+    
+    rows = []
+    for item in items:
+        member_no = item['member_no']
+        if not member_no:
+            continue
+        
+        vote_date = item['vote_date'] or fallback_date
+        
+        # vote_date가 여전히 NULL이면 건너뛰기
+        if not vote_date:
+            continue
+        
+        # 2025-01-01 이전 표결일은 무조건 건너뛰기 (2024년 데이터 방지)
+        if vote_date < min_date:
+            continue
+        
+        # 표결일이 시작일 이후인 것만 저장
+        if vote_date < start_date:
+            continue
+        
+        # 표결일이 종료일 이후인 것은 건너뛰기
+        if end_date and vote_date > end_date:
+            continue
+        
+        rows.append((
+            bill_id,
+            item['bill_no'],
+            item['bill_name'],
+            member_no,
+            item['mona_cd'],
+            item['vote_result'],
+            vote_date,
+            item['member_name'],
+            item['party_name'],
+            item['district_name'],
+        ))
+    return rows
+
+class VoteBatchWriter:
+    """표결 저장 전담 (메인 스레드의 단일 writer)
+    
+    여러 의안의 표결 행을 모아 COPY로 임시 테이블(votes_staging)에 적재하고,
+    INSERT ... SELECT ... ON CONFLICT DO NOTHING 한 번으로 votes에 반영.
+    신규 표결이 생긴 의안의 bill_vote_summary는 같은 트랜잭션에서 갱신
+    """
+    
+    def __init__(self, conn, batch_rows=WRITE_BATCH_ROWS):
+        self.conn = conn
+        self.batch_rows = batch_rows
+        self.rows = []
+        self.batches = 0
+        self.total_inserted = 0
+        self.total_existing = 0
+        self.total_failed = 0
+        self._staging_ready = False
+    
+    def _ensure_staging(self, cur):
+        """세션 임시 테이블 (커밋/롤백 시 자동으로 비워짐)"""
+        if self._staging_ready:
+            return
+        cur.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS votes_staging (
+                bill_id VARCHAR(50),
+                bill_no VARCHAR(50),
+                bill_name VARCHAR(500),
+                member_no VARCHAR(50),
+                mona_cd VARCHAR(50),
+                vote_result VARCHAR(50),
+                vote_date TIMESTAMP,
+                member_name VARCHAR(100),
+                party_name VARCHAR(100),
+                district_name VARCHAR(200)
+            ) ON COMMIT DELETE ROWS
+        """)
+        self._staging_ready = True
+    
+    def add(self, rows):
+        self.rows.extend(rows)
+        if len(self.rows) >= self.batch_rows:
+            self.flush()
+    
+    def flush(self):
+        if not self.rows:
+            return
+        rows, self.rows = self.rows, []
+        self.batches += 1
+        columns = ', '.join(VOTE_COLUMNS)
+        cur = self.conn.cursor()
+        try:
+            self._ensure_staging(cur)
+            copy_rows(cur, 'votes_staging', VOTE_COLUMNS, rows)
+            
+            # 현재 UNIQUE 제약조건: (bill_id, member_no, vote_date) → 이미 있으면 건너뜀
+            # 같은 배치 안의 중복은 DISTINCT ON으로 먼저 제거
+            cur.execute(f"""
+                WITH inserted AS (
+                    INSERT INTO votes ({columns}, created_at)
+                    SELECT DISTINCT ON (bill_id, member_no, vote_date) {columns}, CURRENT_TIMESTAMP
+                    FROM votes_staging
+                    ORDER BY bill_id, member_no, vote_date
+                    ON CONFLICT (bill_id, member_no, vote_date) 
+                    DO NOTHING
+                    RETURNING bill_id
+                )
+                SELECT bill_id, COUNT(*) FROM inserted GROUP BY bill_id
+            """)
+            inserted_by_bill = dict(cur.fetchall())
+            inserted = sum(inserted_by_bill.values())
+            
+            if inserted_by_bill:
+                # 의안별 표결 집계(bill_vote_summary)를 같은 트랜잭션에서 갱신
+                cur.execute("SELECT refresh_bill_vote_summary(%s)", (sorted(inserted_by_bill),))
+            self.conn.commit()
+            
+            skipped = len(rows) - inserted
+            self.total_inserted += inserted
+            self.total_existing += skipped
+            print(f"  💾 배치 {self.batches}: {len(rows)}건 적재 → 신규 {inserted}건, 건너뜀 {skipped}건 (의안 {len(inserted_by_bill)}개)")
+        except Exception as e:
+            self.conn.rollback()
+            # 첫 배치에서 만든 임시 테이블은 롤백되면 함께 사라지므로 다음 배치에서 다시 생성
+            self._staging_ready = False
+            self.total_failed += len(rows)
+            print(f"  ⚠️ 배치 {self.batches} 저장 오류 ({len(rows)}건): {e}")
+        finally:
+            cur.close()
+
+def collect_votes_from_date(start_date_str=None, end_date_str=None,
+                            concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE):
     """표결 정보 수집 (최신 데이터만 빠르게 수집)
     
     - start_date_str가 없으면: DB의 최신 표결일 이후만 수집 (추천)
     - start_date_str가 있으면: 해당 날짜 이후 수집
     - 2025년 의안의 표결만 수집합니다 (2025-01-01 이후)
+    - concurrency: 동시 API 호출 수, rate: 초당 최대 호출 수
     """
-    conn = get_db_connection()
+    conn = get_db_pool().getconn()
     cur = conn.cursor()
     
     # 2025-01-01 이전 데이터는 수집하지 않음 (강제 필터)
@@ -139,6 +346,8 @@ def collect_votes_from_date(start_date_str=None, end_date_str=None):
         start_date = parse_datetime(start_date_str + "000000")
         if not start_date:
             print(f"  ❌ 잘못된 날짜 형식: {start_date_str}")
+            cur.close()
+            get_db_pool().putconn(conn)
             return
         if start_date < MIN_DATE:
             print(f"  ⚠️ 시작일이 2025-01-01 이전입니다. 2025-01-01로 조정합니다.")
@@ -146,7 +355,6 @@ def collect_votes_from_date(start_date_str=None, end_date_str=None):
     else:
         # DB의 최신 표결일 이후만 수집 (빠른 수집)
         if latest_vote_date:
-            from datetime import timedelta
             start_date = latest_vote_date + timedelta(seconds=1)
             print(f"현재 DB의 최신 표결일: {latest_vote_date}")
             print(f"→ {start_date.strftime('%Y-%m-%d %H:%M:%S')} 이후의 신규 표결만 수집합니다")
@@ -164,162 +372,72 @@ def collect_votes_from_date(start_date_str=None, end_date_str=None):
         print(f"표결 정보 수집 시작 (표결일: {start_date.strftime('%Y%m%d')} ~ {end_date_str})")
     else:
         print(f"표결 정보 수집 시작 (표결일: {start_date.strftime('%Y%m%d')} 이후)")
+    print(f"동시 호출: {concurrency}, 초당 최대 호출: {rate}")
     print("=" * 60)
     
     # bills 테이블에서 2025년 의안만 가져오기 (2024년 의안 제외)
-    # 최신 의안부터 확인 (최근에 추가된 의안의 표결이 있을 가능성이 높음)
-    cur.execute("""
-        SELECT bill_id 
-        FROM bills 
-        WHERE proposal_date >= '2025-01-01'
-        GROUP BY bill_id
-        ORDER BY MAX(proposal_date) DESC, bill_id
-    """)
-    bill_ids = [row[0] for row in cur.fetchall()]
+    # 제안일은 vote_date가 없는 표결의 대체 날짜로 사용 (메모리에 한 번만 적재)
+    proposal_dates = load_proposal_date_map(cur)
+    jobs = list(proposal_dates)
+    cur.close()
     
-    print(f"\n{len(bill_ids)}개의 2025년 의안에 대한 표결 정보를 확인합니다...")
+    print(f"\n{len(jobs)}개의 2025년 의안에 대한 표결 정보를 확인합니다...")
     
-    total_inserted = 0
     total_skipped = 0
+    total_errors = 0
+    writer = VoteBatchWriter(conn)
+    fetcher = ConcurrentFetcher(concurrency=concurrency, rate=rate)
+    parse = partial(parse_vote_rows, proposal_dates=proposal_dates,
+                    start_date=start_date, end_date=end_date, min_date=MIN_DATE)
     
-    for i, bill_id in enumerate(bill_ids, 1):
-        if i % 50 == 0:
-            print(f"\n진행 상황: {i}/{len(bill_ids)}")
-        
-        params = {
-            "KEY": ASSEMBLY_KEY,
-            "Type": "xml",
-            "pIndex": 1,
-            "pSize": 300,
-            "BILL_ID": bill_id,
-            "AGE": "22"
-        }
-        
-        try:
-            response = requests.get(VOTE_INFO_API, params=params, timeout=30)
-            response.raise_for_status()
+    try:
+        for i, (bill_id, rows, error) in enumerate(fetcher.run(jobs, vote_api_params, VOTE_INFO_API, parse), 1):
+            if i % 50 == 0:
+                print(f"\n진행 상황: {i}/{len(jobs)}")
             
-            root = ET.fromstring(response.text)
-            items = root.findall(".//row")
+            if error is not None:
+                print(f"  ⚠️ 오류 (BILL_ID: {bill_id[:20]}...): {error}")
+                total_errors += 1
+                continue
             
-            if not items:
+            if rows is None:
                 total_skipped += 1
                 continue
             
-            page_inserted = 0
-            
-            for item in items:
-                member_no = item.findtext("MEMBER_NO", "").strip()
-                if not member_no:
-                    continue
-                
-                vote_date = parse_datetime(item.findtext("VOTE_DATE", ""))
-                
-                # vote_date가 NULL이면 bills 테이블의 날짜 사용
-                if not vote_date:
-                    cur.execute("SELECT proposal_date FROM bills WHERE bill_id = %s", (bill_id,))
-                    bill_row = cur.fetchone()
-                    if bill_row and bill_row[0]:
-                        # proposal_date는 date 타입이므로 datetime으로 변환
-                        from datetime import datetime
-                        proposal_date = bill_row[0]
-                        if isinstance(proposal_date, datetime):
-                            vote_date = proposal_date
-                        else:
-                            # date 타입을 datetime으로 변환
-                            vote_date = datetime.combine(proposal_date, datetime.min.time())
-                
-                # 2025-01-01 이전 표결일은 무조건 건너뛰기 (2024년 데이터 방지)
-                if vote_date and vote_date < MIN_DATE:
-                    continue
-                
-                # 표결일이 시작일 이후인 것만 저장
-                if vote_date and vote_date < start_date:
-                    continue
-                
-                # 표결일이 종료일 이후인 것은 건너뛰기
-                if end_date and vote_date and vote_date > end_date:
-                    continue
-                
-                # vote_date가 여전히 NULL이면 건너뛰기
-                if not vote_date:
-                    continue
-                
-                vote_result = item.findtext("RESULT_VOTE_MOD", "").strip()
-                member_name = item.findtext("HG_NM", "") or item.findtext("NAAS_NM", "")
-                member_name = member_name.strip() if member_name else ""
-                party_name = item.findtext("POLY_NM", "").strip()
-                district_name = item.findtext("ORIG_NM", "").strip()
-                mona_cd = item.findtext("MONA_CD", "").strip()
-                bill_no = item.findtext("BILL_NO", "").strip()
-                bill_name = item.findtext("BILL_NAME", "").strip()
-                
-                try:
-                    # 중복 체크: 현재 UNIQUE 제약조건 (bill_id, member_no, vote_date)에 맞춰서 확인
-                    # 하지만 vote_result도 함께 확인하여 완전한 중복 방지
-                    cur.execute("""
-                        SELECT COUNT(*) 
-                        FROM votes 
-                        WHERE bill_id = %s 
-                          AND member_no = %s 
-                          AND vote_date = %s
-                          AND vote_result = %s
-                    """, (bill_id, member_no, vote_date, vote_result))
-                    
-                    if cur.fetchone()[0] > 0:
-                        total_already_exists += 1
-                        continue  # 이미 존재하면 건너뛰기
-                    
-                    # INSERT with ON CONFLICT DO NOTHING (중복 방지)
-                    # 현재 UNIQUE 제약조건: (bill_id, member_no, vote_date)
-                    # vote_result가 다른 경우도 있을 수 있으므로 사전 체크로 완전히 방지
-                    cur.execute("""
-                        INSERT INTO votes (
-                            bill_id, bill_no, bill_name, member_no, mona_cd, 
-                            vote_result, vote_date, member_name, party_name, district_name, created_at
-                        ) VALUES (
-                            %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, CURRENT_TIMESTAMP
-                        )
-                        ON CONFLICT (bill_id, member_no, vote_date) 
-                        DO NOTHING
-                    """, (
-                        bill_id, bill_no, bill_name, member_no, mona_cd,
-                        vote_result, vote_date, member_name, party_name, district_name
-                    ))
-                    
-                    if cur.rowcount > 0:
-                        page_inserted += 1
-                        total_inserted += 1
-                except Exception as e:
-                    print(f"    ⚠️ 표결 저장 오류: {e}")
-                    continue
-            
-            if page_inserted > 0:
-                conn.commit()
-            
-            time.sleep(0.5)  # API 호출 제한
+            writer.add(rows)
         
-        except Exception as e:
-            print(f"  ⚠️ 오류 (BILL_ID: {bill_id[:20]}...): {e}")
-            conn.rollback()
-            continue
+        writer.flush()
+    finally:
+        fetcher.close()
+        get_db_pool().putconn(conn)
     
-    cur.close()
-    conn.close()
+    total_inserted = writer.total_inserted
+    if total_inserted > 0:
+        refresh_bill_stats_rollup(get_db_pool())
+        publish_invalidation('votes')
     
+    bucket_stats = fetcher.stats()
     print("\n" + "=" * 60)
     print(f"수집 완료!")
     print(f"  - 신규 삽입: {total_inserted}건")
     print(f"  - 표결 데이터 없음: {total_skipped}건")
-    print(f"  - 이미 존재하는 표결: {total_already_exists}건")
+    print(f"  - 이미 존재하는 표결: {writer.total_existing}건")
+    if writer.total_failed > 0:
+        print(f"  - 저장 실패: {writer.total_failed}건")
+    if total_errors > 0:
+        print(f"  - API 호출 실패 의안: {total_errors}건")
+    print(f"  - API 호출: {bucket_stats['acquired']}회 (속도 제한 대기 {bucket_stats['wait_time_total']}초, 429 휴식 {bucket_stats['pauses']}회)")
     print("=" * 60)
 
 if __name__ == '__main__':
-    import sys
     # 인자가 없으면 자동으로 최신 데이터만 수집 (빠름)
     # 인자가 있으면 해당 날짜부터 수집
-    start_date = sys.argv[1] if len(sys.argv) > 1 else None
-    end_date = sys.argv[2] if len(sys.argv) > 2 else None
-    collect_votes_from_date(start_date, end_date)
-
+    parser = argparse.ArgumentParser(description="표결 정보 수집")
+    parser.add_argument("start_date", nargs="?", default=None, help="시작일 (YYYYMMDD)")
+    parser.add_argument("end_date", nargs="?", default=None, help="종료일 (YYYYMMDD)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"동시 API 호출 수 (기본: {DEFAULT_CONCURRENCY}, VOTE_API_CONCURRENCY)")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                        help=f"초당 최대 API 호출 수 (기본: {DEFAULT_RATE}, VOTE_API_RATE)")
+    args = parser.parse_args()
+    collect_votes_from_date(args.start_date, args.end_date, concurrency=args.concurrency, rate=args.rate)
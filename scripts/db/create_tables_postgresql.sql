@@ -21,6 +21,7 @@ CREATE TABLE IF NOT EXISTS bills (
     bill_no VARCHAR(50),
     title VARCHAR(500) NOT NULL,
     proposal_date DATE,
+    proposal_month DATE GENERATED ALWAYS AS (date_trunc('month', proposal_date::timestamp)::date) STORED,  -- 제안월 (월 필터/집계용)
     proposer_kind VARCHAR(50),
     proposer_name VARCHAR(100),  -- 제안자 이름 (의안 제목에서 추출)
     
@@ -34,6 +35,7 @@ CREATE TABLE IF NOT EXISTS bills (
     summary_raw TEXT,
     
     -- AI 처리 결과 (자체 생성)
+    headline TEXT,
     summary TEXT,
     categories JSONB,  -- JSONB: 더 빠르고 인덱싱 가능
     vote_for JSONB,    -- JSONB: 더 빠르고 인덱싱 가능
@@ -41,8 +43,15 @@ CREATE TABLE IF NOT EXISTS bills (
     
     -- 메타 정보
     proc_stage_order INTEGER,
+    bill_no_sort BIGINT GENERATED ALWAYS AS (CASE
+            WHEN bill_no ~ '^ZZ[0-9]+$' THEN CAST(SUBSTRING(bill_no FROM '([0-9]+)') AS BIGINT) - 1000000000
+            WHEN bill_no ~ '^[0-9]+$' THEN CAST(bill_no AS BIGINT)
+            WHEN bill_no ~ '^제[0-9]+호$' THEN CAST(SUBSTRING(bill_no FROM '([0-9]+)') AS BIGINT)
+            ELSE 999999999
+        END) STORED,  -- 의안번호 정렬 키 (AI 요약 처리 순서)
     proposer_count INTEGER DEFAULT 1,
     link_url VARCHAR(500),
+    source_hash VARCHAR(32),  -- 수집 필드 해시 (같으면 UPDATE 생략)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -53,19 +62,23 @@ COMMENT ON COLUMN bills.bill_id IS '의안ID (billId)';
 COMMENT ON COLUMN bills.bill_no IS '의안번호 (billNo)';
 COMMENT ON COLUMN bills.title IS '의안명 (billName)';
 COMMENT ON COLUMN bills.proposal_date IS '제안일 (proposeDt)';
+COMMENT ON COLUMN bills.proposal_month IS '제안월 (proposal_date의 월 1일, 생성 컬럼)';
 COMMENT ON COLUMN bills.proposer_kind IS '제안자구분 (proposerKind: 의원/정부)';
 COMMENT ON COLUMN bills.proc_stage_cd IS '진행단계 코드 (procStageCd: 접수/심사/본회의)';
 COMMENT ON COLUMN bills.pass_gubn IS '처리구분 (passGubn: 계류의안/처리완료)';
 COMMENT ON COLUMN bills.proc_date IS '처리일 (procDt)';
 COMMENT ON COLUMN bills.general_result IS '일반 결과 (generalResult)';
 COMMENT ON COLUMN bills.summary_raw IS '제안이유 및 주요내용 원문 (summary)';
+COMMENT ON COLUMN bills.headline IS 'AI 헤드라인 (Gemini)';
 COMMENT ON COLUMN bills.summary IS 'AI 요약 결과 (Gemini)';
 COMMENT ON COLUMN bills.categories IS '카테고리 분류 결과 (최대 2개)';
 COMMENT ON COLUMN bills.vote_for IS '찬성 시 정치성향 가중치 (예: {"P": 1, "U": 1})';
 COMMENT ON COLUMN bills.vote_against IS '반대 시 정치성향 가중치 (예: {"M": 1, "T": 1})';
 COMMENT ON COLUMN bills.proc_stage_order IS '진행 단계 순서 (1=접수, 2=심사, 3=본회의, 4=처리완료)';
+COMMENT ON COLUMN bills.bill_no_sort IS '의안번호 숫자 정렬 키 (ZZ번호는 앞쪽, 형식 외 번호는 맨 뒤, 생성 컬럼)';
 COMMENT ON COLUMN bills.proposer_count IS '제안자 수 (대표 발의자 외 추가 인원)';
 COMMENT ON COLUMN bills.link_url IS '상세 링크 URL (의안 상세 페이지)';
+COMMENT ON COLUMN bills.source_hash IS 'API 수집 필드의 MD5 해시 (수집 스크립트가 변경 없는 의안은 UPDATE하지 않음)';
 
 -- bills 테이블 인덱스
 CREATE INDEX IF NOT EXISTS idx_bill_no ON bills(bill_no);
@@ -74,11 +87,40 @@ CREATE INDEX IF NOT EXISTS idx_proc_stage_cd ON bills(proc_stage_cd);
 CREATE INDEX IF NOT EXISTS idx_pass_gubn ON bills(pass_gubn);
 CREATE INDEX IF NOT EXISTS idx_proc_stage_order ON bills(proc_stage_order);
 CREATE INDEX IF NOT EXISTS idx_created_at ON bills(created_at);
+ALTER TABLE bills ADD COLUMN IF NOT EXISTS source_hash VARCHAR(32);  -- 기존 DB 호환
+-- 월별 목록/집계용 (기존 DB 호환: 생성 컬럼 추가, PostgreSQL 12 이상)
+ALTER TABLE bills ADD COLUMN IF NOT EXISTS proposal_month DATE
+    GENERATED ALWAYS AS (date_trunc('month', proposal_date::timestamp)::date) STORED;
+-- 월 + 처리구분 + 진행단계 필터 후 제안일 정렬 (월별 목록, 월별 그룹 집계)
+CREATE INDEX IF NOT EXISTS idx_bills_month_pass_stage_date
+    ON bills(proposal_month, pass_gubn, proc_stage_cd, proposal_date);
+-- AI 요약 처리 순서용 의안번호 정렬 키 (기존 DB 호환: 생성 컬럼 추가)
+ALTER TABLE bills ADD COLUMN IF NOT EXISTS bill_no_sort BIGINT
+    GENERATED ALWAYS AS (CASE
+        WHEN bill_no ~ '^ZZ[0-9]+$' THEN CAST(SUBSTRING(bill_no FROM '([0-9]+)') AS BIGINT) - 1000000000
+        WHEN bill_no ~ '^[0-9]+$' THEN CAST(bill_no AS BIGINT)
+        WHEN bill_no ~ '^제[0-9]+호$' THEN CAST(SUBSTRING(bill_no FROM '([0-9]+)') AS BIGINT)
+        ELSE 999999999
+    END) STORED;
+-- 요약 대기 의안만 처리 순서대로 (정렬 없이 앞에서부터 LIMIT)
+CREATE INDEX IF NOT EXISTS idx_bills_summary_pending
+    ON bills(bill_no_sort, proposal_date, bill_id)
+    WHERE summary IS NULL OR summary = '';
+-- 커서 페이지네이션용 (proposal_date, bill_id) 정렬 키
+CREATE INDEX IF NOT EXISTS idx_bills_proposal_date_bill_id ON bills(proposal_date, bill_id);
 -- JSONB 인덱스 (GIN 인덱스)
 CREATE INDEX IF NOT EXISTS idx_categories_gin ON bills USING GIN (categories);
 CREATE INDEX IF NOT EXISTS idx_vote_for_gin ON bills USING GIN (vote_for);
 CREATE INDEX IF NOT EXISTS idx_vote_against_gin ON bills USING GIN (vote_against);
 
+-- 검색용 trigram 인덱스 (제목/헤드라인/요약 ILIKE 및 유사도 검색)
+-- 한글 trigram 추출을 위해 DB 로케일은 UTF-8 계열(ko_KR.UTF-8, C.UTF-8 등)이어야 함
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+ALTER TABLE bills ADD COLUMN IF NOT EXISTS headline TEXT;  -- 기존 DB 호환
+CREATE INDEX IF NOT EXISTS idx_bills_title_trgm ON bills USING GIN (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_bills_headline_trgm ON bills USING GIN (headline gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_bills_summary_trgm ON bills USING GIN (summary gin_trgm_ops);
+
 -- updated_at 자동 업데이트 트리거 함수
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
@@ -141,6 +183,7 @@ CREATE TABLE IF NOT EXISTS assembly_members (
     member_no VARCHAR(50),
     
     -- 메타 정보
+    source_hash VARCHAR(32),  -- 수집 필드 해시 (같으면 UPDATE 생략)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -164,6 +207,7 @@ COMMENT ON COLUMN assembly_members.birth_type IS '생년 구분 코드 (BIRDY_DI
 COMMENT ON COLUMN assembly_members.duty_name IS '직책명 (DTY_NM, 76% NULL)';
 COMMENT ON COLUMN assembly_members.mona_cd IS '표결정보 API의 MONA_CD (매핑용)';
 COMMENT ON COLUMN assembly_members.member_no IS '표결정보 API의 MEMBER_NO (매핑용)';
+COMMENT ON COLUMN assembly_members.source_hash IS 'API 수집 필드의 MD5 해시 (수집 스크립트가 변경 없는 의원은 UPDATE하지 않음)';
 
 -- assembly_members 테이블 인덱스
 CREATE INDEX IF NOT EXISTS idx_name ON assembly_members(name);
@@ -172,6 +216,7 @@ CREATE INDEX IF NOT EXISTS idx_district ON assembly_members(district);
 CREATE INDEX IF NOT EXISTS idx_mona_cd ON assembly_members(mona_cd);
 CREATE INDEX IF NOT EXISTS idx_member_no ON assembly_members(member_no);
 CREATE INDEX IF NOT EXISTS idx_era ON assembly_members(era);
+ALTER TABLE assembly_members ADD COLUMN IF NOT EXISTS source_hash VARCHAR(32);  -- 기존 DB 호환
 
 -- assembly_members 테이블 updated_at 트리거
 CREATE TRIGGER update_assembly_members_updated_at BEFORE UPDATE ON assembly_members
@@ -455,6 +500,248 @@ CREATE INDEX IF NOT EXISTS idx_similarity_score ON bill_similarity(similarity_sc
 CREATE INDEX IF NOT EXISTS idx_bill_id_1 ON bill_similarity(bill_id_1);
 CREATE INDEX IF NOT EXISTS idx_bill_id_2 ON bill_similarity(bill_id_2);
 
+-- ============================================
+-- 4. 집계 테이블 (조회 성능용)
+-- ============================================
+
+-- 4.1 bill_vote_summary (의안별 표결 집계)
+-- votes 전체를 GROUP BY 하지 않도록 의안별 집계를 미리 저장
+-- 표결 수집 스크립트가 의안 단위로 refresh_bill_vote_summary()를 호출하여 갱신
+CREATE TABLE IF NOT EXISTS bill_vote_summary (
+    -- 기본 정보 (PK)
+    bill_id VARCHAR(50) PRIMARY KEY,
+    
+    -- 표결 집계
+    vote_count INTEGER NOT NULL DEFAULT 0,
+    vote_for INTEGER NOT NULL DEFAULT 0,
+    vote_against INTEGER NOT NULL DEFAULT 0,
+    vote_abstain INTEGER NOT NULL DEFAULT 0,
+    vote_absent INTEGER NOT NULL DEFAULT 0,
+    member_count INTEGER NOT NULL DEFAULT 0,
+    
+    -- 정당별 집계 (total DESC 정렬된 배열)
+    party_votes JSONB NOT NULL DEFAULT '[]'::jsonb,
+    
+    -- 메타 정보
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    
+    -- 외래키
+    CONSTRAINT fk_bill_vote_summary_bill_id FOREIGN KEY (bill_id) REFERENCES bills(bill_id) ON DELETE CASCADE
+);
+
+-- bill_vote_summary 테이블 코멘트
+COMMENT ON TABLE bill_vote_summary IS '의안별 표결 집계 (votes에서 계산)';
+COMMENT ON COLUMN bill_vote_summary.vote_count IS '전체 표결 수';
+COMMENT ON COLUMN bill_vote_summary.member_count IS '표결 참여 의원 수 (DISTINCT member_no)';
+COMMENT ON COLUMN bill_vote_summary.party_votes IS '정당별 표결 결과 (예: [{"party_name": "...", "total": 10, "vote_for": 8, ...}])';
+
+-- bill_vote_summary 테이블 인덱스
+CREATE INDEX IF NOT EXISTS idx_bill_vote_summary_vote_count ON bill_vote_summary(vote_count);
+
+-- 의안별 표결 집계 갱신 함수
+-- 사용 예:
+--   SELECT refresh_bill_vote_summary(ARRAY['PRC_...']);               -- 특정 의안만
+--   SELECT refresh_bill_vote_summary(ARRAY(SELECT bill_id FROM bills)); -- 전체 재계산
+CREATE OR REPLACE FUNCTION refresh_bill_vote_summary(p_bill_ids TEXT[])
+RETURNS INTEGER AS $$
+DECLARE
+    affected INTEGER;
+BEGIN
+    -- 표결이 모두 사라진 의안의 집계 삭제
+    DELETE FROM bill_vote_summary s
+    WHERE s.bill_id = ANY(p_bill_ids)
+      AND NOT EXISTS (SELECT 1 FROM votes v WHERE v.bill_id = s.bill_id);
+    
+    INSERT INTO bill_vote_summary (
+        bill_id, vote_count, vote_for, vote_against, vote_abstain, vote_absent,
+        member_count, party_votes, updated_at
+    )
+    SELECT 
+        t.bill_id, t.vote_count, t.vote_for, t.vote_against, t.vote_abstain, t.vote_absent,
+        t.member_count, COALESCE(p.party_votes, '[]'::jsonb), CURRENT_TIMESTAMP
+    FROM (
+        SELECT 
+            bill_id,
+            COUNT(*) as vote_count,
+            COUNT(*) FILTER (WHERE vote_result = '찬성') as vote_for,
+            COUNT(*) FILTER (WHERE vote_result = '반대') as vote_against,
+            COUNT(*) FILTER (WHERE vote_result = '기권') as vote_abstain,
+            COUNT(*) FILTER (WHERE vote_result = '불참') as vote_absent,
+            COUNT(DISTINCT member_no) as member_count
+        FROM votes
+        WHERE bill_id = ANY(p_bill_ids)
+        GROUP BY bill_id
+    ) t
+    LEFT JOIN (
+        SELECT 
+            bill_id,
+            jsonb_agg(
+                jsonb_build_object(
+                    'party_name', party_name,
+                    'total', total,
+                    'vote_for', vote_for,
+                    'vote_against', vote_against,
+                    'vote_abstain', vote_abstain,
+                    'vote_absent', vote_absent
+                ) ORDER BY total DESC
+            ) as party_votes
+        FROM (
+            SELECT 
+                bill_id,
+                party_name,
+                COUNT(*) as total,
+                COUNT(*) FILTER (WHERE vote_result = '찬성') as vote_for,
+                COUNT(*) FILTER (WHERE vote_result = '반대') as vote_against,
+                COUNT(*) FILTER (WHERE vote_result = '기권') as vote_abstain,
+                COUNT(*) FILTER (WHERE vote_result = '불참') as vote_absent
+            FROM votes
+            WHERE bill_id = ANY(p_bill_ids)
+              AND party_name IS NOT NULL
+            GROUP BY bill_id, party_name
+        ) pv
+        GROUP BY bill_id
+    ) p ON p.bill_id = t.bill_id
+    ON CONFLICT (bill_id)
+    DO UPDATE SET
+        vote_count = EXCLUDED.vote_count,
+        vote_for = EXCLUDED.vote_for,
+        vote_against = EXCLUDED.vote_against,
+        vote_abstain = EXCLUDED.vote_abstain,
+        vote_absent = EXCLUDED.vote_absent,
+        member_count = EXCLUDED.member_count,
+        party_votes = EXCLUDED.party_votes,
+        updated_at = CURRENT_TIMESTAMP;
+    
+    GET DIAGNOSTICS affected = ROW_COUNT;
+    RETURN affected;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 기존 표결 데이터로 초기 집계 생성
+SELECT refresh_bill_vote_summary(ARRAY(SELECT DISTINCT bill_id FROM votes));
+
+-- 4.2 bill_stats_rollup (대시보드 통계 집계)
+-- /api/stats가 의안 전체를 여러 번 스캔하지 않도록 월 x 진행단계 x 처리구분 x 표결여부 단위로 미리 집계
+-- 수집 스크립트(의안/표결) 실행 후 REFRESH MATERIALIZED VIEW CONCURRENTLY로 갱신
+-- (app.py의 BILL_STATS_ROLLUP_SQL과 동일한 정의 유지)
+CREATE MATERIALIZED VIEW IF NOT EXISTS bill_stats_rollup AS
+SELECT 
+    TO_CHAR(b.proposal_month, 'YYYY-MM') as month,
+    COALESCE(b.proc_stage_cd, '미분류') as proc_stage_cd,
+    COALESCE(b.pass_gubn, '미분류') as pass_gubn,
+    (s.bill_id IS NOT NULL) as has_votes,
+    COUNT(*) as bill_count,
+    COALESCE(SUM(s.vote_count), 0) as vote_count,
+    CURRENT_TIMESTAMP as refreshed_at
+FROM bills b
+LEFT JOIN bill_vote_summary s ON s.bill_id = b.bill_id AND s.vote_count > 0
+WHERE b.proposal_date >= '2025-01-01'
+GROUP BY 1, 2, 3, 4;
+
+COMMENT ON MATERIALIZED VIEW bill_stats_rollup IS '대시보드 통계 집계 (수집 스크립트 실행 후 갱신)';
+
+-- CONCURRENTLY 갱신에 필요한 유니크 인덱스
+CREATE UNIQUE INDEX IF NOT EXISTS idx_bill_stats_rollup_key
+    ON bill_stats_rollup(month, proc_stage_cd, pass_gubn, has_votes);
+
+-- ============================================
+-- 5. 수집 동기화 상태 (증분 수집용)
+-- ============================================
+
+-- 5.1 collector_sync_state (수집 소스별 동기화 상태)
+-- collect_bills_from_date.py --incremental 이 실행 끝에 갱신
+CREATE TABLE IF NOT EXISTS collector_sync_state (
+    source VARCHAR(50) PRIMARY KEY,
+    total_count INTEGER,
+    page_size INTEGER,
+    page_checksums JSONB DEFAULT '{}'::jsonb,
+    last_full_sync_at TIMESTAMP,
+    last_incremental_sync_at TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- collector_sync_state 테이블 코멘트
+ALTER TABLE collector_sync_state DROP COLUMN IF EXISTS watermark_date;  -- 기존 DB 정리 (사용하지 않음)
+COMMENT ON TABLE collector_sync_state IS '수집 소스별 동기화 상태 (totalCount, 페이지 체크섬)';
+COMMENT ON COLUMN collector_sync_state.source IS '수집 소스 (예: bills)';
+COMMENT ON COLUMN collector_sync_state.total_count IS '마지막 동기화 시점의 API 목록 전체 건수 (totalCount)';
+COMMENT ON COLUMN collector_sync_state.page_checksums IS '페이지 번호별 체크섬 (같으면 DB 작업 생략)';
+COMMENT ON COLUMN collector_sync_state.last_full_sync_at IS '마지막 전체 동기화 시각';
+COMMENT ON COLUMN collector_sync_state.last_incremental_sync_at IS '마지막 증분 동기화 시각';
+
+-- 5.2 collector_item_state (항목별 마지막 상태)
+-- 미확정 항목의 목록 위치를 저장해 두고, 증분 수집 때 해당 페이지만 다시 조회
+CREATE TABLE IF NOT EXISTS collector_item_state (
+    source VARCHAR(50) NOT NULL,
+    item_key VARCHAR(50) NOT NULL,
+    list_position INTEGER,
+    change_fields JSONB,
+    change_hash VARCHAR(32),
+    is_settled BOOLEAN DEFAULT FALSE,
+    last_seen_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_changed_at TIMESTAMP,
+    PRIMARY KEY (source, item_key)
+);
+
+-- collector_item_state 테이블 코멘트
+COMMENT ON TABLE collector_item_state IS '수집 항목별 마지막 상태 (증분 수집용)';
+COMMENT ON COLUMN collector_item_state.item_key IS '항목 키 (bills: bill_id)';
+COMMENT ON COLUMN collector_item_state.list_position IS '목록에서 가장 오래된 항목부터 센 위치 (신규 항목이 앞에 추가되어도 변하지 않음)';
+COMMENT ON COLUMN collector_item_state.change_fields IS '마지막으로 본 상태 필드 (예: {"proc_stage_cd": "...", "pass_gubn": "...", "proc_date": "..."})';
+COMMENT ON COLUMN collector_item_state.change_hash IS '저장 필드 전체의 해시 (같으면 UPDATE 생략)';
+COMMENT ON COLUMN collector_item_state.is_settled IS '더 이상 상태가 바뀌지 않는 항목 (공포/철회/폐기/부결, 가결된 법률안 외 의안)';
+COMMENT ON COLUMN collector_item_state.last_seen_at IS '마지막으로 목록에서 확인한 시각 (미확정 항목 재확인 주기 계산)';
+COMMENT ON COLUMN collector_item_state.last_changed_at IS '해시가 마지막으로 바뀐 시각 (오래 안 바뀐 항목일수록 드물게 재확인)';
+
+-- collector_item_state 테이블 인덱스 (미확정 항목만)
+CREATE INDEX IF NOT EXISTS idx_collector_item_state_pending
+    ON collector_item_state(source, list_position) WHERE NOT is_settled;
+
+-- ============================================
+-- 6. AI 요약 캐시
+-- ============================================
+
+-- 6.1 ai_summary_cache (프롬프트 결과 캐시)
+-- ai_summarizer/summary_cache.py: (모델, 프롬프트 버전, 정규화한 제목/본문) 해시가 같은 의안은 API를 다시 호출하지 않음
+CREATE TABLE IF NOT EXISTS ai_summary_cache (
+    cache_key VARCHAR(64) PRIMARY KEY,
+    model VARCHAR(100) NOT NULL,
+    prompt_version VARCHAR(20) NOT NULL,
+    headline TEXT,
+    summary TEXT,
+    categories JSONB,
+    vote_for JSONB,
+    vote_against JSONB,
+    hit_count INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_used_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ai_summary_cache 테이블 코멘트
+COMMENT ON TABLE ai_summary_cache IS 'AI 요약 결과 캐시 (중복·재제출 의안, 재실행 시 API 호출 절약)';
+COMMENT ON COLUMN ai_summary_cache.cache_key IS 'sha256(모델, 프롬프트 버전, 정규화한 제목, 정규화한 본문)';
+COMMENT ON COLUMN ai_summary_cache.prompt_version IS '시스템 프롬프트 내용 해시 (프롬프트가 바뀌면 새 키)';
+COMMENT ON COLUMN ai_summary_cache.hit_count IS '캐시로 채운 횟수';
+COMMENT ON COLUMN ai_summary_cache.last_used_at IS '마지막 저장/사용 시각 (TTL, 크기 제한 삭제 기준)';
+
+-- ai_summary_cache 테이블 인덱스 (만료/크기 제한 삭제용)
+CREATE INDEX IF NOT EXISTS idx_ai_summary_cache_last_used ON ai_summary_cache(last_used_at);
+
+-- 6.2 summary_claims (요약 작업 점유)
+-- 여러 요약 프로세스(호스트)가 같은 의안을 중복 호출하지 않도록 의안별 점유자와 만료 시각 기록
+-- 요약이 저장되면 삭제, 프로세스가 죽으면 lease_until 이후 다른 프로세스가 다시 가져감
+CREATE TABLE IF NOT EXISTS summary_claims (
+    bill_id VARCHAR(50) PRIMARY KEY REFERENCES bills(bill_id) ON DELETE CASCADE,
+    owner VARCHAR(100) NOT NULL,
+    lease_until TIMESTAMP NOT NULL,
+    claimed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- summary_claims 테이블 코멘트
+COMMENT ON TABLE summary_claims IS 'AI 요약 작업 점유 (bills.updated_at을 바꾸지 않도록 별도 테이블)';
+COMMENT ON COLUMN summary_claims.owner IS '점유한 프로세스 (호스트명:PID)';
+COMMENT ON COLUMN summary_claims.lease_until IS '점유 만료 시각 (이후에는 다른 프로세스가 가져갈 수 있음)';
+
 -- ============================================
 -- 완료 메시지
 -- ============================================
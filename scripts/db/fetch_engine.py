@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+수집 스크립트 공용 API 호출 엔진
+
+- requests.Session 재사용 (keep-alive, 동시 요청 수만큼 연결 풀 확보)
+- 토큰 버킷(rate_limit.TokenBucket)으로 초당 호출 수 제한
+- 요청별 재시도 (연결 오류, 429, 5xx) + 지수 백오프, Retry-After 존중
+- ThreadPoolExecutor로 동시 호출, 결과는 완료 순서대로 호출한 쪽(단일 DB writer)에 전달
+- parse를 넘기면 응답을 문자열로 받지 않고 스트림으로 넘김 (page_stream.parse_records의 iterparse용)
+
+사용 예:
+    fetcher = ConcurrentFetcher(concurrency=4, rate=2.0)
+    for job, result, error in fetcher.run(jobs, lambda job: make_params(job), url, parse):
+        ...  # 메인 스레드에서 DB 저장
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+from rate_limit import TokenBucket
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class FetchError(Exception):
+    """재시도 후에도 실패한 API 호출"""
+
+
+def make_session(pool_size=4):
+    """keep-alive 연결을 재사용하는 세션 (동시 요청 수만큼 연결 풀)"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _retry_after_seconds(response):
+    value = response.headers.get('Retry-After') if response is not None else None
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def fetch_with_retry(session, url, params, bucket=None, retries=3, backoff=1.0, timeout=30, parse=None):
+    """토큰을 받아 GET 호출, 실패 시 지수 백오프로 재시도
+
+    parse가 없으면 응답 본문(text), 있으면 parse(응답 스트림) 결과 반환
+    (스트림을 읽는 도중 연결이 끊기면 처음부터 다시 요청)
+    """
+    last_error = None
+    for attempt in range(retries + 1):
+        if bucket is not None:
+            bucket.acquire()
+        response = None
+        try:
+            response = session.get(url, params=params, timeout=timeout, stream=parse is not None)
+            if response.status_code not in RETRY_STATUS:
+                response.raise_for_status()
+                if parse is None:
+                    return response.text
+                response.raw.decode_content = True  # gzip 등 전송 인코딩 해제
+                with response:
+                    return parse(response.raw)
+            last_error = FetchError(f"HTTP {response.status_code}")
+            response.close()
+        except (requests.RequestException, ProtocolError, ReadTimeoutError) as e:
+            if isinstance(e, requests.HTTPError) and response.status_code not in RETRY_STATUS:
+                raise FetchError(str(e))  # 4xx 등 재시도해도 소용없는 오류
+            last_error = e
+
+        if attempt == retries:
+            break
+        delay = _retry_after_seconds(response) or backoff * (2 ** attempt)
+        delay += random.uniform(0, backoff)
+        if response is not None and response.status_code == 429 and bucket is not None:
+            bucket.pause(delay)  # 다른 스레드도 함께 쉬도록 버킷 발급 중단
+        time.sleep(delay)
+    raise FetchError(f"재시도 {retries}회 후 실패: {last_error}")
+
+
+class ConcurrentFetcher:
+    """여러 작업을 동시에 호출하고 결과를 완료 순서대로 돌려주는 엔진"""
+
+    def __init__(self, concurrency=4, rate=2.0, burst=None, retries=3, backoff=1.0, timeout=30):
+        self.concurrency = max(1, int(concurrency))
+        self.bucket = TokenBucket(rate, capacity=burst if burst is not None else max(1.0, rate))
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+
+    def _session(self):
+        """스레드별 세션 (각 스레드에서 keep-alive 연결 재사용)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = make_session(pool_size=2)
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def fetch(self, url, params, parse=None):
+        return fetch_with_retry(self._session(), url, params, self.bucket,
+                                retries=self.retries, backoff=self.backoff, timeout=self.timeout,
+                                parse=parse)
+
+    def run(self, jobs, make_params, url, parse):
+        """jobs마다 (job, parse(job, 응답 스트림), None) 또는 (job, None, error)를 완료 순서대로 yield
+
+        parse는 작업 스레드에서 실행되므로 DB에 접근하지 않아야 한다.
+        동시에 대기 중인 작업은 concurrency * 4개로 제한 (결과가 메모리에 쌓이지 않도록)
+        """
+        def work(job):
+            return self.fetch(url, make_params(job), parse=lambda stream: parse(job, stream))
+
+        jobs_iter = iter(jobs)
+        pending = {}
+        max_pending = self.concurrency * 4
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            def submit_next():
+                job = next(jobs_iter, None)
+                if job is None:
+                    return False
+                pending[executor.submit(work, job)] = job
+                return True
+
+            while len(pending) < max_pending and submit_next():
+                pass
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        job = pending.pop(future)
+                        submit_next()
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            yield job, None, e
+                            continue
+                        yield job, result, None
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def close(self):
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+
+    def stats(self):
+        return self.bucket.stats()
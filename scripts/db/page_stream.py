@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+수집 스크립트 공용 페이지 조회/파싱 도우미
+
+- 응답 본문을 문자열로 받지 않고 스트림 그대로 iterparse로 읽음 (항목 단위로 레코드를 만들고 요소는 바로 해제)
+- RecordSpec: XML 항목 → 타입이 정해진 dict (공백 제거, 빈 값 처리, 날짜 변환을 한 곳에서)
+- prefetch: 호출한 쪽이 N페이지를 DB에 저장하는 동안 N+1페이지를 미리 조회
+
+사용 예:
+    spec = RecordSpec('item', [
+        Field('bill_id', 'billId'),
+        Field('proposal_date', 'proposeDt', convert=parse_date),
+        Field('proposer_name', ('proposerNm', 'proposerName')),
+    ])
+    fetch_page = lambda page: fetch_records(session, url, params(page), spec, bucket, meta_tags=('totalCount',))
+    for page, result in prefetch(itertools.count(1), fetch_page, has_more=lambda r: len(r.records) == 100):
+        ...  # result.records, result.meta['totalCount']
+"""
+
+import io
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree import ElementTree as ET
+
+from fetch_engine import fetch_with_retry
+
+# records: RecordSpec.build 결과 목록, meta: meta_tags로 지정한 태그의 텍스트 (예: totalCount)
+ParsedPage = namedtuple('ParsedPage', ['records', 'meta'])
+
+
+class Field:
+    """항목의 필드 하나
+
+    - tags: XML 태그 (여러 개면 처음으로 값이 있는 태그 사용)
+    - convert: 공백 제거한 문자열 → 값 (예: parse_date). 빈 값이면 호출하지 않고 None
+    - empty: 값이 없을 때 반환값 (기본 '', NULL로 저장할 필드는 None)
+    """
+
+    __slots__ = ('name', 'tags', 'convert', 'empty')
+
+    def __init__(self, name, tags, convert=None, empty=''):
+        self.name = name
+        self.tags = (tags,) if isinstance(tags, str) else tuple(tags)
+        self.convert = convert
+        self.empty = None if convert is not None else empty
+
+    def value(self, texts):
+        for tag in self.tags:
+            text = texts.get(tag)
+            if text:
+                text = text.strip()
+                if text:
+                    return self.convert(text) if self.convert is not None else text
+        return self.empty
+
+
+class RecordSpec:
+    """XML 항목(item_tag) → dict 변환 규칙"""
+
+    def __init__(self, item_tag, fields):
+        self.item_tag = item_tag
+        self.fields = list(fields)
+
+    def build(self, elem):
+        texts = {child.tag: child.text for child in elem}
+        return {field.name: field.value(texts) for field in self.fields}
+
+
+def parse_records(source, spec, meta_tags=()):
+    """XML(스트림, bytes 또는 str)을 iterparse로 읽어 ParsedPage 반환
+
+    항목 요소는 레코드로 만든 직후 부모에서 떼어내므로 트리 전체가 메모리에 남지 않는다.
+    """
+    if isinstance(source, str):
+        source = source.encode('utf-8')
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+
+    records = []
+    meta = {}
+    stack = []
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            stack.append(elem)
+            continue
+        stack.pop()
+        if elem.tag == spec.item_tag:
+            records.append(spec.build(elem))
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+        elif elem.tag in meta_tags:
+            meta[elem.tag] = (elem.text or '').strip()
+    return ParsedPage(records, meta)
+
+
+def fetch_records(session, url, params, spec, bucket=None, meta_tags=(), **retry_options):
+    """한 페이지를 조회하면서 바로 파싱 (fetch_engine.fetch_with_retry 재시도 규칙 그대로)"""
+    return fetch_with_retry(session, url, params, bucket,
+                            parse=lambda stream: parse_records(stream, spec, meta_tags),
+                            **retry_options)
+
+
+def prefetch(jobs, fetch, has_more=None):
+    """jobs를 순서대로 fetch하여 (job, 결과)를 yield, 호출한 쪽이 결과를 처리하는 동안 다음 job을 미리 조회
+
+    - has_more(결과)가 False면 다음 job을 조회하지 않고 끝냄 (마지막 페이지)
+    - fetch 오류는 해당 job 차례에 호출한 쪽으로 전달
+    - 호출한 쪽이 중간에 break하면 미리 조회 중인 요청은 기다리지 않음
+    """
+    jobs = iter(jobs)
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        job = next(jobs, None)
+        future = executor.submit(fetch, job) if job is not None else None
+        while future is not None:
+            result = future.result()
+            next_job = next(jobs, None) if has_more is None or has_more(result) else None
+            next_future = executor.submit(fetch, next_job) if next_job is not None else None
+            yield job, result
+            job, future = next_job, next_future
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""
+대시보드 통계 집계(bill_stats_rollup) 갱신 (수집 스크립트 공용)
+
+의안/표결 수집 스크립트가 데이터를 바꾼 뒤 한 번 호출한다.
+
+사용 예:
+    from stats_rollup import refresh_bill_stats_rollup
+
+    if total_inserted or total_updated:
+        refresh_bill_stats_rollup(get_db_pool())
+"""
+
+
+def refresh_bill_stats_rollup(pool):
+    """bill_stats_rollup 갱신 - 웹 조회를 막지 않도록 CONCURRENTLY 사용 (실패해도 수집은 계속)"""
+    try:
+        with pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY bill_stats_rollup")
+            conn.commit()
+        print("  ✅ 통계 집계(bill_stats_rollup) 갱신 완료")
+    except Exception as e:
+        print(f"  ⚠️ 통계 집계 갱신 실패: {e}")
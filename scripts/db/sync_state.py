@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+수집 소스별 동기화 상태 (증분 수집용)
+
+- collector_sync_state: 소스(bills 등)마다 마지막 totalCount, 페이지 체크섬
+- collector_item_state: 항목(의안)마다 목록 위치, 마지막으로 본 변경 감지 필드와 해시, 확정 여부,
+  마지막으로 확인한 시각(last_seen_at)과 마지막으로 바뀐 시각(last_changed_at)
+
+목록 API가 최신 항목을 앞에 붙이는 구조라서 '가장 오래된 항목부터 센 위치'(list_position)는
+새 항목이 추가되어도 변하지 않는다. 현재 totalCount만 알면 미확정 항목이 지금 몇 페이지에 있는지 계산할 수 있다.
+
+사용 예:
+    state = load_sync_state(cur, 'bills')
+    items = load_item_states(cur, 'bills')
+    ...
+    save_item_states(cur, 'bills', changed_items)
+    touch_item_states(cur, 'bills', checked_keys)
+    save_sync_state(cur, 'bills', total_count=..., page_size=..., page_checksums=..., full=False)
+"""
+
+import json
+
+from psycopg2.extras import Json, execute_values
+
+from bulk_load import json_default
+
+
+def _json(value):
+    return Json(value, dumps=lambda v: json.dumps(v, ensure_ascii=False, default=json_default))
+
+
+def list_position(total_count, index):
+    """목록 앞에서부터의 index(0부터) → 가장 오래된 항목부터 센 위치(1부터)"""
+    return total_count - index
+
+
+def page_of_position(total_count, position, page_size):
+    """현재 totalCount 기준으로 list_position 항목이 있는 페이지 번호 (1부터)"""
+    index = total_count - position
+    if index < 0:
+        return None
+    return index // page_size + 1
+
+
+def load_sync_state(cur, source):
+    """소스의 동기화 상태 dict (없으면 None, 기본 커서 기준)"""
+    cur.execute("""
+        SELECT source, total_count, page_size, page_checksums,
+               last_full_sync_at, last_incremental_sync_at
+        FROM collector_sync_state
+        WHERE source = %s
+    """, (source,))
+    row = cur.fetchone()
+    if row is None:
+        return None
+    keys = ['source', 'total_count', 'page_size', 'page_checksums',
+            'last_full_sync_at', 'last_incremental_sync_at']
+    state = dict(zip(keys, row))
+    state['page_checksums'] = state['page_checksums'] or {}
+    return state
+
+
+def save_sync_state(cur, source, total_count, page_size, page_checksums, full):
+    """동기화 상태 저장 (full=True면 전체 동기화 시각, 아니면 증분 동기화 시각 갱신)"""
+    sync_column = 'last_full_sync_at' if full else 'last_incremental_sync_at'
+    cur.execute(f"""
+        INSERT INTO collector_sync_state (
+            source, total_count, page_size, page_checksums, {sync_column}, updated_at
+        ) VALUES (%s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+        ON CONFLICT (source) DO UPDATE SET
+            total_count = EXCLUDED.total_count,
+            page_size = EXCLUDED.page_size,
+            page_checksums = EXCLUDED.page_checksums,
+            {sync_column} = CURRENT_TIMESTAMP,
+            updated_at = CURRENT_TIMESTAMP
+    """, (source, total_count, page_size, Json(page_checksums)))
+
+
+def load_item_states(cur, source):
+    """item_key → {list_position, change_hash, is_settled, last_seen_at, last_changed_at}"""
+    cur.execute("""
+        SELECT item_key, list_position, change_hash, is_settled, last_seen_at, last_changed_at
+        FROM collector_item_state
+        WHERE source = %s
+    """, (source,))
+    states = {}
+    for item_key, position, change_hash, is_settled, last_seen_at, last_changed_at in cur.fetchall():
+        states[item_key] = {'list_position': position, 'change_hash': change_hash, 'is_settled': is_settled,
+                            'last_seen_at': last_seen_at, 'last_changed_at': last_changed_at}
+    return states
+
+
+def save_item_states(cur, source, items):
+    """항목 상태 일괄 저장
+
+    items: (item_key, list_position, change_fields(dict), change_hash, is_settled) 튜플 목록
+    해시가 바뀐 항목만 last_changed_at 갱신
+    """
+    if not items:
+        return 0
+    execute_values(cur, """
+        INSERT INTO collector_item_state (
+            source, item_key, list_position, change_fields, change_hash, is_settled,
+            last_seen_at, last_changed_at
+        ) VALUES %s
+        ON CONFLICT (source, item_key) DO UPDATE SET
+            list_position = EXCLUDED.list_position,
+            change_fields = EXCLUDED.change_fields,
+            change_hash = EXCLUDED.change_hash,
+            is_settled = EXCLUDED.is_settled,
+            last_seen_at = EXCLUDED.last_seen_at,
+            last_changed_at = CASE
+                WHEN collector_item_state.change_hash IS DISTINCT FROM EXCLUDED.change_hash
+                THEN EXCLUDED.last_changed_at
+                ELSE collector_item_state.last_changed_at
+            END
+    """, [
+        (source, item_key, position, _json(fields), change_hash, is_settled)
+        for item_key, position, fields, change_hash, is_settled in items
+    ], template="(%s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)")
+    return len(items)
+
+
+def touch_item_states(cur, source, item_keys):
+    """다시 확인했지만 바뀐 것이 없는 항목의 last_seen_at만 갱신 (다음 재확인 시점 계산용)"""
+    if not item_keys:
+        return 0
+    cur.execute("""
+        UPDATE collector_item_state
+        SET last_seen_at = CURRENT_TIMESTAMP
+        WHERE source = %s AND item_key = ANY(%s)
+    """, (source, list(item_keys)))
+    return len(item_keys)
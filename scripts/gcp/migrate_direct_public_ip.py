@@ -70,6 +70,7 @@ def get_table_columns(cur, table_name):
         SELECT column_name, data_type
         FROM information_schema.columns
         WHERE table_name = %s AND table_schema = 'public'
+          AND is_generated = 'NEVER'  -- 생성 컬럼(proposal_month 등)은 INSERT 대상에서 제외
         ORDER BY ordinal_position;
     """, (table_name,))
     rows = cur.fetchall()
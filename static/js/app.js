@@ -7,6 +7,8 @@ let currentProcStage = '';
 let currentSortBy = 'proposal_date';
 let currentOrder = 'desc';
 let totalPages = 1;
+let totalIsEstimate = false;
+let pageCursors = [''];  // 페이지별 커서 (pageCursors[n-1] = n페이지 조회용 커서)
 let searchTimeout = null;
 
 // 페이지 로드 시 초기화
@@ -17,20 +19,17 @@ document.addEventListener('DOMContentLoaded', function() {
 // 앱 초기화
 async function initializeApp() {
     try {
-        // 통계 정보 로드
-        await loadStats();
-        
-        // 월별 필터 옵션 로드
-        await loadMonthOptions();
-        
-        // 처리구분 필터 옵션 로드
-        await loadPassGubnOptions();
-        
-        // 진행단계 필터 옵션 로드
-        await loadProcStageOptions();
-        
-        // 의안 목록 로드
-        await loadBills();
+        // 통계, 필터 옵션, 의안 목록 첫 페이지를 한 번의 요청으로 로드
+        const loaded = await loadBootstrap();
+        
+        // 실패하면 개별 API로 다시 로드
+        if (!loaded) {
+            await loadStats();
+            await loadMonthOptions();
+            await loadPassGubnOptions();
+            await loadProcStageOptions();
+            await loadBills();
+        }
         
         // 이벤트 리스너 설정
         setupEventListeners();
@@ -40,6 +39,31 @@ async function initializeApp() {
     }
 }
 
+// 첫 화면 데이터 로드 (/api/bootstrap). 성공하면 true
+async function loadBootstrap() {
+    showLoading(true);
+    
+    try {
+        const response = await fetch('/api/bootstrap');
+        const data = await response.json();
+        
+        if (data.error) {
+            throw new Error(data.error);
+        }
+        
+        renderStats(data.stats);
+        renderFacets(data.facets);
+        pageCursors = [''];
+        renderBillsPage(data, 1);
+        return true;
+    } catch (error) {
+        console.error('첫 화면 데이터 로드 오류:', error);
+        return false;
+    } finally {
+        showLoading(false);
+    }
+}
+
 // 통계 정보 로드
 async function loadStats() {
     try {
@@ -50,39 +74,44 @@ async function loadStats() {
             throw new Error(data.error);
         }
         
-        // 통계 카드 업데이트
-        const totalBills = data.total_bills;
-        const pendingBills = data.pending_bills || 0;
-        const processedBills = data.processed_bills || 0;
-        const processedWithVotes = data.processed_with_votes || 0;
-        const processedNoVotes = data.processed_no_votes || 0;
-        
-        document.getElementById('totalBills').textContent = formatNumber(totalBills);
-        document.getElementById('pendingBills').textContent = formatNumber(pendingBills);
-        document.getElementById('processedBills').textContent = formatNumber(processedBills);
-        document.getElementById('processedWithVotes').textContent = formatNumber(processedWithVotes);
-        document.getElementById('processedNoVotes').textContent = formatNumber(processedNoVotes);
-        
-        // 퍼센트 계산 및 표시
-        const pendingPercent = totalBills > 0 ? ((pendingBills / totalBills) * 100).toFixed(1) : 0;
-        const processedPercent = totalBills > 0 ? ((processedBills / totalBills) * 100).toFixed(1) : 0;
-        const processedWithVotesPercent = processedBills > 0 ? ((processedWithVotes / processedBills) * 100).toFixed(1) : 0;
-        const processedNoVotesPercent = processedBills > 0 ? ((processedNoVotes / processedBills) * 100).toFixed(1) : 0;
-        
-        document.getElementById('pendingBillsPercent').textContent = `${pendingPercent}%`;
-        document.getElementById('processedBillsPercent').textContent = `${processedPercent}%`;
-        document.getElementById('processedWithVotesPercent').textContent = `${processedWithVotesPercent}%`;
-        document.getElementById('processedNoVotesPercent').textContent = `${processedNoVotesPercent}%`;
-        
-        // 진행단계별 통계 표시
-        if (data.proc_stage_stats) {
-            displayProcStageStats(data.proc_stage_stats, totalBills);
-        }
+        renderStats(data);
     } catch (error) {
         console.error('통계 로드 오류:', error);
     }
 }
 
+// 통계 카드 표시
+function renderStats(data) {
+    // 통계 카드 업데이트
+    const totalBills = data.total_bills;
+    const pendingBills = data.pending_bills || 0;
+    const processedBills = data.processed_bills || 0;
+    const processedWithVotes = data.processed_with_votes || 0;
+    const processedNoVotes = data.processed_no_votes || 0;
+    
+    document.getElementById('totalBills').textContent = formatNumber(totalBills);
+    document.getElementById('pendingBills').textContent = formatNumber(pendingBills);
+    document.getElementById('processedBills').textContent = formatNumber(processedBills);
+    document.getElementById('processedWithVotes').textContent = formatNumber(processedWithVotes);
+    document.getElementById('processedNoVotes').textContent = formatNumber(processedNoVotes);
+    
+    // 퍼센트 계산 및 표시
+    const pendingPercent = totalBills > 0 ? ((pendingBills / totalBills) * 100).toFixed(1) : 0;
+    const processedPercent = totalBills > 0 ? ((processedBills / totalBills) * 100).toFixed(1) : 0;
+    const processedWithVotesPercent = processedBills > 0 ? ((processedWithVotes / processedBills) * 100).toFixed(1) : 0;
+    const processedNoVotesPercent = processedBills > 0 ? ((processedNoVotes / processedBills) * 100).toFixed(1) : 0;
+    
+    document.getElementById('pendingBillsPercent').textContent = `${pendingPercent}%`;
+    document.getElementById('processedBillsPercent').textContent = `${processedPercent}%`;
+    document.getElementById('processedWithVotesPercent').textContent = `${processedWithVotesPercent}%`;
+    document.getElementById('processedNoVotesPercent').textContent = `${processedNoVotesPercent}%`;
+    
+    // 진행단계별 통계 표시
+    if (data.proc_stage_stats) {
+        displayProcStageStats(data.proc_stage_stats, totalBills);
+    }
+}
+
 
 // 월별 필터 옵션 로드
 async function loadMonthOptions() {
@@ -94,18 +123,54 @@ async function loadMonthOptions() {
             throw new Error(data.error);
         }
         
-        const monthFilter = document.getElementById('monthFilter');
-        data.months.forEach(month => {
-            const option = document.createElement('option');
-            option.value = month.month;
-            option.textContent = `${month.month_label} (${formatNumber(month.bill_count)}건)`;
-            monthFilter.appendChild(option);
-        });
+        renderMonthOptions(data.months);
     } catch (error) {
         console.error('월 목록 로드 오류:', error);
     }
 }
 
+// 필터 옵션 건수 갱신 (/api/bills?facets=1 응답의 facets: 현재 조건 기준 건수)
+function renderFacets(facets) {
+    renderMonthOptions(facets.month);
+    renderPassGubnOptions(facets.pass_gubn);
+    renderProcStageOptions(facets.proc_stage);
+}
+
+// 필터 옵션 다시 그리기 전 기존 옵션 제거 ('전체' 옵션은 유지), 선택값 반환
+function resetFilterOptions(select) {
+    const selected = select.value;
+    Array.from(select.options).forEach(option => {
+        if (option.value) {
+            option.remove();
+        }
+    });
+    return selected;
+}
+
+// 옵션 목록에 없는 선택값(현재 조건에서 0건)도 유지
+function restoreFilterSelection(select, selected) {
+    if (selected && !Array.from(select.options).some(option => option.value === selected)) {
+        const opt = document.createElement('option');
+        opt.value = selected;
+        opt.textContent = `${selected} (0건)`;
+        select.appendChild(opt);
+    }
+    select.value = selected;
+}
+
+// 월별 필터 옵션 표시
+function renderMonthOptions(months) {
+    const monthFilter = document.getElementById('monthFilter');
+    const selected = resetFilterOptions(monthFilter);
+    months.forEach(month => {
+        const option = document.createElement('option');
+        option.value = month.month;
+        option.textContent = `${month.month_label} (${formatNumber(month.bill_count)}건)`;
+        monthFilter.appendChild(option);
+    });
+    restoreFilterSelection(monthFilter, selected);
+}
+
 // 처리구분 필터 옵션 로드
 async function loadPassGubnOptions() {
     try {
@@ -116,18 +181,25 @@ async function loadPassGubnOptions() {
             throw new Error(data.error);
         }
         
-        const passGubnFilter = document.getElementById('passGubnFilter');
-        data.options.forEach(option => {
-            const opt = document.createElement('option');
-            opt.value = option.pass_gubn;
-            opt.textContent = `${option.pass_gubn} (${formatNumber(option.bill_count || option.count || 0)}건)`;
-            passGubnFilter.appendChild(opt);
-        });
+        renderPassGubnOptions(data.options);
     } catch (error) {
         console.error('처리구분 필터 옵션 로드 오류:', error);
     }
 }
 
+// 처리구분 필터 옵션 표시
+function renderPassGubnOptions(options) {
+    const passGubnFilter = document.getElementById('passGubnFilter');
+    const selected = resetFilterOptions(passGubnFilter);
+    options.forEach(option => {
+        const opt = document.createElement('option');
+        opt.value = option.pass_gubn;
+        opt.textContent = `${option.pass_gubn} (${formatNumber(option.bill_count || option.count || 0)}건)`;
+        passGubnFilter.appendChild(opt);
+    });
+    restoreFilterSelection(passGubnFilter, selected);
+}
+
 // 진행단계 필터 옵션 로드
 async function loadProcStageOptions() {
     try {
@@ -138,48 +210,69 @@ async function loadProcStageOptions() {
             throw new Error(data.error);
         }
         
-        const procStageFilter = document.getElementById('procStageFilter');
-        
-        // 주요 진행단계 순서 정의
-        const mainStages = ['접수', '소관위접수', '소관위심사', '본회의의결', '공포', '정부이송', '대안반영폐기', '철회'];
-        
-        // 주요 단계 먼저 추가
-        mainStages.forEach(stage => {
-            const option = data.options.find(opt => opt.proc_stage_cd === stage);
-            if (option) {
-                const opt = document.createElement('option');
-                opt.value = option.proc_stage_cd;
-                opt.textContent = `${option.proc_stage_cd} (${formatNumber(option.bill_count || option.count || 0)}건)`;
-                procStageFilter.appendChild(opt);
-            }
-        });
-        
-        // 나머지 단계 추가
-        data.options.forEach(option => {
-            if (!mainStages.includes(option.proc_stage_cd)) {
-                const opt = document.createElement('option');
-                opt.value = option.proc_stage_cd;
-                opt.textContent = `${option.proc_stage_cd} (${formatNumber(option.bill_count || option.count || 0)}건)`;
-                procStageFilter.appendChild(opt);
-            }
-        });
+        renderProcStageOptions(data.options);
     } catch (error) {
         console.error('진행단계 필터 옵션 로드 오류:', error);
     }
 }
 
+// 진행단계 필터 옵션 표시
+function renderProcStageOptions(options) {
+    const procStageFilter = document.getElementById('procStageFilter');
+    const selected = resetFilterOptions(procStageFilter);
+    
+    // 주요 진행단계 순서 정의
+    const mainStages = ['접수', '소관위접수', '소관위심사', '본회의의결', '공포', '정부이송', '대안반영폐기', '철회'];
+    
+    // 주요 단계 먼저 추가
+    mainStages.forEach(stage => {
+        const option = options.find(opt => opt.proc_stage_cd === stage);
+        if (option) {
+            const opt = document.createElement('option');
+            opt.value = option.proc_stage_cd;
+            opt.textContent = `${option.proc_stage_cd} (${formatNumber(option.bill_count || option.count || 0)}건)`;
+            procStageFilter.appendChild(opt);
+        }
+    });
+    
+    // 나머지 단계 추가
+    options.forEach(option => {
+        if (!mainStages.includes(option.proc_stage_cd)) {
+            const opt = document.createElement('option');
+            opt.value = option.proc_stage_cd;
+            opt.textContent = `${option.proc_stage_cd} (${formatNumber(option.bill_count || option.count || 0)}건)`;
+            procStageFilter.appendChild(opt);
+        }
+    });
+    restoreFilterSelection(procStageFilter, selected);
+}
+
 // 의안 목록 로드
 async function loadBills(page = 1) {
     showLoading(true);
     
     try {
+        // 1페이지 조회 시(필터/정렬 변경 포함) 커서 목록 초기화
+        if (page === 1) {
+            pageCursors = [''];
+        }
+        if (pageCursors[page - 1] === undefined) {
+            page = pageCursors.length;
+        }
+        
         const params = new URLSearchParams({
-            page: page,
+            cursor: pageCursors[page - 1],
             per_page: 20,
             sort_by: currentSortBy,
             order: currentOrder
         });
         
+        // 전체 개수(추정치)와 필터 옵션별 건수는 첫 페이지(조건 변경 시)에서만 요청
+        if (page === 1) {
+            params.append('include_total', 'approx');
+            params.append('facets', '1');
+        }
+        
         if (currentMonth) {
             params.append('month', currentMonth);
         }
@@ -203,17 +296,10 @@ async function loadBills(page = 1) {
             throw new Error(data.error);
         }
         
-        currentPage = data.pagination.page;
-        totalPages = data.pagination.pages;
-        
-        // 의안 카드 표시
-        displayBills(data.bills);
-        
-        // 페이지네이션 표시
-        displayPagination(data.pagination);
-        
-        // 활성 필터 표시 업데이트
-        updateActiveFilters();
+        if (data.facets) {
+            renderFacets(data.facets);
+        }
+        renderBillsPage(data, page);
         
     } catch (error) {
         console.error('의안 목록 로드 오류:', error);
@@ -223,6 +309,37 @@ async function loadBills(page = 1) {
     }
 }
 
+// 의안 목록 한 페이지 표시 (/api/bills, /api/bootstrap 응답)
+function renderBillsPage(data, page) {
+    currentPage = page;
+    if (data.pagination.pages !== undefined) {
+        totalPages = data.pagination.pages;
+        totalIsEstimate = data.pagination.total_is_estimate;
+    }
+    if (data.pagination.next_cursor) {
+        pageCursors[page] = data.pagination.next_cursor;
+        // 추정치보다 실제 페이지가 많으면 보정
+        totalPages = Math.max(totalPages, page + 1);
+    } else {
+        pageCursors.length = page;
+        totalPages = page;
+        totalIsEstimate = false;
+    }
+    
+    // 의안 카드 표시
+    displayBills(data.bills);
+    
+    // 페이지네이션 표시
+    displayPagination({
+        page: currentPage,
+        pages: totalPages,
+        hasMore: Boolean(data.pagination.next_cursor)
+    });
+    
+    // 활성 필터 표시 업데이트
+    updateActiveFilters();
+}
+
 // 의안 카드 표시
 function displayBills(bills) {
     const container = document.getElementById('billsContainer');
@@ -297,6 +414,7 @@ function createBillCard(bill) {
     card.innerHTML = `
         <div class="bill-header">
             <div class="bill-title">${escapeHtml(bill.title)}</div>
+            ${bill.search_snippet ? `<div class="bill-snippet">${bill.search_snippet}</div>` : ''}
             <div class="bill-meta">
                 <span class="bill-meta-item">📅 ${proposalDate}</span>
                 ${bill.proposer_name ? `<span class="bill-meta-item">👤 ${escapeHtml(bill.proposer_name)}${bill.proposer_kind === '의원' ? ' 의원' : ''}</span>` : (bill.proposer_kind ? `<span class="bill-meta-item">👤 ${bill.proposer_kind}</span>` : '')}
@@ -493,7 +611,9 @@ function displayPagination(pagination) {
     
     const pageInfo = document.createElement('div');
     pageInfo.className = 'pagination-info';
-    pageInfo.textContent = `${pagination.page} / ${pagination.pages} 페이지`;
+    pageInfo.textContent = totalIsEstimate
+        ? `${pagination.page} / 약 ${pagination.pages} 페이지`
+        : `${pagination.page} / ${pagination.pages} 페이지`;
     container.appendChild(pageInfo);
     
     // 이전 페이지 버튼
@@ -503,9 +623,9 @@ function displayPagination(pagination) {
     prevButton.onclick = () => loadBills(pagination.page - 1);
     container.appendChild(prevButton);
     
-    // 페이지 번호 버튼들
+    // 페이지 번호 버튼들 (커서를 아는 페이지까지만 이동 가능)
     const startPage = Math.max(1, pagination.page - 2);
-    const endPage = Math.min(pagination.pages, pagination.page + 2);
+    const endPage = Math.min(pageCursors.length, pagination.page + 2);
     
     for (let i = startPage; i <= endPage; i++) {
         const pageButton = document.createElement('button');
@@ -518,7 +638,7 @@ function displayPagination(pagination) {
     // 다음 페이지 버튼
     const nextButton = document.createElement('button');
     nextButton.textContent = '다음';
-    nextButton.disabled = pagination.page >= pagination.pages;
+    nextButton.disabled = !pagination.hasMore;
     nextButton.onclick = () => loadBills(pagination.page + 1);
     container.appendChild(nextButton);
 }
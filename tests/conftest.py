@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+테스트 공용 설정
+
+- 프로젝트 루트, scripts/db, ai_summarizer를 import 경로에 추가 (스크립트와 같은 방식으로 import)
+- 수집 스크립트는 import 시 API 키/DB 비밀번호를 확인하므로 더미 값을 넣어 둠 (실제 호출/접속 없음)
+- clock: time.monotonic/time.sleep을 대신하는 가짜 시계 (실제로 대기하지 않음)
+- FakeConn/FakeCursor: 쿼리를 기록하고 정해 둔 행을 돌려주는 가짜 DB 연결 (테스트 모듈에서 from conftest import)
+"""
+
+import os
+import sys
+import time
+
+import psycopg2
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, 'scripts', 'db'), os.path.join(PROJECT_ROOT, 'ai_summarizer')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+for name in ('DB_PASSWORD', 'BILL_SERVICE_KEY', 'ASSEMBLY_SERVICE_KEY'):
+    os.environ.setdefault(name, 'test')
+os.environ.pop('CACHE_REDIS_URL', None)
+
+
+class FakeClock:
+    """가짜 시계: now를 직접 옮기거나 sleep으로 진행, sleep한 시간은 slept에 기록"""
+
+    def __init__(self, start=100.0):
+        self.now = start
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    __call__ = monotonic
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """time.monotonic/time.sleep을 FakeClock으로 교체 (모듈들이 time.monotonic()으로 부르므로 time 모듈 자체를 바꿈)"""
+    clock = FakeClock()
+    monkeypatch.setattr(time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(time, 'sleep', clock.sleep)
+    return clock
+
+
+class FakeCursor:
+    """가짜 커서: 쿼리를 연결의 queries에 (query, params)로 기록하고, 결과 행은 연결의 handle이 정함"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+        self.rowcount = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.conn.check_open()
+        self.conn.queries.append((query, params))
+        self.rows = list(self.conn.handle(query, params))
+        self.rowcount = len(self.rows)
+
+    def copy_expert(self, query, buffer):
+        self.conn.check_open()
+        self.conn.copy(query, buffer)
+        self.conn.queries.append((query, None))
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class FakeConn:
+    """가짜 연결
+
+    results: [(쿼리에 들어 있는 문자열, 행 목록), ...] 중 처음 맞는 항목의 행을 돌려줌, 없으면 default
+    (행 목록 대신 함수를 주면 실행할 때마다 호출하므로 호출 사이에 바뀌는 데이터도 흉내 가능)
+    쿼리별 동작이 더 필요하면 상속해서 handle/copy/commit/rollback을 바꿈
+    """
+
+    def __init__(self, results=(), default=()):
+        self.results = list(results)
+        self.default = default
+        self.queries = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.closed = False
+
+    def handle(self, query, params):
+        rows = next((rows for fragment, rows in self.results if fragment in query), self.default)
+        return rows() if callable(rows) else rows
+
+    def copy(self, query, buffer):
+        pass
+
+    def check_open(self):
+        if self.closed:
+            raise psycopg2.InterfaceError('connection already closed')
+
+    def cursor(self, cursor_factory=None):
+        self.check_open()
+        return FakeCursor(self)
+
+    def commit(self):
+        self.check_open()
+        self.commits += 1
+
+    def rollback(self):
+        self.check_open()
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""app.get_bill_detail: 응답 컬럼과 서버 캐시 (가짜 연결 풀, DB 없음)"""
+
+from datetime import date, datetime
+
+import pytest
+
+import app as app_module
+from conftest import FakeConn
+from member_directory import MemberDirectory
+
+
+def vote_rows():
+    return [{'member_name': '홍길동', 'party_name': '무소속', 'district_name': '서울',
+             'vote_result': '찬성', 'member_id': 'M1', 'member_no': None, 'mona_cd': None}]
+
+
+class FakePool:
+    def __init__(self, bill):
+        self.bill = bill
+        self.members = [{'member_id': 'M1', 'member_no': '100', 'mona_cd': 'MONA1', 'name': '홍길동',
+                         'party': '무소속', 'district': '서울', 'photo_url': 'https://example.com/m1.jpg'}]
+        self.conn = FakeConn(results=[('FROM bills b', lambda: [dict(self.bill)]),
+                                      ('FROM assembly_members', lambda: [dict(member) for member in self.members])],
+                             default=vote_rows)
+
+    @property
+    def queries(self):
+        return [query for query, params in self.conn.queries]
+
+    def getconn(self):
+        return self.conn
+
+    def putconn(self, conn):
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch):
+    bill = {column: None for column in app_module.BILL_DETAIL_COLUMNS}
+    bill.update({'bill_id': 'PRC_TEST', 'title': '테스트 의안', 'proposal_date': date(2025, 1, 2),
+                 'updated_at': datetime(2025, 1, 3, 10, 0, 0), 'vote_count': 1, 'vote_for': 1,
+                 'vote_against': 0, 'vote_abstain': 0, 'vote_absent': 0, 'member_count': 1,
+                 'party_votes': [], 'votes_updated_at': None})
+    pool = FakePool(bill)
+    monkeypatch.setattr(app_module, 'get_db_pool', lambda: pool)
+    app_module.cache.invalidate('bills')
+    with app_module.app.test_client() as test_client:
+        test_client.pool = pool
+        yield test_client
+
+
+def test_detail_selects_explicit_columns(client):
+    response = client.get('/api/bills/PRC_TEST')
+
+    assert response.status_code == 200
+    bill_query = next(query for query in client.pool.queries if 'FROM bills b' in query)
+    assert 'b.*' not in bill_query
+    for internal in ('source_hash', 'bill_no_sort', 'proposal_month'):
+        assert internal not in bill_query
+        assert internal not in response.get_json()
+    assert response.get_json()['member_votes_by_result']['찬성'][0]['photo_url'] == 'https://example.com/m1.jpg'
+
+
+def test_local_backend_keeps_detail_only_briefly(client):
+    assert app_module.cache.stats()['backend'] == 'local'
+    assert app_module.BILL_DETAIL_CACHE_TIMEOUT <= 60
+
+    client.get('/api/bills/PRC_TEST')
+    queries = len(client.pool.queries)
+    client.get('/api/bills/PRC_TEST')
+    assert len(client.pool.queries) == queries  # 보관 시간 안에서는 DB 조회 없음
+
+
+def test_matching_if_none_match_returns_304(client):
+    first = client.get('/api/bills/PRC_TEST')
+    etag = first.headers['ETag']
+
+    revalidated = client.get('/api/bills/PRC_TEST', headers={'If-None-Match': etag})
+
+    assert revalidated.status_code == 304
+    assert revalidated.get_data() == b''
+    assert revalidated.headers['ETag'] == etag
+
+
+def test_server_cache_hit_skips_database(client, monkeypatch):
+    client.get('/api/bills/PRC_TEST')
+
+    def no_pool():
+        raise AssertionError('캐시 적중인데 DB 연결을 가져옴')
+
+    monkeypatch.setattr(app_module, 'get_db_pool', no_pool)
+    cached = client.get('/api/bills/PRC_TEST')
+    assert cached.status_code == 200
+    assert cached.get_json()['bill_id'] == 'PRC_TEST'
+
+
+def test_etag_changes_when_reloaded_member_data_changes(client, monkeypatch):
+    # 로컬 캐시: members 태그 버전은 그대로, 디렉터리는 max_age마다 다시 읽음
+    monkeypatch.setattr(app_module, 'member_directory', MemberDirectory(version=lambda: 0, max_age=0))
+    before = client.get('/api/bills/PRC_TEST').headers['ETag']
+
+    client.pool.members[0]['photo_url'] = 'https://example.com/m1-new.jpg'
+    app_module.cache.invalidate('bills')  # 서버 캐시 보관 시간이 지난 것과 같음
+    after = client.get('/api/bills/PRC_TEST', headers={'If-None-Match': before})
+
+    assert after.status_code == 200
+    assert after.headers['ETag'] != before
+    assert after.get_json()['member_votes_by_result']['찬성'][0]['photo_url'] == 'https://example.com/m1-new.jpg'
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""bulk_load: COPY 값 변환, 원본 해시, upsert_rows의 변경 없는 행 생략"""
+
+from datetime import date, datetime
+
+import pytest
+
+import bulk_load
+from bulk_load import _copy_value, content_hash, copy_rows, upsert_rows
+
+COLUMNS = ['bill_id', 'title', 'proposal_date']
+
+
+class FakeTable:
+    """execute_values 대체: key → source_hash를 보관하고 ON CONFLICT ... WHERE 해시 비교를 흉내"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.calls = []
+
+    def execute_values(self, cur, query, rows, template=None, page_size=100, fetch=False):
+        self.calls.append((query, rows))
+        results = []
+        for row in rows:
+            key, row_hash = row[0], row[-1]
+            if key not in self.hashes:
+                results.append((True,))
+            elif self.hashes[key] != row_hash:
+                results.append((False,))
+            else:
+                continue  # 해시가 같으면 UPDATE 안 함 → RETURNING 없음
+            self.hashes[key] = row_hash
+        return results
+
+
+@pytest.fixture
+def table(monkeypatch):
+    table = FakeTable()
+    monkeypatch.setattr(bulk_load, 'execute_values', table.execute_values)
+    return table
+
+
+@pytest.mark.parametrize('value, expected', [
+    (None, '\\N'),
+    ('a\tb\nc\rd\\e', 'a\\tb\\nc\\rd\\\\e'),
+    (date(2025, 1, 2), '2025-01-02'),
+    (datetime(2025, 1, 2, 3, 4, 5), '2025-01-02 03:04:05'),
+    (42, '42'),
+])
+def test_copy_value_escapes_text_format(value, expected):
+    assert _copy_value(value) == expected
+
+
+def test_copy_rows_writes_one_line_per_row():
+    class Cursor:
+        def copy_expert(self, sql, buffer):
+            self.sql, self.data = sql, buffer.read()
+
+    cur = Cursor()
+    assert copy_rows(cur, 'votes_staging', ['bill_id', 'member_name'], [('B1', '홍\t길동'), ('B2', None)]) == 2
+    assert cur.sql == "COPY votes_staging (bill_id, member_name) FROM STDIN"
+    assert cur.data == 'B1\t홍\\t길동\nB2\t\\N\n'
+
+
+def test_content_hash_is_order_sensitive_and_date_stable():
+    values = ['B1', '제목', date(2025, 1, 2)]
+
+    assert content_hash(values) == content_hash(['B1', '제목', '2025-01-02'])
+    assert content_hash(values) != content_hash(['제목', 'B1', date(2025, 1, 2)])
+    assert len(content_hash(values)) == 32
+
+
+def test_upsert_rows_skips_unchanged_rows(table):
+    rows = [('B1', '제목 1', date(2025, 1, 1)), ('B2', '제목 2', None)]
+
+    assert upsert_rows(None, 'bills', COLUMNS, rows, key_column='bill_id') == (2, 0, 0)
+    assert upsert_rows(None, 'bills', COLUMNS, rows, key_column='bill_id') == (0, 0, 2)
+
+    changed = [rows[0], ('B2', '제목 2 (수정)', None), ('B3', '제목 3', None)]
+    assert upsert_rows(None, 'bills', COLUMNS, changed, key_column='bill_id') == (1, 1, 1)
+
+    query, sent = table.calls[0]
+    assert 'IS DISTINCT FROM EXCLUDED.source_hash' in query
+    assert sent[0][-1] == content_hash(list(rows[0]))
+
+
+def test_upsert_rows_keeps_last_duplicate_key(table):
+    rows = [('B1', '이전 제목', None), ('B1', '새 제목', None)]
+
+    assert upsert_rows(None, 'bills', COLUMNS, rows, key_column='bill_id') == (1, 0, 0)
+    _, sent = table.calls[0]
+    assert [row[:3] for row in sent] == [('B1', '새 제목', None)]
+
+
+def test_upsert_rows_without_rows_skips_query(table):
+    assert upsert_rows(None, 'bills', COLUMNS, [], key_column='bill_id') == (0, 0, 0)
+    assert table.calls == []
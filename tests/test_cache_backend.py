@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""cache_backend: 태그 버전 무효화와 로컬 백엔드 만료"""
+
+import pytest
+from flask import Flask, jsonify
+
+from cache_backend import LocalCacheBackend, TaggedCache
+
+
+@pytest.fixture
+def cache():
+    return TaggedCache(LocalCacheBackend(), prefix='test')
+
+
+def test_invalidate_bumps_only_matching_tags(cache):
+    cache.set('bill_list', 'bills', tags=('bills',))
+    cache.set('member_list', 'members', tags=('members',))
+    cache.set('bill_detail', 'detail', tags=('bills', 'votes', 'members'))
+
+    cache.invalidate('bills')
+
+    assert cache.get('bill_list', ('bills',)) is None
+    assert cache.get('bill_detail', ('bills', 'votes', 'members')) is None
+    assert cache.get('member_list', ('members',)) == 'members'
+    assert cache.tag_versions(('bills', 'votes', 'members')) == {'bills': 1, 'votes': 0, 'members': 0}
+
+    cache.set('bill_list', 'bills v1', tags=('bills',))
+    assert cache.get('bill_list', ('bills',)) == 'bills v1'
+
+
+def test_unknown_tag_is_rejected(cache):
+    with pytest.raises(ValueError):
+        cache.invalidate('bill')
+
+
+def test_stats_count_hits_misses_and_invalidations(cache):
+    cache.get('missing')
+    cache.set('present', 1)
+    cache.get('present')
+    cache.invalidate('votes')
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['invalidations'], stats['backend']) == (1, 1, 1, 'local')
+
+
+def test_local_backend_expires_entries(clock):
+    backend = LocalCacheBackend()
+    backend.set('short', 'a', timeout=10)
+    backend.set('forever', 'b')
+
+    clock.now += 9
+    assert backend.get_many(['short', 'forever']) == ['a', 'b']
+    clock.now += 1
+    assert backend.get('short') is None
+    assert backend.get('forever') == 'b'
+
+
+def test_local_backend_prunes_soonest_expiring_but_keeps_tag_versions(clock):
+    backend = LocalCacheBackend(max_entries=3)
+    backend.incr('tag:bills')
+    backend.set('late', 1, timeout=100)
+    backend.set('soon', 2, timeout=10)
+
+    backend.set('new', 3, timeout=50)
+
+    assert backend.get('soon') is None
+    assert backend.get('late') == 1
+    assert backend.get('new') == 3
+    assert backend.get_counters(['tag:bills']) == [1]
+
+
+def test_cached_view_sets_etag_and_answers_304_without_running_view(cache):
+    app = Flask(__name__)
+    calls = []
+
+    @app.route('/items')
+    @cache.cached(timeout=60, tags=('bills',), query_string=True, etag=True)
+    def items():
+        calls.append(1)
+        return jsonify({'items': [1, 2, 3]})
+
+    client = app.test_client()
+    first = client.get('/items?page=1')
+    etag = first.headers['ETag']
+    assert first.status_code == 200
+
+    revalidated = client.get('/items?page=1', headers={'If-None-Match': etag})
+    assert revalidated.status_code == 304
+    assert len(calls) == 1  # 캐시 적중: 뷰(DB 조회) 실행 없음
+
+    cache.invalidate('bills')
+    assert client.get('/items?page=1', headers={'If-None-Match': etag}).status_code == 304  # 같은 본문이면 ETag 유지
+    assert len(calls) == 2
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""collect_bills_from_date: 증분 수집 대상 판정 (확정 의안, 조회할 페이지)"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from collect_bills_from_date import calculate_proc_stage_order, is_settled_bill, plan_incremental_pages
+from sync_state import list_position, page_of_position
+
+NOW = datetime(2025, 6, 1, 3, 0, 0)
+LAW = '주택임대차보호법 일부개정법률안'
+
+
+def record(proc_stage_cd, general_result, title):
+    return {'proc_stage_cd': proc_stage_cd, 'general_result': general_result, 'title': title,
+            'proc_stage_order': calculate_proc_stage_order(proc_stage_cd)}
+
+
+@pytest.mark.parametrize('proc_stage_cd, general_result, title', [
+    ('공포', None, LAW),
+    ('철회', None, LAW),
+    ('대안반영폐기', None, LAW),
+    ('본회의의결', '부결', LAW),
+    ('본회의의결', '원안가결', '기후위기 대응 촉구 결의안'),  # 법률안이 아니면 공포 단계가 없음
+    ('본회의의결', '수정가결', '국군부대의 해외파견 연장 동의안'),
+])
+def test_terminal_outcomes_are_settled(proc_stage_cd, general_result, title):
+    assert is_settled_bill(record(proc_stage_cd, general_result, title))
+
+
+@pytest.mark.parametrize('proc_stage_cd, general_result, title', [
+    ('정부이송', '원안가결', LAW),  # 공포 전: 다음 증분 수집에서 공포로 바뀌어야 함
+    ('소관위심사', None, LAW),
+    ('본회의의결', '수정가결', LAW),
+    ('소관위심사', None, '기후위기 대응 촉구 결의안'),
+])
+def test_bills_still_in_progress_are_not_settled(proc_stage_cd, general_result, title):
+    assert is_settled_bill(record(proc_stage_cd, general_result, title)) is False
+
+
+def test_page_of_position_tracks_items_as_new_ones_are_prepended():
+    # 250건일 때 앞에서 0번째(최신) 항목 → 위치 250, 맨 뒤 항목 → 위치 1
+    assert list_position(250, 0) == 250
+    assert page_of_position(250, 250, 100) == 1
+    assert page_of_position(250, 151, 100) == 1
+    assert page_of_position(250, 150, 100) == 2
+    assert page_of_position(250, 1, 100) == 3
+    # 신규 30건이 앞에 붙으면 같은 항목이 뒤로 밀림
+    assert page_of_position(280, 151, 100) == 2
+    assert page_of_position(280, 300, 100) is None  # 아직 없는 위치
+
+
+def item(position, settled=False, seen_ago=timedelta(days=1), changed_ago=timedelta(days=1)):
+    return {'list_position': position, 'change_hash': 'h', 'is_settled': settled,
+            'last_seen_at': NOW - seen_ago, 'last_changed_at': NOW - changed_ago}
+
+
+def test_plan_fetches_new_pages_and_recently_changed_pending_bills():
+    items = {
+        'B_NEW_PAGE': item(1000),
+        'B_RECENT': item(650),  # 어제 바뀐 의안: 매일 확인
+        'B_SETTLED': item(300, settled=True, seen_ago=timedelta(days=100)),
+    }
+
+    pages = plan_incremental_pages({'total_count': 1000}, items, total_count=1150, page_size=100, now=NOW)
+
+    # 신규 150건 → 1~2페이지, 위치 650은 지금 (1150-650)//100+1 = 6페이지
+    assert pages == [1, 2, 6]
+
+
+def test_plan_rechecks_long_pending_bills_less_often():
+    items = {
+        # 120일 동안 바뀌지 않음 → 14일(최대)마다 확인
+        'B_OLD_SEEN_RECENTLY': item(500, seen_ago=timedelta(days=3), changed_ago=timedelta(days=120)),
+        'B_OLD_DUE': item(200, seen_ago=timedelta(days=15), changed_ago=timedelta(days=120)),
+        # 20일 전에 바뀜 → 5일마다 확인
+        'B_MID_NOT_DUE': item(400, seen_ago=timedelta(days=4), changed_ago=timedelta(days=20)),
+        'B_MID_DUE': item(300, seen_ago=timedelta(days=5), changed_ago=timedelta(days=20)),
+    }
+
+    pages = plan_incremental_pages({'total_count': 1000}, items, total_count=1000, page_size=100, now=NOW)
+
+    assert pages == [1, 8, 9]  # 1페이지(신규 확인) + 위치 300, 200
+
+
+def test_plan_caps_recheck_pages_most_overdue_first():
+    items = {f'B{n}': item(n * 100, seen_ago=timedelta(days=1 + n), changed_ago=timedelta(days=1))
+             for n in range(1, 10)}
+
+    pages = plan_incremental_pages({'total_count': 1000}, items, total_count=1000, page_size=100, now=NOW,
+                                   max_recheck_pages=3)
+
+    # 가장 오래 확인하지 않은 위치 900, 800, 700 → 2, 3, 4페이지
+    assert pages == [1, 2, 3, 4]
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""collect_votes_from_date.VoteBatchWriter (가짜 연결로 배치 저장 흐름 확인)"""
+
+import collect_votes_from_date as collector
+from conftest import FakeConn
+
+
+class StagingConn(FakeConn):
+    """임시 테이블은 커밋되어야 남고, 롤백되면 사라지는 연결"""
+
+    def __init__(self, fail_copies=0):
+        super().__init__(default=[('B1', 2)])
+        self.fail_copies = fail_copies
+        self.staging = False
+        self.pending_staging = False
+
+    def handle(self, query, params):
+        if 'CREATE TEMP TABLE' in query:
+            self.pending_staging = True
+        elif 'votes_staging' in query and not (self.staging or self.pending_staging):
+            raise RuntimeError('relation "votes_staging" does not exist')
+        return super().handle(query, params)
+
+    def copy(self, query, buffer):
+        if not (self.staging or self.pending_staging):
+            raise RuntimeError('relation "votes_staging" does not exist')
+        if self.fail_copies:
+            self.fail_copies -= 1
+            raise RuntimeError('COPY 실패')
+
+    def commit(self):
+        super().commit()
+        self.staging = self.staging or self.pending_staging
+        self.pending_staging = False
+
+    def rollback(self):
+        super().rollback()
+        self.pending_staging = False
+
+
+def vote_row(bill_id='B1', member_no='1'):
+    return (bill_id, '2200001', '의안', member_no, 'M', '찬성', None, '의원', '정당', '서울')
+
+
+def test_first_batch_failure_recreates_staging_table():
+    conn = StagingConn(fail_copies=1)
+    writer = collector.VoteBatchWriter(conn, batch_rows=2)
+
+    writer.add([vote_row(member_no='1'), vote_row(member_no='2')])  # 첫 배치 실패 → 임시 테이블도 롤백
+    writer.add([vote_row(member_no='3'), vote_row(member_no='4')])
+
+    assert writer.total_failed == 2
+    assert writer.total_inserted == 2
+    assert conn.staging
+
+
+def test_flush_counts_inserted_and_skipped():
+    conn = StagingConn()
+    writer = collector.VoteBatchWriter(conn, batch_rows=100)
+    writer.add([vote_row(member_no=str(n)) for n in range(3)])
+    writer.flush()
+
+    assert writer.total_inserted == 2
+    assert writer.total_existing == 1
+    assert any('refresh_bill_vote_summary' in q for q, _ in conn.queries)
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""db_pool.ConnectionPool: 대기 타임아웃, 헬스 체크로 끊어진 연결 교체, 통계 (가짜 psycopg2 풀, DB 없음)"""
+
+import psycopg2
+import pytest
+
+import db_pool
+from conftest import FakeConn
+from db_pool import ConnectionPool, PoolTimeout
+
+
+class BrokenConn(FakeConn):
+    """열려 있지만 서버 쪽에서 끊어진 연결 (쿼리 실행 시 오류)"""
+
+    def handle(self, query, params):
+        raise psycopg2.OperationalError('server closed the connection unexpectedly')
+
+
+class FakeThreadedPool:
+    """pg_pool.ThreadedConnectionPool 대체: 반납된 연결을 재사용하고, close=True면 닫고 버림"""
+
+    def __init__(self, minconn, maxconn, **kwargs):
+        self.kwargs = kwargs
+        self.idle = []
+        self.created = []
+
+    def getconn(self):
+        if self.idle:
+            return self.idle.pop()
+        conn = FakeConn()
+        self.created.append(conn)
+        return conn
+
+    def putconn(self, conn, close=False):
+        if close:
+            conn.close()
+        else:
+            self.idle.append(conn)
+
+    def closeall(self):
+        for conn in self.idle:
+            conn.close()
+
+
+@pytest.fixture
+def make_pool(monkeypatch, clock):
+    monkeypatch.setattr(db_pool.pg_pool, 'ThreadedConnectionPool', FakeThreadedPool)
+
+    def make(**kwargs):
+        kwargs.setdefault('health_check_interval', 30.0)
+        return ConnectionPool({'host': 'localhost'}, **kwargs)
+    return make
+
+
+def test_statement_timeout_is_passed_as_connection_option(make_pool):
+    pool = make_pool(statement_timeout_ms=5000)
+    assert pool._pool.kwargs == {'host': 'localhost', 'options': '-c statement_timeout=5000'}
+
+
+def test_getconn_times_out_when_all_connections_are_in_use(make_pool):
+    pool = make_pool(maxconn=1)
+    conn = pool.getconn()
+
+    with pytest.raises(PoolTimeout):
+        pool.getconn(timeout=0)
+    assert pool.stats()['timeouts'] == 1
+
+    pool.putconn(conn)
+    assert pool.getconn(timeout=0) is conn  # 반납하면 다시 대여 가능
+
+
+def test_idle_connection_failing_health_check_is_replaced(make_pool, clock):
+    pool = make_pool()
+    broken = BrokenConn()
+    pool._pool.idle.append(broken)
+    pool._last_used[id(broken)] = clock.now
+
+    clock.now += 31
+    replacement = pool.getconn()
+
+    assert replacement is not broken
+    assert broken.closed
+    assert id(broken) not in pool._last_used
+    assert pool.stats()['health_check_failures'] == 1
+
+
+def test_recently_used_connection_skips_health_check(make_pool, clock):
+    pool = make_pool()
+    conn = pool.getconn()
+    pool.putconn(conn)
+
+    clock.now += 5
+    assert pool.getconn() is conn
+    assert conn.queries == []
+
+    pool.putconn(conn)
+    clock.now += 31
+    assert pool.getconn() is conn
+    assert [query for query, _ in conn.queries] == ['SELECT 1']
+
+
+def test_closed_connection_is_forgotten(make_pool):
+    pool = make_pool()
+    conn = pool.getconn()
+    pool.putconn(conn, close=True)
+
+    assert conn.closed
+    assert pool._last_used == {}
+    assert pool._pool.idle == []
+
+
+def test_stats_count_borrow_return_and_peak_usage(make_pool):
+    pool = make_pool(maxconn=3)
+    first, second = pool.getconn(), pool.getconn()
+    pool.putconn(first)
+
+    stats = pool.stats()
+    assert (stats['borrowed'], stats['returned'], stats['in_use'], stats['max_in_use']) == (2, 1, 1, 2)
+    assert stats['max_size'] == 3
+
+    with pytest.raises(ValueError):
+        with pool.connection() as conn:
+            raise ValueError('작업 실패')
+    assert conn.rollbacks == 1  # 예외 시 롤백 후 반납
+    stats = pool.stats()
+    assert (stats['borrowed'], stats['returned'], stats['in_use']) == (3, 2, 1)
+    pool.putconn(second)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""bill_headline_summarizer_db.bind_api_key_client: 키별 클라이언트가 설치된 google-generativeai에서 실제로 쓰이는지 확인"""
+
+import pytest
+
+import bill_headline_summarizer_db as summarizer
+
+
+def test_bind_refuses_model_without_client_slot():
+    class NoClientModel:
+        pass
+
+    with pytest.raises(RuntimeError, match='_client'):
+        summarizer.bind_api_key_client(NoClientModel(), 'key-a')
+
+
+class Sentinel(Exception):
+    pass
+
+
+def test_bound_client_is_used_for_generate_content(monkeypatch):
+    genai = pytest.importorskip('google.generativeai')
+    model = genai.GenerativeModel(model_name='gemini-2.5-flash')
+    summarizer.bind_api_key_client(model, 'key-a')
+    bound = model._client
+
+    def fake_generate_content(request, **kwargs):
+        raise Sentinel(request.model)
+
+    monkeypatch.setattr(bound, 'generate_content', fake_generate_content)
+    with pytest.raises(Sentinel):
+        model.generate_content('안녕')
+    assert model._client is bound
+
+
+def test_models_for_different_keys_get_separate_clients():
+    pytest.importorskip('google.generativeai')
+    model_a = summarizer.get_gemini_model('gemini-2.5-flash', 'key-a')
+    model_b = summarizer.get_gemini_model('gemini-2.5-flash', 'key-b')
+    assert model_a is summarizer.get_gemini_model('gemini-2.5-flash', 'key-a')
+    assert model_a._client is not model_b._client
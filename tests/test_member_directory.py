@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""member_directory.MemberDirectory: 의원 조회 순서와 통계"""
+
+import threading
+
+import pytest
+
+from conftest import FakeConn
+from member_directory import MemberDirectory
+
+
+MEMBERS = [
+    {'member_id': 'M1', 'member_no': '1001', 'mona_cd': 'MONA1', 'name': '김의원', 'party': '가',
+     'district': '서울', 'photo_url': 'https://example.com/m1.jpg'},
+    {'member_id': 'M2', 'member_no': None, 'mona_cd': 'MONA2', 'name': '이의원', 'party': '나',
+     'district': '부산', 'photo_url': 'https://example.com/m2.jpg'},
+]
+
+
+@pytest.fixture
+def directory():
+    members = MemberDirectory(version=lambda: 1)
+    members.refresh(FakeConn(default=MEMBERS).cursor())
+    return members
+
+
+def test_decorate_falls_back_to_member_no_then_mona_cd(directory):
+    rows = [
+        {'member_name': '김의원', 'member_id': None, 'member_no': '1001', 'mona_cd': None},
+        {'member_name': '이의원', 'member_id': None, 'member_no': None, 'mona_cd': 'MONA2'},
+        {'member_name': '김의원', 'member_id': None, 'member_no': '9999', 'mona_cd': 'MONA1'},
+        {'member_name': '박의원', 'member_id': None, 'member_no': None, 'mona_cd': None},
+    ]
+
+    directory.decorate(rows)
+
+    assert [row['member_id'] for row in rows] == ['M1', 'M2', 'M1', None]
+    assert [row['photo_url'] for row in rows] == ['https://example.com/m1.jpg', 'https://example.com/m2.jpg',
+                                                  'https://example.com/m1.jpg', None]
+    assert all('member_no' not in row and 'mona_cd' not in row for row in rows)
+    stats = directory.stats()
+    assert (stats['lookups'], stats['misses'], stats['members']) == (4, 1, 2)
+
+
+def test_refresh_reloads_only_on_version_change():
+    version = {'value': 1}
+    members = MemberDirectory(version=lambda: version['value'])
+    cur = FakeConn(default=MEMBERS).cursor()
+
+    assert members.refresh(cur) is True
+    assert members.refresh(cur) is False
+    version['value'] = 2
+    assert members.refresh(cur) is True
+    assert len(cur.conn.queries) == 2
+
+
+def test_stats_are_exact_under_concurrent_decorate(directory):
+    def work():
+        for _ in range(500):
+            directory.decorate([{'member_id': 'M1'}, {'member_id': 'M404'}])
+            directory.lookup(mona_cd='MONA2')
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = directory.stats()
+    assert (stats['lookups'], stats['misses']) == (8 * 500 * 3, 8 * 500)
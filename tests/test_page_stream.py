@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""page_stream: iterparse 레코드 추출과 다음 페이지 미리 조회"""
+
+import io
+import threading
+from datetime import date, datetime
+
+import pytest
+
+from page_stream import Field, RecordSpec, parse_records, prefetch
+
+PAGE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<response>
+  <header><resultCode>00</resultCode></header>
+  <body>
+    <items>
+      <item>
+        <billId> PRC_A </billId>
+        <billName>의안 가</billName>
+        <proposeDt>2025-01-02</proposeDt>
+        <proposerNm></proposerNm>
+        <proposerName>홍길동의원 등 10인</proposerName>
+      </item>
+      <item>
+        <billId>PRC_B</billId>
+        <billName>   </billName>
+        <proposeDt></proposeDt>
+      </item>
+    </items>
+    <totalCount> 2 </totalCount>
+  </body>
+</response>"""
+
+
+def parse_date(text):
+    return datetime.strptime(text, '%Y-%m-%d').date()
+
+
+SPEC = RecordSpec('item', [
+    Field('bill_id', 'billId'),
+    Field('title', 'billName'),
+    Field('proposal_date', 'proposeDt', convert=parse_date),
+    Field('proposer_name', ('proposerNm', 'proposerName'), empty=None),
+])
+
+
+@pytest.mark.parametrize('source', [PAGE_XML, PAGE_XML.encode('utf-8'), io.BytesIO(PAGE_XML.encode('utf-8'))])
+def test_parse_records_extracts_typed_records_and_meta(source):
+    page = parse_records(source, SPEC, meta_tags=('totalCount', 'resultCode'))
+
+    assert page.records == [
+        {'bill_id': 'PRC_A', 'title': '의안 가', 'proposal_date': date(2025, 1, 2), 'proposer_name': '홍길동의원 등 10인'},
+        {'bill_id': 'PRC_B', 'title': '', 'proposal_date': None, 'proposer_name': None},
+    ]
+    assert page.meta == {'totalCount': '2', 'resultCode': '00'}
+
+
+def test_parse_records_detaches_parsed_items():
+    built = []
+
+    class RecordingSpec(RecordSpec):
+        def build(self, elem):
+            built.append(elem)
+            return super().build(elem)
+
+    parse_records(PAGE_XML, RecordingSpec('item', SPEC.fields))
+
+    assert len(built) == 2
+    assert all(len(elem) == 0 for elem in built)  # 레코드를 만든 뒤 하위 요소 해제
+
+
+def test_parse_records_without_items():
+    page = parse_records('<response><body><items/><totalCount>0</totalCount></body></response>', SPEC,
+                         meta_tags=('totalCount',))
+
+    assert page.records == []
+    assert page.meta == {'totalCount': '0'}
+
+
+def test_prefetch_fetches_next_job_while_caller_processes():
+    fetched = []
+    second_started = threading.Event()
+
+    def fetch(job):
+        fetched.append(job)
+        if job == 2:
+            second_started.set()
+        return job * 10
+
+    results = []
+    for job, result in prefetch([1, 2, 3], fetch):
+        if job == 1:
+            assert second_started.wait(timeout=5)  # 1페이지 처리 중에 2페이지 조회 시작
+        results.append((job, result))
+
+    assert results == [(1, 10), (2, 20), (3, 30)]
+    assert fetched == [1, 2, 3]
+
+
+def test_prefetch_stops_when_has_more_is_false():
+    fetched = []
+
+    def fetch(job):
+        fetched.append(job)
+        return [job] * (2 if job < 2 else 1)
+
+    results = list(prefetch(iter(range(1, 10)), fetch, has_more=lambda records: len(records) == 2))
+
+    assert [job for job, _ in results] == [1, 2]
+    assert fetched == [1, 2]
+
+
+def test_prefetch_raises_fetch_error_at_its_job():
+    def fetch(job):
+        if job == 2:
+            raise RuntimeError('page 2 failed')
+        return job
+
+    seen = []
+    with pytest.raises(RuntimeError, match='page 2'):
+        for job, _ in prefetch([1, 2, 3], fetch):
+            seen.append(job)
+    assert seen == [1]
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""quality_profile: 한 번의 스캔으로 필드별/행별 완성도 계산 (가짜 커서)"""
+
+from cache_backend import LocalCacheBackend, TaggedCache
+from conftest import FakeConn
+from quality_profile import QualityField, field_filled_sql, quality_profile
+
+FIELDS = [('name', '이름', 'text'), ('party', '정당'), ('committees', '위원회', 'jsonb')]
+
+
+def test_field_filled_sql_by_kind():
+    assert field_filled_sql(QualityField('party', '정당')) == "(party IS NOT NULL)"
+    assert "TRIM(name) != ''" in field_filled_sql(QualityField('name', '이름', 'text'))
+    assert "'{}'::jsonb" in field_filled_sql(QualityField('committees', '위원회', 'jsonb'))
+
+
+def test_row_mode_sums_vectors_in_one_query():
+    cur = FakeConn(default=[
+        {'member_id': 'M1', 'quality_vector': '111', 'filled_fields': 3},
+        {'member_id': 'M2', 'quality_vector': '100', 'filled_fields': 1},
+        {'member_id': 'M3', 'quality_vector': '010', 'filled_fields': 1},
+        {'member_id': 'M4', 'quality_vector': '000', 'filled_fields': 0},
+    ]).cursor()
+
+    profile = quality_profile(cur, 'assembly_members', FIELDS, row_columns=['member_id'],
+                              order_by='filled_fields ASC')
+
+    assert len(cur.conn.queries) == 1
+    assert [(s['field'], s['filled'], s['missing'], s['completion_rate']) for s in profile.field_stats()] == [
+        ('name', 2, 2, 50.0), ('party', 2, 2, 50.0), ('committees', 1, 3, 25.0)]
+    rows = profile.row_stats()
+    assert rows[1] == {'member_id': 'M2', 'filled_fields': 1, 'total_fields': 3, 'completion_rate': 33.3}
+    assert profile.missing_fields(profile.rows[2]) == ['name', 'committees']
+
+
+def test_aggregate_mode_uses_count_filter():
+    cur = FakeConn(default=[{'total': 10, 'f0': 10, 'f1': 7, 'f2': 0}]).cursor()
+
+    profile = quality_profile(cur, 'votes', FIELDS, where='bill_id = %s', params=['B1'])
+
+    query, params = cur.conn.queries[0]
+    assert query.count('COUNT(*) FILTER') == 3
+    assert params == ('B1',)
+    assert [s['completion_rate'] for s in profile.field_stats()] == [100.0, 70.0, 0.0]
+    assert profile.row_stats() == []
+
+
+def test_empty_table_has_zero_rates():
+    profile = quality_profile(FakeConn(default=[{'total': 0, 'f0': 0, 'f1': 0, 'f2': 0}]).cursor(), 'votes', FIELDS)
+
+    assert all(s['completion_rate'] == 0 for s in profile.field_stats())
+
+
+def test_cached_profile_skips_query_until_tag_invalidated():
+    cache = TaggedCache(LocalCacheBackend(), prefix='test')
+    rows = [{'member_id': 'M1', 'quality_vector': '101', 'filled_fields': 2}]
+    cur = FakeConn(default=rows).cursor()
+
+    first = quality_profile(cur, 'assembly_members', FIELDS, row_columns=['member_id'],
+                            cache=cache, cache_tags=('members',))
+    second = quality_profile(cur, 'assembly_members', FIELDS, row_columns=['member_id'],
+                             cache=cache, cache_tags=('members',))
+    assert len(cur.conn.queries) == 1
+    assert second.field_stats() == first.field_stats()
+
+    cache.invalidate('members')
+    quality_profile(cur, 'assembly_members', FIELDS, row_columns=['member_id'],
+                    cache=cache, cache_tags=('members',))
+    assert len(cur.conn.queries) == 2
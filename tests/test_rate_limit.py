@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""rate_limit.TokenBucket (가짜 시계, 실제로 대기하지 않음)"""
+
+import pytest
+
+from rate_limit import TokenBucket
+
+
+def test_burst_up_to_capacity_then_refill_at_rate(clock):
+    bucket = TokenBucket(rate=2.0, capacity=2)
+
+    assert bucket.try_acquire() and bucket.try_acquire()
+    assert not bucket.try_acquire()
+    clock.now += 0.5  # 0.5초에 1개
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+
+def test_refill_never_exceeds_capacity(clock):
+    bucket = TokenBucket(rate=10.0, capacity=3)
+    clock.now += 60
+
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+
+def test_acquire_waits_for_missing_tokens(clock):
+    bucket = TokenBucket(rate=4.0, capacity=1)
+    bucket.acquire()
+
+    assert bucket.acquire() is True
+    assert clock.slept == [pytest.approx(0.25)]
+    stats = bucket.stats()
+    assert (stats['acquired'], stats['waited'], stats['wait_time_total']) == (2, 1, 0.25)
+
+
+def test_acquire_gives_up_after_timeout(clock):
+    bucket = TokenBucket(rate=1.0, capacity=1)
+    bucket.acquire()
+
+    assert bucket.acquire(timeout=0.5) is False
+    assert clock.slept == []
+
+
+def test_pause_drains_tokens_and_blocks_until_resumed(clock):
+    bucket = TokenBucket(rate=1.0, capacity=5)
+    bucket.pause(3.0)
+
+    assert not bucket.try_acquire()
+    clock.now += 3.0
+    assert not bucket.try_acquire()  # 중단이 끝난 뒤부터 다시 채워짐
+    clock.now += 1.0
+    assert bucket.try_acquire()
+    assert bucket.stats()['pauses'] == 1
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1.0, capacity=2).acquire(tokens=3)
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""response_encoding: JSON 직렬화(orjson/표준 json)와 응답 압축"""
+
+import gzip
+import json
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+
+import pytest
+from flask import Flask, Response, request
+
+import response_encoding
+from response_encoding import FastJSONProvider, choose_encoding, init_compression, json_default
+
+PAYLOAD = {
+    'b': Decimal('12.5'),
+    'a': date(2025, 1, 2),
+    'created_at': datetime(2025, 1, 2, 10, 0, 0),
+    'at': time(9, 30),
+    'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    'title': '의안',
+}
+EXPECTED = {'a': '2025-01-02', 'at': '09:30:00', 'b': 12.5, 'created_at': '2025-01-02T10:00:00',
+            'id': '12345678-1234-5678-1234-567812345678', 'title': '의안'}
+
+
+@pytest.fixture(params=['orjson', 'stdlib'])
+def json_app(request, monkeypatch):
+    if request.param == 'orjson':
+        if response_encoding.orjson is None:
+            pytest.skip('orjson 미설치')
+    else:
+        monkeypatch.setattr(response_encoding, 'orjson', None)
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    return app
+
+
+def test_response_encodes_dates_decimals_and_uuids(json_app):
+    with json_app.app_context():
+        body = json_app.json.response(PAYLOAD).get_data()
+
+    assert json.loads(body) == EXPECTED
+    assert '의안'.encode('utf-8') in body  # ensure_ascii=False
+    assert list(json.loads(body)) == sorted(EXPECTED)  # 키 정렬 (ETag 안정)
+
+
+def test_dumps_and_loads_round_trip(json_app):
+    with json_app.app_context():
+        assert json_app.json.loads(json_app.json.dumps(PAYLOAD)) == EXPECTED
+
+
+def test_same_bytes_with_and_without_orjson(monkeypatch):
+    if response_encoding.orjson is None:
+        pytest.skip('orjson 미설치')
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    with app.app_context():
+        fast = app.json.response(PAYLOAD).get_data()
+        monkeypatch.setattr(response_encoding, 'orjson', None)
+        stdlib = app.json.response(PAYLOAD).get_data()
+    assert fast == stdlib
+
+
+def test_json_default_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        json_default(object())
+
+
+@pytest.mark.parametrize('header, expected', [
+    ('gzip, deflate', 'gzip'),
+    ('gzip;q=0', None),
+    ('identity', None),
+    ('*', 'gzip'),
+    ('', None),
+    (None, None),
+])
+def test_choose_encoding_without_brotli(monkeypatch, header, expected):
+    monkeypatch.setattr(response_encoding, 'brotli', None)
+    assert choose_encoding(header) == expected
+
+
+def test_choose_encoding_prefers_br_when_available(monkeypatch):
+    monkeypatch.setattr(response_encoding, 'brotli', object())
+    assert choose_encoding('gzip, br') == 'br'
+    assert choose_encoding('gzip, br;q=0') == 'gzip'
+
+
+@pytest.fixture
+def compress_client(monkeypatch):
+    monkeypatch.setattr(response_encoding, 'brotli', None)
+    app = Flask(__name__)
+    init_compression(app, min_bytes=100)
+
+    @app.route('/big')
+    def big():
+        response = Response('{"x": "' + 'a' * 500 + '"}', mimetype='application/json')
+        response.set_etag('v1')
+        return response.make_conditional(request)
+
+    @app.route('/small')
+    def small():
+        return Response('{"x": 1}', mimetype='application/json')
+
+    @app.route('/image')
+    def image():
+        return Response(b'\x89PNG' + b'0' * 500, mimetype='image/png')
+
+    return app.test_client()
+
+
+def test_large_json_is_gzipped_with_weak_etag(compress_client):
+    response = compress_client.get('/big', headers={'Accept-Encoding': 'gzip'})
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.get_data()).startswith(b'{"x": "aaa')
+    assert response.headers['ETag'] == 'W/"v1"'
+    assert 'Accept-Encoding' in response.headers['Vary']
+
+
+def test_weak_etag_still_revalidates(compress_client):
+    response = compress_client.get('/big', headers={'Accept-Encoding': 'gzip', 'If-None-Match': 'W/"v1"'})
+
+    assert response.status_code == 304
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_uncompressed_responses_keep_strong_etag(compress_client):
+    response = compress_client.get('/big')
+
+    assert 'Content-Encoding' not in response.headers
+    assert response.headers['ETag'] == '"v1"'
+
+
+def test_small_and_binary_responses_are_not_compressed(compress_client):
+    assert 'Content-Encoding' not in compress_client.get('/small', headers={'Accept-Encoding': 'gzip'}).headers
+    image = compress_client.get('/image', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in image.headers
+    assert 'Vary' not in image.headers
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""bill_headline_summarizer_db: process_batch / SummaryWriter (가짜 DB 연결, Gemini 호출 없음)"""
+
+import os
+from dataclasses import replace
+
+import psycopg2
+import pytest
+
+import bill_headline_summarizer_db as summarizer
+from conftest import FakeConn
+from worker_pool import GeminiWorkerPool, KeyBudget
+
+
+class ClaimConn(FakeConn):
+    """점유 해제(DELETE FROM summary_claims ... owner)된 의안을 released에 기록하는 연결"""
+
+    def __init__(self):
+        super().__init__(default=[(1,)])  # headline 컬럼 있음
+        self.released = []
+
+    def handle(self, query, params):
+        if 'DELETE FROM summary_claims' in query and 'owner' in query:
+            self.released.extend(params[1])
+            return list(params[1])
+        return super().handle(query, params)
+
+
+class FakeDB:
+    """execute_values 대체: 저장된 행을 기록하고, fail_writes 횟수만큼 실패"""
+
+    def __init__(self, fail_writes=0):
+        self.fail_writes = fail_writes
+        self.written = []
+
+    def execute_values(self, cur, query, rows, template=None, page_size=100, fetch=False):
+        cur.conn.check_open()
+        if self.fail_writes:
+            self.fail_writes -= 1
+            raise psycopg2.OperationalError('server closed the connection unexpectedly')
+        self.written.extend(rows)
+
+
+def bill(n):
+    return {'bill_id': f'B{n}', 'title': f'의안 {n}', 'body': f'본문 {n}'}
+
+
+def ok_result(bill_id):
+    return summarizer.RowResult(bill_id=bill_id, title='t', body='b', headline='헤드라인', summary='요약',
+                                categories=['민생'], vote_for={}, vote_against={}, success=True)
+
+
+@pytest.fixture
+def fake_db(monkeypatch, tmp_path):
+    db = FakeDB()
+    conns = []
+
+    def connect():
+        conn = ClaimConn()
+        conns.append(conn)
+        return conn
+
+    db.conns = conns
+    monkeypatch.setattr(summarizer, 'get_db_connection', connect)
+    monkeypatch.setattr(summarizer, 'execute_values', db.execute_values)
+    monkeypatch.setattr(summarizer, 'publish_invalidation', lambda *tags: True)
+    monkeypatch.setattr(summarizer, 'HAS_GENAI', True)
+    # writer 없이 process_batch를 부르면 기본 저널을 쓰므로 실제 저널(복구 데이터)을 건드리지 않도록
+    monkeypatch.setattr(summarizer, 'DEFAULT_JOURNAL_PATH', str(tmp_path / 'journal.jsonl'))
+    return db
+
+
+def exhausted_pool():
+    budget = KeyBudget('test-key-0000', 0)
+    budget.exhausted = True
+    return GeminiWorkerPool([budget], call=lambda bill, key: None, estimate_tokens=lambda bill: 1)
+
+
+def test_process_batch_without_writer_releases_claims_before_closing(fake_db, monkeypatch):
+    bills = [bill(1), bill(2)]
+    monkeypatch.setattr(summarizer, 'claim_unprocessed_bills', lambda conn, **kwargs: bills)
+
+    success, errors, quota_exceeded = summarizer.process_batch('test-model', worker_pool=exhausted_pool())
+
+    assert (success, errors, quota_exceeded) == (0, 0, True)
+    conn = fake_db.conns[0]
+    assert conn.released == ['B1', 'B2']
+    assert conn.closed
+
+
+def fast_budget():
+    return KeyBudget('test-key-0000', 0, rpm=60000, tpm=10 ** 9, rpd=1000, base_backoff=0.0, max_consecutive_429=100)
+
+
+def test_prompt_batch_retries_only_bad_items_and_releases_rate_limited_groups(fake_db, monkeypatch):
+    bills = [bill(n) for n in range(1, 7)]
+    monkeypatch.setattr(summarizer, 'claim_unprocessed_bills', lambda conn, **kwargs: bills)
+
+    def batch_call(group, api_key):
+        ids = [b['bill_id'] for b in group]
+        if ids == ['B1', 'B2']:  # 응답은 받았지만 B2 항목이 잘못됨
+            bad = summarizer.failed_result('t', 'b', '묶음 응답에 해당 의안 항목이 없음')
+            bad.retry_single = True
+            return [ok_result('B1'), replace(bad, bill_id='B2')]
+        if ids == ['B3', 'B4']:  # 429로 끝난 묶음
+            return [replace(summarizer.failed_result('t', 'b', '429 Resource has been exhausted'), bill_id=i) for i in ids]
+        return [replace(summarizer.failed_result('t', 'b', '500 Internal error'), bill_id=i) for i in ids]
+
+    single_calls = []
+
+    def single_call(one, api_key):
+        single_calls.append(one['bill_id'])
+        return ok_result(one['bill_id'])
+
+    budgets = [fast_budget()]
+    worker_pool = GeminiWorkerPool(budgets, single_call, estimate_tokens=lambda one: 1)
+    batch_pool = GeminiWorkerPool(budgets, batch_call, estimate_tokens=lambda group: 1,
+                                  result_error=lambda results: results[0].error if all(not r.success for r in results) else None)
+
+    success, errors, _ = summarizer.process_batch('test-model', worker_pool=worker_pool,
+                                                  batch_pool=batch_pool, prompt_batch=2)
+
+    assert single_calls == ['B2']  # 요청 전체가 실패한 묶음은 단건으로 다시 보내지 않음
+    assert (success, errors) == (2, 2)  # B1, B2 성공 / B5, B6 실패 (점유 만료 후 재시도)
+    assert sorted(fake_db.conns[0].released) == ['B3', 'B4']
+
+
+def test_process_batch_keeps_results_in_journal_when_final_flush_fails(fake_db, monkeypatch, tmp_path):
+    journal = summarizer.journal_path_for(str(tmp_path / 'journal.jsonl'))
+    monkeypatch.setattr(summarizer, 'claim_unprocessed_bills', lambda conn, **kwargs: [bill(1), bill(2)])
+    fake_db.fail_writes = 10
+
+    def call(one, api_key):
+        if one['bill_id'] == 'B1':
+            return ok_result('B1')
+        return replace(summarizer.failed_result('t', 'b', '429 quota exceeded per day'), bill_id=one['bill_id'])
+
+    pool = GeminiWorkerPool([fast_budget()], call, estimate_tokens=lambda one: 1, workers_per_key=1)
+    success, errors, quota_exceeded = summarizer.process_batch('test-model', worker_pool=pool)
+
+    assert (success, errors, quota_exceeded) == (1, 0, True)
+    conn = fake_db.conns[0]
+    assert conn.released == ['B2']  # 저장 실패와 관계없이 호출하지 못한 의안은 점유 해제
+    assert conn.closed
+    assert fake_db.written == []
+    with open(journal, encoding='utf-8') as f:
+        assert 'B1' in f.read()
+
+
+def test_failed_flush_is_replayed_from_journal(fake_db, tmp_path):
+    journal = str(tmp_path / 'journal.jsonl')
+    fake_db.fail_writes = 1
+
+    writer = summarizer.SummaryWriter(batch_size=10, journal_path=journal)
+    writer.add(ok_result('B1'))
+    writer.add(ok_result('B2'))
+    with pytest.raises(psycopg2.OperationalError):
+        writer.flush()
+    assert fake_db.written == []
+    assert len(writer.pending) == 2  # 실패한 결과는 writer와 저널에 그대로 남음
+    writer._journal.close()  # 프로세스 종료 (close의 flush 없이)
+
+    summarizer.SummaryWriter(journal_path=journal).close()  # 다음 실행 시작 시 저널 재적용
+
+    assert [row[0] for row in fake_db.written] == ['B1', 'B2']
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_writers_sharing_a_journal_path_keep_separate_journals(fake_db, tmp_path):
+    journal = str(tmp_path / 'journal.jsonl')
+
+    first = summarizer.SummaryWriter(journal_path=journal, owner='host:1')
+    first.add(ok_result('B1'))  # 아직 저장 전 (저널에만 있음)
+
+    second = summarizer.SummaryWriter(journal_path=journal, owner='host:2')
+    assert fake_db.written == []  # 실행 중인 first의 저널은 다시 적용하지 않음
+    second.add(ok_result('B2'))
+    second.flush()  # second의 저널만 비움
+    second.close()
+
+    with open(first.journal_path, encoding='utf-8') as f:
+        assert 'B1' in f.read()
+    assert [row[0] for row in fake_db.written] == ['B2']
+
+    first._journal.close()  # first 프로세스가 저장 전에 죽음 (잠금 해제)
+    summarizer.SummaryWriter(journal_path=journal, owner='host:3').close()
+
+    assert [row[0] for row in fake_db.written] == ['B2', 'B1']
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_replay_keeps_fresh_empty_journals_of_other_owners(fake_db, tmp_path):
+    base = str(tmp_path / 'journal.jsonl')
+    fresh = summarizer.journal_path_for(base, 'host:9')
+    open(fresh, 'w').close()  # 막 시작해 아직 잠그지 않은 프로세스의 저널
+
+    summarizer.SummaryWriter(journal_path=base, owner='host:1').close()
+
+    assert [path.name for path in tmp_path.iterdir()] == [os.path.basename(fresh)]